@@ -0,0 +1,109 @@
+"""
+Benchmark: vectorized numeric, boolean, year, date/datetime and word list generators.
+
+Compares the NumPy column generators against the per-row generators they
+replaced, kept below as baselines, and reports rows/sec. "to list" also includes converting the column
+to Python objects, as done by TableBuilder before the single CSV write.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_cases.py [row_count]
+"""
+import sys
+import time
+from datetime import datetime, timedelta
+
+from pg_data_generator.cases.Address import Address
+from pg_data_generator.cases.Boolean import Boolean
+from pg_data_generator.cases.DateTime import DateTime
+from pg_data_generator.cases.Decimal import Decimal
+from pg_data_generator.cases.Int import Int
+from pg_data_generator.cases.Name import Name
+from pg_data_generator.cases.Year import Year
+from pg_data_generator.core.TableBuilder import TableBuilder
+
+
+def _column(column, column_type, length=''):
+    return {'column': column, 'type': column_type, 'constraint': '', 'length': length, 'format': ''}
+
+
+# Per-row generators the NumPy columns replaced, drawing from the case's
+# random.Random
+
+def _get_random_number_with_decimal(case, precision, scale):
+    max_value = (10 ** (precision - scale)) - 1
+    return str(round(case.random.uniform(0, max_value), scale))
+
+
+def _get_random_boolean(case):
+    return str(case.random.choice(['TRUE', 'FALSE']))
+
+
+def _get_random_year(case):
+    return str(case.random.randrange(1995, 2025))
+
+
+def _get_random_datetime_between(case, start, end, is_date_only=False):
+    delta = datetime.fromisoformat(end) - datetime.fromisoformat(start)
+    int_delta = (delta.days * 24 * 60 * 60) + delta.seconds
+    result = datetime.fromisoformat(start) + timedelta(seconds=case.random.randrange(int_delta))
+    if is_date_only:
+        return str(result).split()[0]
+    return str(result)
+
+
+def _get_random_name(case):
+    return f'{case.random.choice(Name.FIRST_NAMES)} {case.random.choice(Name.LAST_NAMES)}'
+
+
+def _get_random_address(case):
+    street_number = case.random.randint(1, 9999)
+    street_name = case.random.choice(Address.STREET_NAMES)
+    city = case.random.choice(Address.CITIES)
+    state = case.random.choice(Address.STATES)
+    zipcode = case.random.randint(10000, 99999)
+    return f"{street_number} {street_name}, {city}, {state} {zipcode}"
+
+
+CASES = [
+    ('Int', Int, _column('amount', 'int', '6'), lambda case: case._get_random_number_lt(6)),
+    ('Decimal', Decimal, _column('price', 'DECIMAL(15,2)'),
+     lambda case: _get_random_number_with_decimal(case, 15, 2)),
+    ('Boolean', Boolean, _column('is_active', 'boolean'), _get_random_boolean),
+    ('Year', Year, _column('release_year', 'int'), _get_random_year),
+    ('DateTime', DateTime, _column('created_at', 'datetime'),
+     lambda case: _get_random_datetime_between(case, '2020-01-01', '2024-12-31')),
+    ('Date', DateTime, _column('shipped_on', 'date'),
+     lambda case: _get_random_datetime_between(case, '2024-01-10', '2024-05-10', is_date_only=True)),
+    ('Name', Name, _column('customer_name', 'varchar(50)'), _get_random_name),
+    ('Address', Address, _column('address', 'varchar(100)'), _get_random_address),
+]
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def run(row_count):
+    print(f"Rows per column: {row_count}")
+    print(f"{'case':>8} {'per-row r/s':>14} {'vector r/s':>14} {'speedup':>8} {'to list':>9}")
+    print("-" * 58)
+
+    for name, case_class, column_metadata, per_row in CASES:
+        case = case_class(row_count, column_metadata)
+
+        _, loop_seconds = _timed(lambda: [per_row(case) for _ in range(row_count)])
+        values, vector_seconds = _timed(case.make_column)
+
+        builder = TableBuilder(row_count)
+        _, list_seconds = _timed(lambda: builder.add_column(column_metadata['column'], values))
+
+        print(
+            f"{name:>8} {row_count / loop_seconds:>14,.0f} {row_count / vector_seconds:>14,.0f} "
+            f"{loop_seconds / vector_seconds:>7.1f}x {list_seconds:>8.2f}s"
+        )
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 10000000)
@@ -0,0 +1,50 @@
+"""
+Benchmark: table write time as the number of columns grows.
+
+Each table is built in memory and written once, so the time per column
+should stay roughly flat as columns are added (linear growth overall).
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_csv_write.py [row_count]
+"""
+import csv
+import os
+import sys
+import tempfile
+import time
+
+from pg_data_generator.core.Csv import Csv
+from pg_data_generator.core.DataGenerator import DataGenerator
+
+COLUMN_COUNTS = [5, 10, 20, 40]
+
+
+def write_schema(path, column_count):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['table_name', 'column', 'type', 'constraint', 'length', 'format'])
+        writer.writerow(['BENCH', 'id', 'int', 'pk', '', ''])
+        for i in range(1, column_count):
+            writer.writerow(['BENCH', f'value{i}', 'int', '', '6', ''])
+
+
+def run(row_count):
+    print(f"Rows per table: {row_count}")
+    print(f"{'columns':>8} {'seconds':>10} {'sec/column':>12}")
+    print("-" * 32)
+
+    for column_count in COLUMN_COUNTS:
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            schema_path = os.path.join(tmp_dir, 'schema.csv')
+            write_schema(schema_path, column_count)
+
+            dg = DataGenerator(Csv(schema_path, output_dir=os.path.join(tmp_dir, 'out')))
+            started = time.perf_counter()
+            dg.make_csv_for_tables(row_count)
+            elapsed = time.perf_counter() - started
+
+        print(f"{column_count:>8} {elapsed:>10.3f} {elapsed / column_count:>12.4f}")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 200000)
@@ -0,0 +1,78 @@
+"""
+Benchmark: parsing a large pg_dump file.
+
+Writes a synthetic dump in pg_dump's layout: CREATE TABLE statements, COPY
+data blocks, a few multi-row INSERTs and a dollar-quoted function, with
+the keys added afterwards by ALTER TABLE. Reports MB/s and peak memory.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_ddl_parse.py [size_mb] [table_count]
+"""
+import os
+import shutil
+import sys
+import tempfile
+import time
+import tracemalloc
+
+from pg_data_generator.utils.ddl_converter import parse_ddl_file
+
+
+def write_dump(path, size_mb, table_count):
+    rows_per_block = 10_000
+    row = "{}\tcustomer name {}\tO'Brien; (x)\t2024-01-01 00:00:00\n"
+
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write("SET statement_timeout = 0;\nSELECT pg_catalog.set_config('search_path', '', false);\n\n")
+        f.write("CREATE FUNCTION public.touch() RETURNS trigger\n    LANGUAGE plpgsql\n"
+                "    AS $$ BEGIN NEW.updated_at := now(); RETURN NEW; END; $$;\n\n")
+        for t in range(table_count):
+            f.write(f'CREATE TABLE public."T{t}" (\n    id integer NOT NULL,\n    parent_id integer,\n'
+                    f"    name character varying(50) DEFAULT 'a, b'::character varying,\n"
+                    f'    created_at timestamp without time zone\n);\n\n')
+
+        block = 0
+        while f.tell() < size_mb * 2 ** 20:
+            t = block % table_count
+            f.write(f'COPY public."T{t}" (id, parent_id, name, created_at) FROM stdin;\n')
+            f.writelines(row.format(i, i) for i in range(rows_per_block))
+            f.write('\\.\n\n')
+            f.write(f'INSERT INTO public."T{t}" VALUES ' +
+                    ', '.join(f"({i}, NULL, 'x;y', NULL)" for i in range(1000)) + ';\n\n')
+            block += 1
+
+        for t in range(table_count):
+            f.write(f'ALTER TABLE ONLY public."T{t}"\n    ADD CONSTRAINT "T{t}_pkey" PRIMARY KEY (id);\n\n')
+            if t > 0:
+                f.write(f'ALTER TABLE ONLY public."T{t}"\n    ADD CONSTRAINT "T{t}_parent_fkey" '
+                        f'FOREIGN KEY (parent_id) REFERENCES public."T{t // 2}"(id);\n\n')
+
+
+def run(size_mb, table_count):
+    output_dir = tempfile.mkdtemp(prefix='pg_bench_dump_')
+    try:
+        dump_path = os.path.join(output_dir, 'dump.sql')
+        write_dump(dump_path, size_mb, table_count)
+        file_mb = os.path.getsize(dump_path) / 2 ** 20
+
+        started = time.perf_counter()
+        tables = parse_ddl_file(dump_path)
+        seconds = time.perf_counter() - started
+
+        # Traced separately, tracing slows parsing down
+        tracemalloc.start()
+        parse_ddl_file(dump_path)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        assert len(tables) == table_count
+        print(f"Dump: {file_mb:,.0f} MB, tables: {len(tables)}")
+        print(f"Parsed in {seconds:.2f}s ({file_mb / seconds:,.0f} MB/s), peak memory {peak / 2 ** 20:.1f} MiB")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    size_mb = int(sys.argv[1]) if len(sys.argv) > 1 else 200
+    table_count = int(sys.argv[2]) if len(sys.argv) > 2 else 100
+    run(size_mb, table_count)
@@ -0,0 +1,50 @@
+"""
+Benchmark: FK resolution from the in-memory key index.
+
+Registers a parent key column and draws child FK columns from it with one
+indexed draw per column, compared against the per-row random.choice over a
+list of strings that FK columns used before. Reports rows/sec and the
+memory held by the key index.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_fk.py [parent_rows] [child_rows] [fk_columns]
+"""
+import random
+import sys
+import time
+
+from pg_data_generator.core.Fk_handler import FKHandler
+
+
+def _timed(func):
+    started = time.perf_counter()
+    result = func()
+    return result, time.perf_counter() - started
+
+
+def run(parent_rows, child_rows, fk_columns):
+    handler = FKHandler([])
+    parent_keys = [str(i) for i in range(1, parent_rows + 1)]
+    _, register_seconds = _timed(lambda: handler.register_key_values('PARENT', 'id', [parent_keys]))
+    index = handler.generated_data[('PARENT', 'id')]
+
+    print(f"Parent rows: {parent_rows}, child rows: {child_rows}, FK columns: {fk_columns}")
+    print(f"Key index: {index.dtype}, {index.nbytes / 2 ** 20:.1f} MiB, registered in {register_seconds:.2f}s")
+
+    _, list_seconds = _timed(lambda: [
+        [str(random.choice(parent_keys)) for _ in range(child_rows)] for _ in range(fk_columns)
+    ])
+    _, index_seconds = _timed(lambda: [
+        handler.get_fk_values('PARENT', 'id', child_rows) for _ in range(fk_columns)
+    ])
+
+    total = child_rows * fk_columns
+    print(f"{'per-row choice':>16} {total / list_seconds:>14,.0f} r/s")
+    print(f"{'indexed draw':>16} {total / index_seconds:>14,.0f} r/s  ({list_seconds / index_seconds:.1f}x)")
+
+
+if __name__ == '__main__':
+    parent_rows = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    child_rows = int(sys.argv[2]) if len(sys.argv) > 2 else 1_000_000
+    fk_columns = int(sys.argv[3]) if len(sys.argv) > 3 else 5
+    run(parent_rows, child_rows, fk_columns)
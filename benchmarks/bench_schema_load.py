@@ -0,0 +1,57 @@
+"""
+Benchmark: loading a large schema CSV.
+
+Writes a synthetic schema of many tables (each with a PK, an FK to an
+earlier table and a few plain columns) and times Csv() loading it, plus
+a full pass over every column the way the generation plan reads them.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_schema_load.py [table_count] [columns_per_table]
+"""
+import csv
+import os
+import shutil
+import sys
+import tempfile
+import time
+
+from pg_data_generator.core.Csv import Csv
+
+
+def write_schema(path, table_count, columns_per_table):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['table_name', 'column', 'type', 'constraint', 'length', 'format'])
+        for t in range(table_count):
+            writer.writerow([f'T{t}', 'id', 'int', 'pk', '', ''])
+            if t > 0:
+                writer.writerow([f'T{t}', 'parent_id', 'int', f'fk.T{t // 2}.id', '', ''])
+            for c in range(columns_per_table):
+                writer.writerow([f'T{t}', f'value{c}', 'varchar(20)', '', '20', ''])
+
+
+def run(table_count, columns_per_table):
+    output_dir = tempfile.mkdtemp(prefix='pg_bench_schema_')
+    try:
+        schema_path = os.path.join(output_dir, 'schema.csv')
+        write_schema(schema_path, table_count, columns_per_table)
+
+        started = time.perf_counter()
+        schema = Csv(schema_path, output_dir=output_dir)
+        load_seconds = time.perf_counter() - started
+
+        started = time.perf_counter()
+        column_count = sum(len(table.columns) for table in schema.tables for _ in range(3))
+        read_seconds = time.perf_counter() - started
+
+        print(f"Tables: {len(schema.tables):,}, columns: {column_count // 3:,}")
+        print(f"{'load':>12} {load_seconds:>8.2f}s")
+        print(f"{'3x read all':>12} {read_seconds:>8.3f}s")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    table_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+    columns_per_table = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+    run(table_count, columns_per_table)
@@ -0,0 +1,51 @@
+"""
+Benchmark: table generation order on a large FK graph.
+
+Builds a synthetic schema where every table references up to three
+earlier tables and times the generation order and the dependency levels.
+
+Usage:
+    PYTHONPATH=. python benchmarks/bench_table_order.py [table_count]
+"""
+import random
+import sys
+import time
+
+from pg_data_generator.core.Fk_handler import FKHandler
+from pg_data_generator.metadata.Column import Column
+from pg_data_generator.metadata.Table import Table
+
+
+def make_tables(table_count):
+    rng = random.Random(0)
+    tables = []
+    for t in range(table_count):
+        columns = [Column('id', 'int', 'pk')]
+        for referenced in sorted(set(rng.randrange(t) for _ in range(min(t, 3)))):
+            columns.append(Column(f'ref{referenced}_id', 'int', f'fk.T{referenced}.id'))
+        tables.append(Table({'table_name': f'T{t}', 'columns': columns, 'foreign_keys': []}))
+
+    return tables
+
+
+def run(table_count):
+    tables = make_tables(table_count)
+    edge_count = sum(len(table.columns) - 1 for table in tables)
+
+    started = time.perf_counter()
+    handler = FKHandler(tables)
+    order = handler.get_table_generation_order()
+    order_seconds = time.perf_counter() - started
+
+    started = time.perf_counter()
+    levels = FKHandler(tables).get_table_generation_levels()
+    level_seconds = time.perf_counter() - started
+
+    assert len(order) == table_count
+    print(f"Tables: {table_count:,}, FK edges: {edge_count:,}, levels: {len(levels)}")
+    print(f"{'order':>8} {order_seconds:>8.3f}s")
+    print(f"{'levels':>8} {level_seconds:>8.3f}s")
+
+
+if __name__ == '__main__':
+    run(int(sys.argv[1]) if len(sys.argv) > 1 else 50_000)
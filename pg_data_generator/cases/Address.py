@@ -1,5 +1,7 @@
-import random
+import numpy as np
+
 from pg_data_generator.cases.Case import Case
+from pg_data_generator.utils.word_lists import register_word_list
 
 class Address(Case):
     # Sample addresses for generation
@@ -25,18 +27,25 @@ class Address(Case):
 
 
     def make_column(self):
-        result = list()
+        return self._get_random_addresses()
+
 
-        for _ in range(0, self.count):
-            result.append(self._get_random_address())
+    def _get_random_addresses(self):
+        rng = self.rng
+        street_numbers = rng.integers(1, 10000, size=self.count).astype(str)
+        parts = [
+            (' ', self._get_random_words('street_names', rng)),
+            (', ', self._get_random_words('cities', rng)),
+            (', ', self._get_random_words('states', rng)),
+            (' ', rng.integers(10000, 100000, size=self.count).astype(str)),
+        ]
 
-        return list(result)
+        result = street_numbers
+        for separator, values in parts:
+            result = np.char.add(np.char.add(result, separator), values)
+        return result
 
 
-    def _get_random_address(self):
-        street_number = random.randint(1, 9999)
-        street_name = random.choice(self.STREET_NAMES)
-        city = random.choice(self.CITIES)
-        state = random.choice(self.STATES)
-        zipcode = random.randint(10000, 99999)
-        return f"{street_number} {street_name}, {city}, {state} {zipcode}"
\ No newline at end of file
+register_word_list('street_names', Address.STREET_NAMES)
+register_word_list('cities', Address.CITIES)
+register_word_list('states', Address.STATES)
@@ -1,4 +1,5 @@
-import random
+import numpy as np
+
 from pg_data_generator.cases.Case import Case
 
 class Boolean(Case):
@@ -9,12 +10,10 @@ class Boolean(Case):
 
 
     def make_column(self):
-        result = list()
-        for _ in range(0, self.count):
-            result.append(self._get_random_boolean())
-
-        return result
+        return self._get_random_booleans()
 
 
-    def _get_random_boolean(self):
-        return str(random.choice(['TRUE', 'FALSE']))
+    def _get_random_booleans(self):
+        # Index into shared string objects instead of creating one per row
+        choices = np.array(['TRUE', 'FALSE'], dtype=object)
+        return choices[self.rng.integers(0, 2, size=self.count)]
@@ -2,12 +2,53 @@ from abc import abstractmethod
 import random
 import string
 
-class Case():
-    possible_pair_columns = {}
+import numpy as np
+
+from pg_data_generator.utils.permutation import Permutation
+from pg_data_generator.utils.word_lists import get_word_list
+
+
+def get_stream_rng(seed, stream=0):
+    # Philox is counter-based: a stream is fully determined by its key, so
+    # any block of rows can be generated on its own (seed=None: fresh entropy)
+    if seed is None:
+        return np.random.default_rng()
+    sequence = np.random.SeedSequence(seed[0], spawn_key=tuple(seed[1:]) + (stream,))
+    return np.random.Generator(np.random.Philox(sequence))
+
 
-    def __init__(self, count, column_metadata):
+class Case():
+    def __init__(self, count, column_metadata, start=0, total=None, params=None, seed=None, unique_key=None):
         self.count = count
         self.column_metadata = column_metadata
+        # Parameters parsed from the column metadata; a generation plan
+        # parses them once per column and passes them in for every chunk
+        self.params = params if params is not None else self.prepare(column_metadata)
+        # Index of the first row in the table; non-zero when the column is
+        # generated in chunks or shards so sequences continue across them
+        self.start = start
+        # Number of rows of the whole table
+        self.total = total if total is not None else start + count
+        # Key of this column's random streams in this block of rows, a tuple
+        # of non-negative ints (see DataGenerator.get_stream_seed); None
+        # draws fresh entropy on every run
+        self.seed = seed
+        # Keys the unique value permutations; the same for every chunk and
+        # shard of a table in a run (see DataGenerator.get_unique_key)
+        self.unique_key = unique_key
+        self._rng = None
+        self._random = None
+
+
+    @classmethod
+    def prepare(cls, column_metadata):
+        return {}
+
+
+    @classmethod
+    def get_stream_name(cls, column_metadata):
+        # Columns drawing from the same stream name get the same random values
+        return column_metadata['column']
 
 
     @abstractmethod
@@ -15,13 +56,53 @@ class Case():
         pass
 
 
+    @property
+    def rng(self):
+        # NumPy generator of the vectorized generators
+        if self._rng is None:
+            self._rng = get_stream_rng(self.seed, 0)
+        return self._rng
+
+
+    @property
+    def random(self):
+        # random.Random of the per-row generators, in place of the global
+        # random module
+        if self._random is None:
+            if self.seed is None:
+                self._random = random.Random()
+            else:
+                state = get_stream_rng(self.seed, 1).integers(0, 2 ** 64, size=4, dtype=np.uint64)
+                self._random = random.Random(int.from_bytes(state.tobytes(), 'little'))
+        return self._random
+
+
+    def _get_random_words(self, word_list_name, rng):
+        # One indexed draw from a cached word list for the whole column
+        words = get_word_list(word_list_name)
+        return words[rng.integers(0, len(words), size=self.count)]
+
+
+    def _get_unique_indexes(self, space_size):
+        # Row i of the table gets value index permutation(i), so chunks and
+        # shards of a table never repeat a value and nothing is retried
+        if self.total > space_size:
+            raise ValueError(
+                f"Cannot generate {self.total} unique values for column "
+                f"'{self.column_metadata['column']}': only {space_size} are available"
+            )
+
+        permutation = Permutation(space_size, (self.unique_key, self.column_metadata['column']))
+        return permutation.permute(range(self.start, self.start + self.count))
+
+
     def _get_column_name_lower(self):
         return self.column_metadata["column"].lower()
 
 
     def _get_random_alpha_numeric_code(self, length):
-        return ''.join(random.choice(string.ascii_uppercase + string.ascii_lowercase + string.digits) for _ in range(length))
+        return ''.join(self.random.choice(string.ascii_uppercase + string.ascii_lowercase + string.digits) for _ in range(length))
 
 
     def _get_random_alphabetic_code(self, length):
-       return ''.join(random.choice(string.ascii_letters) for x in range(length))
+       return ''.join(self.random.choice(string.ascii_letters) for x in range(length))
@@ -1,6 +1,8 @@
-import random
 from pg_data_generator.cases.Case import Case
 
+POST_CODE_MIN = 100
+POST_CODE_MAX = 99999
+
 class Code(Case):
 
     @staticmethod
@@ -11,31 +13,36 @@ class Code(Case):
         return ends_with_code or ends_with_id
 
 
+    @classmethod
+    def prepare(cls, column_metadata):
+        # Sequences need the column length, post codes do not
+        column_name = column_metadata['column'].lower()
+        if cls._is_post_code_name(column_name):
+            return {}
+        return {'length': int(column_metadata['length'])}
+
+
     def make_column(self):
         if self._is_post_code():
-            result = set()
-            while True:
-                result.add(self.get_random_post_code())
-                if len(result) == self.count:
-                    break
-            return list(result)
+            indexes = self._get_unique_indexes(POST_CODE_MAX - POST_CODE_MIN + 1)
+            return [self.get_post_code(index) for index in indexes]
 
         else:
             if self._is_id():
-                length_int = int(self.column_metadata['length'])
+                length_int = self.params['length']
 
                 result = list()
-                value = self._get_code_starting_from_digit_numbers_of_ten(length_int)
+                value = self._get_code_starting_from_digit_numbers_of_ten(length_int) + self.start
                 for _ in range(0, self.count):
                     result.append(str(value))
                     value += 1
                 return result
 
             if self._is_code():
-                length_int = int(self.column_metadata['length'])
+                length_int = self.params['length']
 
                 result = list()
-                value = 1
+                value = self.start + 1
                 for _ in range(0, self.count):
                     result.append(str(value).zfill(length_int))
                     value += 1
@@ -46,12 +53,17 @@ class Code(Case):
         return 10 ** (length - 1)
 
 
-    def get_random_post_code(self):
-        return str(random.randint(100, 99999)) 
+    def get_post_code(self, index):
+        return str(POST_CODE_MIN + index)
 
 
     def _is_post_code(self):
-        return any(keyword in self._get_column_name_lower() for keyword in ['post', 'postal', 'zip'])
+        return self._is_post_code_name(self._get_column_name_lower())
+
+
+    @staticmethod
+    def _is_post_code_name(column_name_lower):
+        return any(keyword in column_name_lower for keyword in ['post', 'postal', 'zip'])
 
 
     def _is_code(self):
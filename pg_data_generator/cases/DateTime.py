@@ -1,37 +1,45 @@
+import numpy as np
+
 from pg_data_generator.cases.Case import Case
-import random
-from datetime import timedelta, datetime
+
+SECONDS_PER_DAY = 24 * 60 * 60
 
 class DateTime(Case):
+    # 'HH:MM:SS' code points for every second of a day, built on first use
+    _time_of_day_codes = None
+    # 'YYYY-MM-DD' text of the days of each date range, by first day and
+    # day count; columns are generated block by block
+    _day_texts = {}
 
     @staticmethod
     def is_date_or_datetime(column_type):
         return column_type.lower() in ['date', 'datetime']
 
 
+    @classmethod
+    def get_stream_name(cls, column_metadata):
+        # Both columns of a start/end date pair draw from the pair's stream,
+        # so they stay row-aligned whichever is generated
+        column_name_lower = column_metadata['column'].lower()
+        if column_metadata['type'].lower() == 'date' and cls._is_date_pair(column_name_lower):
+            return cls._get_pair_name(column_name_lower)
+        return column_metadata['column']
+
+
     def make_column(self):
-        result = list()
         if self._is_datetime():
-            for _ in range(0, self.count):
-                result.append(self._get_random_datetime_between('2020-01-01', '2024-12-31'))
-            return result
+            return self._get_random_datetimes_between('2020-01-01', '2024-12-31')
 
         if self._is_date():
             if self._is_date_pair(self._get_column_name_lower()):
-                start_date = list()
-                for _ in range(0, self.count):
-                    start_date.append(self._get_random_datetime_between('2018-01-01', '2023-12-31', is_date_only=True))
+                # Start and end dates are drawn together from the pair's
+                # stream; each column keeps its half
+                start_date = self._get_random_datetimes_between('2018-01-01', '2023-12-31', is_date_only=True)
+                end_date = self._get_random_datetimes_between('2024-01-01', '2024-12-31', is_date_only=True)
 
-                end_date = list()
-                for _ in range(0, self.count):
-                    end_date.append(self._get_random_datetime_between('2024-01-01', '2024-12-31', is_date_only=True))
+                return start_date if 'start' in self._get_column_name_lower() else end_date
 
-                return self._set_possible_pair_dates_and_return(list(start_date), list(end_date))
-
-            for _ in range(0, self.count):
-                result.append(self._get_random_datetime_between('2024-01-10', '2024-05-10', is_date_only=True))
-
-            return list(result)
+            return self._get_random_datetimes_between('2024-01-10', '2024-05-10', is_date_only=True)
 
 
     def _is_datetime(self):
@@ -42,32 +50,62 @@ class DateTime(Case):
         return 'date' in self.column_metadata['type'].lower()
 
 
-    def _is_date_pair(self, column_name_lower):
+    @staticmethod
+    def _is_date_pair(column_name_lower):
         return any(x in column_name_lower for x in ['start', 'end'])
 
 
-    def _get_random_datetime_between(self, start, end, is_date_only=False):
+    @staticmethod
+    def _get_pair_name(column_name_lower):
+        # start_date and end_date are both the pair '{}_date'
+        if 'start' in column_name_lower:
+            return column_name_lower.replace('start', '{}')
+        return column_name_lower.replace('end', '{}')
+
+
+    def _get_random_datetimes_between(self, start, end, is_date_only=False):
+        # Bounds are parsed once per column and all offsets are drawn as one
+        # int64 array of seconds, counted from midnight of the start day
         try:
-            delta = datetime.fromisoformat(end) - datetime.fromisoformat(start)
+            start_datetime = np.datetime64(start, 's')
+            int_delta = int((np.datetime64(end, 's') - start_datetime) // np.timedelta64(1, 's'))
         except ValueError:
             raise ValueError("Incorrect data format, should be YYYY-MM-DD")
-        int_delta = (delta.days * 24 * 60 * 60) + delta.seconds
-        random_second = random.randrange(int_delta)
 
-        result = datetime.fromisoformat(start) + timedelta(seconds = random_second)
-        if is_date_only:
-            return str(result).split()[0]
-        return result.__str__()
+        start_day = start_datetime.astype('datetime64[D]')
+        start_offset = int((start_datetime - start_day) // np.timedelta64(1, 's'))
+        offsets = self.rng.integers(0, int_delta, size=self.count) + start_offset
+        days, seconds = np.divmod(offsets, SECONDS_PER_DAY)
 
+        # Each distinct day is formatted once through datetime64 and looked up per row
+        day_count = (start_offset + int_delta - 1) // SECONDS_PER_DAY + 1
+        day_text = self._get_day_text(start_day, day_count)
 
-    def _set_possible_pair_dates_and_return(self, start_date, end_date):
-        if 'start' in self._get_column_name_lower():
-            self.possible_pair_columns[self._get_column_name_lower()] = start_date
-            self.possible_pair_columns[self._get_column_name_lower().replace('start', 'end')] = end_date
-
-            return self.possible_pair_columns[self._get_column_name_lower()]
-        elif 'end' in self._get_column_name_lower():
-            self.possible_pair_columns[self._get_column_name_lower()] = end_date
-            self.possible_pair_columns[self._get_column_name_lower().replace('end', 'start')] = start_date
-
-            return self.possible_pair_columns[self._get_column_name_lower()]
\ No newline at end of file
+        if is_date_only:
+            return day_text.astype(object)[days]
+
+        # Datetimes are assembled as UCS4 code points: 'YYYY-MM-DD' + ' ' + 'HH:MM:SS'
+        text = np.empty((self.count, 19), dtype=np.uint32)
+        text[:, :10] = day_text.view(np.uint32).reshape(-1, 10)[days]
+        text[:, 10] = ord(' ')
+        text[:, 11:] = self._get_time_of_day_codes()[seconds]
+        return text.view('U19').ravel()
+
+
+    @classmethod
+    def _get_day_text(cls, start_day, day_count):
+        key = (str(start_day), day_count)
+        day_text = cls._day_texts.get(key)
+        if day_text is None:
+            day_text = np.datetime_as_string(start_day + np.arange(day_count), unit='D').astype('U10')
+            cls._day_texts[key] = day_text
+        return day_text
+
+
+    @classmethod
+    def _get_time_of_day_codes(cls):
+        if cls._time_of_day_codes is None:
+            seconds = np.datetime64('2000-01-01', 's') + np.arange(SECONDS_PER_DAY).astype('timedelta64[s]')
+            text = np.datetime_as_string(seconds, unit='s').astype('U19')
+            cls._time_of_day_codes = np.ascontiguousarray(text.view(np.uint32).reshape(-1, 19)[:, 11:])
+        return cls._time_of_day_codes
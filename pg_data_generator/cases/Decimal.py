@@ -8,48 +8,34 @@ class Decimal(Case):
         return 'decimal' in column_type.lower()
 
 
-    def make_column(self):
-        result = list()
+    @classmethod
+    def prepare(cls, column_metadata):
         try:
-            splitted = self._parse_decimal_type(self.column_metadata['type'])
+            splitted = cls._parse_decimal_type(column_metadata['type'])
             precision = int(splitted[0])
             scale = int(splitted[1])
         except Exception as e:
             raise ValueError(
-                f"Error parsing DECIMAL type for column '{self.column_metadata.get('column', 'unknown')}': "
-                f"type='{self.column_metadata['type']}'. {str(e)}"
+                f"Error parsing DECIMAL type for column '{column_metadata.get('column', 'unknown')}': "
+                f"type='{column_metadata['type']}'. {str(e)}"
             )
 
-        for _ in range(0, self.count):
-            result.append(self._get_random_number_with_decimal(precision, scale))
-        return result
-
-
-    def _get_random_number_with_decimal(self, precision, scale):
-        """
-        Generate a random decimal number.
+        return {'precision': precision, 'scale': scale}
 
-        Args:
-            precision: Total number of digits (e.g., 15 for DECIMAL(15,2))
-            scale: Number of digits after decimal point (e.g., 2 for DECIMAL(15,2))
-        """
-        import random
 
-        # Calculate max value based on precision and scale
-        # For DECIMAL(15,2): max integer part is 13 digits, max value is 9999999999999.99
-        max_integer_digits = precision - scale
-        max_value = (10 ** max_integer_digits) - 1
-
-        # Generate random value between 0 and max_value
-        integer_part = random.uniform(0, max_value)
+    def make_column(self):
+        return self._get_random_numbers_with_decimal(self.params['precision'], self.params['scale'])
 
-        # Round to the specified scale
-        result = round(integer_part, scale)
 
-        return str(result)
+    def _get_random_numbers_with_decimal(self, precision, scale):
+        # For DECIMAL(15,2) the integer part has up to 13 digits, so values
+        # are drawn from [0, 9999999999999] and rounded to 2 decimals
+        max_value = (10 ** (precision - scale)) - 1
+        return self.rng.uniform(0, max_value, size=self.count).round(scale)
 
 
-    def _parse_decimal_type(self, type_str):
+    @staticmethod
+    def _parse_decimal_type(type_str):
         # Strip quotes if present (CSV may quote fields with commas)
         type_str = type_str.strip('"').strip("'")
 
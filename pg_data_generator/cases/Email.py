@@ -1,6 +1,10 @@
+import numpy as np
+
 from pg_data_generator.cases.Case import Case
-import json
-import random
+from pg_data_generator.utils.word_lists import get_word_list
+
+# Usernames get a numeric suffix from 1 to 998
+SUFFIX_COUNT = 998
 
 class Email(Case):
 
@@ -10,23 +14,14 @@ class Email(Case):
 
 
     def make_column(self):
-        import os
-        # Get path relative to this file's location
-        current_dir = os.path.dirname(os.path.abspath(__file__))
-        username_file = os.path.join(current_dir, 'username.json')
-
-        with open(username_file, 'r') as file:
-            data = json.load(file)
-        
-            result = set()
-            while True:
-                index = random.randrange(0, len(data['usernames']))
-                result.add(self._make_random_gmail(data['usernames'][index]))
-                if len(result) == self.count:
-                    break
-
-            return list(result)
-
-
-    def _make_random_gmail(self, username):
-        return f'{username}{random.randrange(1, 999)}@gmail.com'
\ No newline at end of file
+        # Loaded once per process and shared by every email column
+        usernames = get_word_list('usernames')
+        indexes = self._get_unique_indexes(len(usernames) * SUFFIX_COUNT)
+
+        # Username varies fastest so any slice of the space covers all usernames
+        suffixes, username_indexes = np.divmod(np.asarray(indexes, dtype=np.int64), len(usernames))
+        return self._make_gmails(usernames[username_indexes], suffixes + 1)
+
+
+    def _make_gmails(self, usernames, suffixes):
+        return np.char.add(np.char.add(usernames, suffixes.astype(str)), '@gmail.com')
@@ -1,6 +1,8 @@
-import random
 from pg_data_generator.cases.Case import Case
 
+# Largest exclusive bound numpy can draw as int64
+INT64_BOUND = 2 ** 63
+
 class Int(Case):
 
     @staticmethod
@@ -8,9 +10,18 @@ class Int(Case):
         return column_type.lower() in ['smallint', 'int', 'bigint']
 
 
+    @classmethod
+    def prepare(cls, column_metadata):
+        return {'length': int(column_metadata['length'] or 1)}
+
+
     def make_column(self):
-        length_int = int(self.column_metadata['length'] or 1)
+        length_int = self.params['length']
 
+        if 10 ** length_int <= INT64_BOUND:
+            return self._get_random_numbers_lt(length_int)
+
+        # Too wide for int64: drawn row by row as Python ints
         result = list()
         for _ in range(0, self.count):
             result.append(self._get_random_number_lt(length_int))
@@ -18,5 +29,11 @@ class Int(Case):
         return result
 
 
+    def _get_random_numbers_lt(self, length):
+        # One draw for the whole column; the int64 array is turned into text
+        # in bulk when the table is written
+        return self.rng.integers(1, 10 ** length, size=self.count)
+
+
     def _get_random_number_lt(self, length):
-        return str(random.randrange(1, 10 ** (length)))
+        return str(self.random.randrange(1, 10 ** (length)))
@@ -1,5 +1,7 @@
-import random
+import numpy as np
+
 from pg_data_generator.cases.Case import Case
+from pg_data_generator.utils.word_lists import register_word_list
 
 class Name(Case):
     # Common first and last names for generating random names
@@ -32,19 +34,20 @@ class Name(Case):
 
     def make_column(self):
         if self._is_human_name():
-            result = list()
-            for _ in range(0, self.count):
-                result.append(self._get_random_name())
-
-            return result
+            return self._get_random_names()
 
 
-    def _get_random_name(self):
-        first_name = random.choice(self.FIRST_NAMES)
-        last_name = random.choice(self.LAST_NAMES)
-        return f'{first_name} {last_name}'
+    def _get_random_names(self):
+        rng = self.rng
+        first_names = self._get_random_words('first_names', rng)
+        last_names = self._get_random_words('last_names', rng)
+        return np.char.add(np.char.add(first_names, ' '), last_names)
 
 
     def _is_human_name(self):
         human_name_columns = ['customer_name', 'given_name', 'family_name', 'first_name', 'last_name']
         return self._get_column_name_lower() in human_name_columns
+
+
+register_word_list('first_names', Name.FIRST_NAMES)
+register_word_list('last_names', Name.LAST_NAMES)
@@ -1,4 +1,5 @@
-import random
+import numpy as np
+
 from pg_data_generator.cases.Case import Case
 
 class Optional(Case):
@@ -8,20 +9,23 @@ class Optional(Case):
         return '[' in column_format and ']' in column_format
 
 
-    def make_column(self):
-        result = list()
+    @classmethod
+    def prepare(cls, column_metadata):
+        return {'options': cls.parse_list_string(column_metadata['format'])}
 
-        options = self.parse_list_string(self.column_metadata['format'])
-        for i in range(0, self.count):
-            result.append(self._get_random_choice(options))
-        return result
-    
 
-    def _get_random_choice(self, options_list):
-        return str(random.choice(options_list))
-    
+    def make_column(self):
+        return self._get_random_choices(self.params['options'])
     
-    def parse_list_string(self, stringified_list):
+
+    def _get_random_choices(self, options_list):
+        # One indexed draw over shared option strings for the whole column
+        choices = np.array(options_list, dtype=object)
+        return choices[self.rng.integers(0, len(choices), size=self.count)]
+
+
+    @staticmethod
+    def parse_list_string(stringified_list):
         s = stringified_list.strip()
         if s.startswith('[') and s.endswith(']'):
             s = s[1:-1]
@@ -1,6 +1,7 @@
-import random
 from pg_data_generator.cases.Case import Case
 
+PHONE_PREFIXES = ['070', '080', '090']
+
 class PhoneNumber(Case):
 
     @staticmethod
@@ -9,17 +10,12 @@ class PhoneNumber(Case):
 
 
     def make_column(self):
-        result = set()
-        while True:
-            result.add(self._get_random_phone_number())
-            if len(result) == self.count:
-                break
-        return list(result)
-    
+        # Every prefix has 10^8 numbers: 4 digits for the second and third part
+        indexes = self._get_unique_indexes(len(PHONE_PREFIXES) * 10 ** 8)
+        return [self._get_phone_number(index) for index in indexes]
+
 
-    def _get_random_phone_number(self):
-        first = random.choice(['070', '080', '090'])
-        second = str(random.randint(0, 9999))
-        third = str(random.randint(0, 9999))
-        return f'{first}-{second.zfill(4)}-{third.zfill(4)}'
-    
\ No newline at end of file
+    def _get_phone_number(self, index):
+        prefix, number = divmod(index, 10 ** 8)
+        second, third = divmod(number, 10 ** 4)
+        return f'{PHONE_PREFIXES[prefix]}-{str(second).zfill(4)}-{str(third).zfill(4)}'
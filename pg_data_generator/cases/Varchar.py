@@ -1,4 +1,3 @@
-import random
 import string
 from pg_data_generator.cases.Case import Case
 
@@ -16,9 +15,13 @@ class Varchar(Case):
         column_type_lower = column_type.lower()
         return any(t in column_type_lower for t in ['varchar', 'char', 'text'])
 
+    @classmethod
+    def prepare(cls, column_metadata):
+        return {'length': int(column_metadata.get('length') or 10)}
+
     def make_column(self):
         """Generate random text strings for VARCHAR/CHAR columns."""
-        length = int(self.column_metadata.get('length') or 10)
+        length = self.params['length']
 
         result = []
         for _ in range(0, self.count):
@@ -34,7 +37,7 @@ class Varchar(Case):
         mixed case letters, numbers, and spaces.
         """
         # Vary the actual length (50-100% of max length)
-        actual_length = random.randint(max(1, max_length // 2), max(1, max_length))
+        actual_length = self.random.randint(max(1, max_length // 2), max(1, max_length))
 
         # Generate random words separated by spaces
         words = []
@@ -42,10 +45,10 @@ class Varchar(Case):
 
         while remaining_length > 0:
             # Word length between 3-8 characters
-            word_len = min(random.randint(3, 8), remaining_length)
+            word_len = min(self.random.randint(3, 8), remaining_length)
 
             # Generate random word with mixed case
-            word = ''.join(random.choices(string.ascii_letters, k=word_len))
+            word = ''.join(self.random.choices(string.ascii_letters, k=word_len))
             words.append(word)
 
             remaining_length -= word_len
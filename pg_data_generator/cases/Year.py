@@ -1,4 +1,3 @@
-import random
 from pg_data_generator.cases.Case import Case
 
 class Year(Case):
@@ -9,12 +8,8 @@ class Year(Case):
 
 
     def make_column(self):
-        result = list()
-        for i in range(0, self.count):
-            result.append(self._get_random_year())
+        return self._get_random_years()
 
-        return result
 
-
-    def _get_random_year(self):
-        return str(random.randrange(1995, 2025))
+    def _get_random_years(self):
+        return self.rng.integers(1995, 2025, size=self.count)
@@ -1,20 +1,21 @@
 import os
 from glob import glob
 import csv
-import pandas as pd
 
+from pg_data_generator.metadata.Column import Column
 from pg_data_generator.metadata.Table import Table
+from pg_data_generator.utils.compressed_io import open_input
 
 RESULT_PATH = '.'
 
 class Csv():
-    def __init__(self, csv_path, output_dir=None):
+    def __init__(self, csv_path, output_dir=None, schema_rows=None):
         self.csv_path = csv_path
+        # Schema rows (header first) given in memory, e.g. straight from
+        # parsed DDL; when set, csv_path is not read
+        self.schema_rows = schema_rows
         self.output_dir = output_dir if output_dir else RESULT_PATH
-        self.header = self._set_header()
-        self.table_names = self._set_table_names()
-        self.tables = self._set_tables(self.header, self.table_names)
-        self._set_foreign_keys(self.tables)
+        self._load_schema()
 
         # Create output directory if it doesn't exist
         if self.output_dir and not os.path.exists(self.output_dir):
@@ -23,135 +24,105 @@ class Csv():
 
     @staticmethod
     def index_of_table(tables_dict, table_name):
-        index_list = [i for i, d in enumerate(tables_dict) if d.table_name == table_name]
-        if len(index_list) == 0:
-            raise Exception('Table not found')
+        for index, table in enumerate(tables_dict):
+            if table.table_name == table_name:
+                return index
 
-        return index_list[0]
+        raise Exception('Table not found')
 
 
-    def prepare_next_file_name(self, table_name):
-        file_paths = glob(f'{self.output_dir}/*.csv')
+    def prepare_next_file_name(self, table_name, reserved_names=None, extension='.csv', existing_files=True):
+        # Without existing_files, files left in the output dir are
+        # overwritten instead of numbered around
+        file_paths = glob(f'{self.output_dir}/*{extension}') if existing_files else []
         file_names = [os.path.basename(file) for file in file_paths]
+        # Names already handed out to tables that are not written yet
+        file_names += [f'{name}{extension}' for name in reserved_names or []]
 
-        file_name = f'{table_name}.csv'
+        file_name = f'{table_name}{extension}'
         if file_name not in file_names:
             return table_name
 
         sequence = 1
-        file_name = f'{table_name}{sequence}.csv'
+        file_name = f'{table_name}{sequence}{extension}'
 
         while file_name in file_names:
             sequence += 1
-            file_name = f'{table_name}{sequence}.csv'
+            file_name = f'{table_name}{sequence}{extension}'
 
         return f'{table_name}{sequence}'
 
 
-    def write_results_to_csv(self, column_name, column_values, file_name):
-        file_path = os.path.join(self.output_dir, f'{file_name}.csv')
+    def _load_schema(self):
+        # One pass over the schema rows builds the tables (indexed by name)
+        # and their columns; FK targets are checked once every table is known
+        self.table_dict = dict()
+        foreign_keys = list()
+        header = None
 
-        try:
-            df = pd.read_csv(file_path, dtype=str)
-        except FileNotFoundError:
-            with open(file_path, mode='w', newline='') as f:
-                writer = csv.DictWriter(f, fieldnames=[column_name])
-                writer.writeheader()
+        for line in self._read_schema_rows():
+            if header is None:
+                header = self._set_header(line)
+                continue
 
-            df = pd.DataFrame(columns=[column_name])
+            table_name = line[self.table_name_index]
+            table = self.table_dict.get(table_name)
+            if table is None:
+                table = Table({'table_name': table_name, 'columns': [], 'foreign_keys': []})
+                self.table_dict[table_name] = table
 
-        df[column_name] = column_values
-
-        df.to_csv(file_path, index=False)
-
-
-    def _set_tables(self, header, table_names):
-        table_obj_list = self._make_tables_dict(table_names)
-        result = self._append_column_metadata(header, table_obj_list)
-        return result
-
-
-    def _make_tables_dict(self, table_names):
-        result = []
-        for table_name in table_names:
-            table = Table({
-                'table_name': '',
-                'columns': [],
-                'foreign_keys': []
-            })
-
-            table.table_name = table_name
-            result.append(table)
-
-        return result
-
-
-    def _append_column_metadata(self, header, table_obj_list):
-        for column in self._get_columns():
             # Note: We now include PK columns - they need to be generated
             # so that FK columns can reference them
-            table_name = ''
-            dicted_column = dict()
-            for header_item in header:
-                if header_item == 'table_name':
-                    table_name = column[header.index(header_item)]
-                else:
-                    dicted_column[header_item] = column[header.index(header_item)]
-
-            index = Csv.index_of_table(table_obj_list, table_name)
-            table_obj_list[index].append_column(dicted_column)
-
-        return table_obj_list
-
+            table.append_column(self._make_column(line))
 
-    def _get_columns(self):
-        result = []
-
-        with open(self.csv_path, 'r') as file:
-            for index, line in enumerate(csv.reader(file)):
-                if index == 0: continue
-                result.append(line)
-
-        return result
+            constraint = line[self.constraint_index]
+            if 'fk.' in constraint:
+                foreign_keys.append((table, {
+                    'column': line[self.column_name_index],
+                    'constraint': constraint
+                }))
 
+        if header is None:
+            raise Exception('No proper header found in csv file')
 
-    def _set_header(self):
-        with open(self.csv_path, 'r') as file:
-            for index, header in enumerate(csv.reader(file)):
-                if index == 0:
-                    self._check_header(header)
+        self.header = header
+        self.table_names = list(self.table_dict)
+        self.tables = list(self.table_dict.values())
+        self._set_fk_to_table(foreign_keys)
 
-                    self.table_name_index = header.index('table_name')
-                    self.column_name_index = header.index('column')
-                    self.constraint_index = header.index('constraint')
 
-                    return header
+    def _make_column(self, line):
+        extra = None
+        for index, header_item in self.extra_header_items:
+            if extra is None:
+                extra = dict()
+            extra[header_item] = line[index]
 
+        return Column(*[line[index] for index in self.field_indexes], extra=extra)
 
-    def _set_table_names(self):
-        result = set()
 
-        with open(self.csv_path, 'r') as file:
-            for index, line in enumerate(csv.reader(file)):
-                if index == 0: continue
-                result.add(line[self.table_name_index])
+    def _read_schema_rows(self):
+        if self.schema_rows is not None:
+            yield from self.schema_rows
+            return
 
-        return list(result)
+        with open_input(self.csv_path, 'r', newline='') as file:
+            yield from csv.reader(file)
 
 
-    def _set_foreign_keys(self, tables):
-        result = list()
+    def _set_header(self, header):
+        self._check_header(header)
 
-        with open(self.csv_path, 'r') as file:
-            for index, line in enumerate(csv.reader(file)):
-                if 'fk.' in line[self.constraint_index]:
-                    result.append({
-                        'table_name': line[self.table_name_index],
-                        'column': line[self.column_name_index],
-                        'constraint': line[self.constraint_index]
-                    })
+        self.table_name_index = header.index('table_name')
+        self.column_name_index = header.index('column')
+        self.constraint_index = header.index('constraint')
+        self.field_indexes = [header.index(field) for field in Column.FIELDS]
+        self.extra_header_items = [
+            (index, header_item) for index, header_item in enumerate(header)
+            if header_item != 'table_name' and header_item not in Column.FIELDS
+        ]
 
-        self._set_fk_to_table(result, tables)
+        return header
 
 
     def _check_header(self, header_candidate):
@@ -166,13 +137,11 @@ class Csv():
             raise Exception('No proper header found in csv file')
 
 
-    def _set_fk_to_table(self, fk_dicts, tables):
-        for fk_dict in fk_dicts:
-            if not self._get_fk_target_table(fk_dict) in self.table_names:
+    def _set_fk_to_table(self, foreign_keys):
+        for table, fk_dict in foreign_keys:
+            if not self._get_fk_target_table(fk_dict) in self.table_dict:
                 raise Exception('Please provide fk table in your csv file.')
 
-            table = tables[Csv.index_of_table(tables, fk_dict['table_name'])]
-            del fk_dict['table_name']
             table.append_foreign_keys(fk_dict)
 
 
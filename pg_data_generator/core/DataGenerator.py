@@ -1,145 +1,444 @@
-from pg_data_generator.cases.Optional import Optional
-from pg_data_generator.cases.Name import Name
-from pg_data_generator.cases.Address import Address
-from pg_data_generator.cases.Int import Int
-from pg_data_generator.cases.Decimal import Decimal
-from pg_data_generator.cases.Year import Year
-from pg_data_generator.cases.PhoneNumber import PhoneNumber
-from pg_data_generator.cases.DateTime import DateTime
-from pg_data_generator.cases.Code import Code
-from pg_data_generator.cases.Email import Email
-from pg_data_generator.cases.Varchar import Varchar
-from pg_data_generator.cases.Boolean import Boolean
-from pg_data_generator.cases.Etc import Etc
-
-from pg_data_generator.core.Csv import Csv
+import hashlib
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from pg_data_generator.cases.Case import get_stream_rng
+
 from pg_data_generator.core.Fk_handler import FKHandler
+from pg_data_generator.core.Plan import ColumnPlan, GenerationPlan
+from pg_data_generator.core.Sink import CsvSink
+from pg_data_generator.core.TableBuilder import TableBuilder
+from pg_data_generator.utils.word_lists import preload_word_lists
+
+# Columns are generated in blocks of this many rows, aligned to row 0 of the
+# table. Every block draws from its own random stream, so any row range is
+# generated from the few blocks around it and chunks, shards or jobs never
+# change a value.
+GENERATION_BLOCK_SIZE = 4096
 
 class DataGenerator():
-    def __init__(self, csv):
+    def __init__(self, csv, sink=None, seed=None, plan=None):
+        if seed is not None and (not isinstance(seed, int) or seed < 0):
+            raise ValueError(f'seed must be a non-negative integer, got {seed!r}')
+
         self.csv = csv
+        # Keys every random stream of this run: the unique value permutations
+        # and one stream per table, column and block (see get_stream_seed).
+        # The same seed gives the same data, however it is chunked, sharded
+        # or spread over jobs.
+        self.seed = seed if seed is not None else random.getrandbits(64)
+        # Where generated rows go; CSV files in the schema's output dir by default
+        self.sink = sink if sink is not None else CsvSink(csv.output_dir)
         self.unsupported_columns = list()
+        self.file_names = dict()
         # Initialize FK handler for enforcing foreign key relationships
-        self.fk_handler = FKHandler(csv.tables, csv.output_dir)
+        self.fk_handler = FKHandler(csv.tables)
+        # Column plans of the schema; resolved on first use unless given
+        self.plan = plan
 
 
-    def make_csv_for_tables(self, count):
-        # Get tables in correct dependency order (FK enforcement)
-        table_order = self.fk_handler.get_table_generation_order()
+    def make_csv_for_tables(self, count, chunk_size=None, jobs=1, shards=1, part_files=False):
+        if chunk_size is not None and chunk_size <= 0:
+            raise ValueError(f'chunk_size must be a positive integer, got {chunk_size}')
+        if shards <= 0:
+            raise ValueError(f'shards must be a positive integer, got {shards}')
+        jobs = jobs or os.cpu_count() or 1
+
+        # Every column is resolved to its generator before anything is written
+        plan = self.get_plan()
+        self.unsupported_columns = list(plan.unsupported_columns)
+        if len(self.unsupported_columns) > 0:
+            raise Exception(f'Unsupported columns found: {self.unsupported_columns}')
+
+        # Get tables in correct dependency order (FK enforcement). Tables in
+        # the same level do not depend on each other.
+        table_levels = self.fk_handler.get_table_generation_levels()
+        table_order = [table_name for level in table_levels for table_name in level]
         print(f"Table generation order (respecting FK dependencies): {table_order}")
 
+        file_names = self._prepare_file_names(table_order)
+        self.file_names = file_names
+        row_ranges = self._split_row_range(count, shards, chunk_size)
+
+        if jobs > 1:
+            self._make_tables_in_parallel(table_levels, file_names, count, chunk_size, row_ranges, part_files, jobs)
+        else:
+            for table_name in table_order:
+                try:
+                    print(f"Generating data for table: {table_name}")
+                    shard_key_values = list()
+                    for shard_index, row_range in enumerate(row_ranges):
+                        shard_key_values.append(self._make_data_for_table(
+                            table_name,
+                            self._get_shard_file_name(file_names[table_name], shard_index, len(row_ranges), part_files),
+                            count,
+                            chunk_size,
+                            row_range,
+                            write_header=part_files or shard_index == 0
+                        ))
+                    self._finish_table(table_name, file_names[table_name], count, shard_key_values, part_files)
+                except Exception as e:
+                    raise Exception(f"Error generating data for table '{table_name}': {str(e)}") from e
+
+
+    def get_plan(self):
+        if self.plan is None:
+            self.plan = GenerationPlan.for_schema(self.csv, self.fk_handler)
+        return self.plan
+
+
+    def _prepare_file_names(self, table_order):
+        # File names are decided up front so tables written concurrently
+        # never pick the same name
+        result = dict()
         for table_name in table_order:
-            try:
-                print(f"Generating data for table: {table_name}")
-                self._make_data_for_table(table_name, count)
-            except Exception as e:
-                raise Exception(f"Error generating data for table '{table_name}': {str(e)}") from e
+            result[table_name] = self.csv.prepare_next_file_name(
+                self.sink.get_base_file_name(table_name), set(result.values()), self.sink.extension,
+                existing_files=not self.sink.overwrites_files
+            )
+        return result
 
-        if len(self.unsupported_columns) > 0:
-            raise Exception(f'Unsupported columns found: {self.unsupported_columns}')
 
+    @staticmethod
+    def _split_row_range(count, shards, chunk_size=None):
+        # Disjoint [start, stop) row ranges, one per shard. Boundaries fall on
+        # chunk boundaries so sharding does not change how rows are chunked.
+        unit = chunk_size or 1
+        units = -(-count // unit)
+        bounds = [min(count, (units * k // shards) * unit) for k in range(shards + 1)]
 
-    def _make_data_for_table(self, table_name, count):
-        # TODO
-        # 1. make sets of each column
-        index = Csv.index_of_table(self.csv.tables, table_name)
-        original_table_name = table_name
-        table_name = self.csv.prepare_next_file_name(table_name)
+        result = [(bounds[k], bounds[k + 1]) for k in range(shards) if bounds[k] < bounds[k + 1]]
+        return result or [(0, count)]
 
-        for column_metadata in self.csv.tables[index].columns:
-            try:
-                result = self._generate_column_items(count, column_metadata)
 
-                self.csv.write_results_to_csv(
-                    column_metadata['column'],
-                    result,
-                    table_name
+    @staticmethod
+    def _get_shard_file_name(file_name, shard_index, shard_count, part_files):
+        if shard_count == 1:
+            return file_name
+        # Without part files the first shard writes the final file directly
+        # and the other shards are appended to it afterwards
+        if shard_index == 0 and not part_files:
+            return file_name
+        return f'{file_name}.part{shard_index:05d}'
+
+
+    def _finish_table(self, table_name, file_name, count, shard_key_values, part_files):
+        shard_file_names = [
+            self._get_shard_file_name(file_name, shard_index, len(shard_key_values), part_files)
+            for shard_index in range(len(shard_key_values))
+        ]
+        if part_files:
+            for shard_file_name in shard_file_names:
+                self.sink.finish_file(shard_file_name)
+        else:
+            if len(shard_file_names) > 1:
+                self.sink.merge_part_files(file_name, shard_file_names[1:])
+            self.sink.finish_file(file_name)
+
+        for column in self.fk_handler.get_referenced_columns(table_name):
+            if self.fk_handler.is_range_key(table_name, column):
+                self.fk_handler.register_key_range(table_name, column, count)
+
+        # Shards are concatenated in row order, so are their keys
+        for column in shard_key_values[0]:
+            chunks = list()
+            for key_values in shard_key_values:
+                chunks.extend(key_values[column])
+            self.fk_handler.register_key_values(table_name, column, chunks)
+
+
+    def _make_tables_in_parallel(self, table_levels, file_names, count, chunk_size, row_ranges, part_files, jobs):
+        # Loaded before the pool forks so workers share the word lists
+        preload_word_lists()
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+            for level in table_levels:
+                futures = list()
+                for table_name in level:
+                    print(f"Generating data for table: {table_name}")
+                    # Only the keys of the tables this one references are sent along
+                    parent_keys = self.fk_handler.get_key_values(
+                        self.fk_handler.get_referenced_tables(table_name)
+                    )
+                    for shard_index, row_range in enumerate(row_ranges):
+                        futures.append((table_name, executor.submit(
+                            _make_table_in_worker,
+                            self.csv,
+                            self.sink,
+                            self.seed,
+                            self.get_plan(),
+                            table_name,
+                            self._get_shard_file_name(file_names[table_name], shard_index, len(row_ranges), part_files),
+                            count,
+                            chunk_size,
+                            row_range,
+                            part_files or shard_index == 0,
+                            parent_keys
+                        )))
+
+                shard_key_values = {table_name: list() for table_name in level}
+                for table_name, future in futures:
+                    try:
+                        key_values = future.result()
+                    except Exception as e:
+                        raise Exception(f"Error generating data for table '{table_name}': {str(e)}") from e
+
+                    shard_key_values[table_name].append(key_values)
+
+                for table_name in level:
+                    self._finish_table(table_name, file_names[table_name], count, shard_key_values[table_name], part_files)
+
+
+    def _make_data_for_table(self, table_name, file_name, count, chunk_size=None, row_range=None, write_header=True):
+        column_plans = self.get_plan().get_columns(table_name)
+        # Range-backed keys are registered from the row count alone
+        referenced_columns = [
+            column for column in self.fk_handler.get_referenced_columns(table_name)
+            if not self.fk_handler.is_range_key(table_name, column)
+        ]
+        key_values = {column: [] for column in referenced_columns}
+        start, stop = row_range or (0, count)
+        self._register_self_references(table_name, count)
+        # Last generated block of each column, reused by the next chunk
+        block_cache = dict()
+
+        # Without a chunk size the whole row range is one chunk. Otherwise only
+        # chunk_size rows are held in memory and appended to the file.
+        chunk_size = chunk_size or max(stop - start, 1)
+        for chunk_start in range(start, max(stop, start + 1), chunk_size):
+            chunk_count = min(chunk_size, stop - chunk_start)
+
+            # Build every column of the chunk in memory and write it once
+            table_builder = self._build_rows(table_name, column_plans, chunk_start, chunk_start + chunk_count, count,
+                                             block_cache)
+
+            first_chunk = chunk_start == start
+            self.sink.write_table(
+                table_builder, table_name, file_name, append=not first_chunk, header=first_chunk and write_header
+            )
+
+            # Referenced columns are kept as one compact key array per chunk
+            for column in referenced_columns:
+                if column in table_builder.columns:
+                    key_values[column].append(FKHandler.to_key_array(table_builder.columns[column]))
+
+        self.sink.close_file(file_name)
+        return key_values
+
+
+    def _register_self_references(self, table_name, count):
+        # A table referencing itself samples keys of its own rows before they
+        # are all generated: PKs from their range, other columns from the
+        # rows the FK values point to
+        if table_name not in self.fk_handler.get_self_referencing_tables():
+            return
+
+        for column in self.fk_handler.get_referenced_columns(table_name):
+            if self.fk_handler.is_range_key(table_name, column):
+                self.fk_handler.register_key_range(table_name, column, count)
+            else:
+                self.fk_handler.generated_data[(table_name, column)] = _RowAddressableKeys(
+                    self, table_name, self._get_column_plan(table_name, column), count
                 )
+
+
+    def _get_column_plan(self, table_name, column_name):
+        return next(
+            column_plan for column_plan in self.get_plan().get_columns(table_name)
+            if column_plan.column_name == column_name
+        )
+
+
+    def generate_rows(self, table_name, start, stop, count):
+        """
+        Build rows [start, stop) of a table, as make_csv_for_tables(count)
+        with the same seed generates them, without generating other rows.
+
+        Only the blocks of rows holding the range are generated. FK values
+        are looked up in the rows of the parent they sample, which are
+        generated the same way, so they exist in the full parent.
+        """
+        if table_name not in self.csv.table_dict:
+            raise ValueError(f"Table '{table_name}' not found in schema")
+        if not 0 <= start <= stop <= count:
+            raise ValueError(f'Row range [{start}, {stop}) is not within the {count} rows of {table_name}')
+
+        plan = self.get_plan()
+        if len(plan.unsupported_columns) > 0:
+            raise Exception(f'Unsupported columns found: {plan.unsupported_columns}')
+
+        # Parent keys are generated on demand, at the rows FK values sample
+        for parent_name in self.csv.table_names:
+            for column in self.fk_handler.get_referenced_columns(parent_name):
+                if self.fk_handler.is_range_key(parent_name, column):
+                    self.fk_handler.register_key_range(parent_name, column, count)
+                else:
+                    self.fk_handler.generated_data[(parent_name, column)] = _RowAddressableKeys(
+                        self, parent_name, self._get_column_plan(parent_name, column), count
+                    )
+
+        return self._build_rows(table_name, plan.get_columns(table_name), start, stop, count)
+
+
+    def get_stream_seed(self, table_name, stream_name, block_index):
+        # Each column of each block of rows draws from its own stream, keyed
+        # by names and the block's position rather than by the order or
+        # process in which rows are generated
+        return (self.seed, _name_key(table_name), _name_key(stream_name), block_index)
+
+
+    def get_unique_key(self, table_name):
+        # Keys the unique value permutations of a table's columns, so every
+        # chunk and shard of the table in a run agrees on them
+        return (self.seed, table_name)
+
+
+    def _build_rows(self, table_name, column_plans, start, stop, total, block_cache=None):
+        table_builder = TableBuilder(stop - start)
+        for column_plan in column_plans:
+            try:
+                result = self._generate_column_range(table_name, column_plan, start, stop, total, block_cache)
+                table_builder.add_column(column_plan.column_name, result)
             except Exception as e:
                 raise Exception(
-                    f"Error generating column '{column_metadata['column']}' "
-                    f"(type: {column_metadata.get('type', 'unknown')}): {str(e)}"
+                    f"Error generating column '{column_plan.column_name}' "
+                    f"(type: {column_plan.column_metadata.get('type', 'unknown')}): {str(e)}"
                 ) from e
+        return table_builder
+
+
+    def _generate_column_range(self, table_name, column_plan, start, stop, total, block_cache=None):
+        # Values of rows [start, stop), cut from the blocks holding them
+        if stop <= start:
+            return []
+
+        parts = list()
+        for block_index in range(start // GENERATION_BLOCK_SIZE, (stop - 1) // GENERATION_BLOCK_SIZE + 1):
+            block_start = block_index * GENERATION_BLOCK_SIZE
+            part = slice(max(start, block_start) - block_start, min(stop - block_start, GENERATION_BLOCK_SIZE))
+            cached = block_cache.get(column_plan.column_name) if block_cache is not None else None
+            if cached is not None and cached[0] == block_index:
+                values = cached[1]
+            elif block_cache is not None:
+                values = self._generate_column_block(table_name, column_plan, block_index, total)
+                block_cache[column_plan.column_name] = (block_index, values)
+            else:
+                # Nothing reuses the block, so only the rows asked for are built
+                values = self._generate_column_block(table_name, column_plan, block_index, total, part)
+                part = slice(None)
+
+            # Cases that cannot produce values do so for every block
+            if values is None:
+                return None
+
+            parts.append(values[part])
 
-        #   a. check format (options, code, hankaku, email? and more)
-        #   b. consider length + type
-        #   c. check constraint (unique=true, pk=true)
-        #   d. use random function (+ set)
-        # 2. combine list(set) of columns to make rows
-        # 3. decide how to deal with FK situation!!!!
-        # >> after making up all the columns and then give correction
-        # >> when insert, consider the order of tables referring and referred
-        # 4. export result to csv file
-
-
-    def _generate_column_items(self, count, column_metadata):
-        # Check if this is a PK column - if so, generate sequential unique integers
-        constraint = column_metadata.get('constraint', '')
-        if constraint == 'pk':
-            # Generate sequential integers starting from 1
-            return [str(i) for i in range(1, count + 1)]
-
-        # Check if this is a FK column - if so, get values from referenced table
-        if self.fk_handler.is_fk_column(column_metadata):
+        if len(parts) == 1:
+            return parts[0]
+        if all(isinstance(part, np.ndarray) for part in parts):
+            return np.concatenate(parts)
+        return [value for part in parts for value in part]
+
+
+    def _generate_column_block(self, table_name, column_plan, block_index, total, part=None):
+        # part: the rows of the block to return, all of them by default. The
+        # block's stream is drawn in full either way, but FK values are only
+        # looked up in the parent for the rows returned.
+        block_start = block_index * GENERATION_BLOCK_SIZE
+        block_count = min(GENERATION_BLOCK_SIZE, total - block_start)
+        seed = self.get_stream_seed(table_name, column_plan.stream_name, block_index)
+        return self._generate_column_items(block_count, column_plan, block_start, total, seed,
+                                           self.get_unique_key(table_name), part)
+
+
+    def _generate_column_items(self, count, column_plan, start=0, total=None, seed=None, unique_key=None, part=None):
+        if column_plan.kind == ColumnPlan.PK:
+            # Generate sequential integers starting from 1, continuing from
+            # the rows of previous chunks
+            rows = range(start + 1, start + count + 1)
+            return [str(i) for i in (rows[part] if part is not None else rows)]
+
+        if column_plan.kind == ColumnPlan.FK:
             try:
-                referenced_table, referenced_column = self.fk_handler.parse_fk_constraint(constraint)
-                return self.fk_handler.get_fk_values(referenced_table, referenced_column, count)
+                return self.fk_handler.get_fk_values(
+                    column_plan.referenced_table, column_plan.referenced_column, count, get_stream_rng(seed), part
+                )
             except Exception as e:
                 raise Exception(
-                    f"FK constraint error for column '{column_metadata['column']}' "
-                    f"(constraint: {constraint}): {str(e)}"
+                    f"FK constraint error for column '{column_plan.column_name}' "
+                    f"(constraint: {column_plan.column_metadata['constraint']}): {str(e)}"
                 )
 
-        if Optional.has_optional_choice(column_metadata['format']):
-            result = Optional(count, column_metadata)
-            return result.make_column()
+        if column_plan.kind == ColumnPlan.CASE:
+            result = column_plan.case_class(count, column_plan.column_metadata, start, total, column_plan.params,
+                                            seed, unique_key)
+            values = result.make_column()
+            return values[part] if part is not None and values is not None else values
+
+        # Unsupported columns are reported by the plan before generation
+
 
-        if Name.is_name(column_metadata['column']):
-            result = Name(count, column_metadata)
-            return result.make_column()
+class _RowAddressableKeys():
+    # Stands in for the key array of a parent column that was not generated:
+    # indexing it generates the parent's values at those rows
+    def __init__(self, generator, table_name, column_plan, count):
+        self.generator = generator
+        self.table_name = table_name
+        self.column_plan = column_plan
+        self.count = count
+        # Key arrays of the parent blocks generated so far. FK draws spread
+        # over the whole parent, so every chunk hits most blocks again; each
+        # is generated once and holds no more than the parent's key index.
+        self.blocks = dict()
 
-        if Email.is_email(column_metadata['column']):
-            result = Email(count, column_metadata)
-            return result.make_column()
 
-        if Address.is_address(column_metadata['column']):
-            result = Address(count, column_metadata)
-            return result.make_column()
+    def __len__(self):
+        return self.count
 
-        if DateTime.is_date_or_datetime(column_metadata['type']):
-            result = DateTime(count, column_metadata)
-            return result.make_column()
 
-        if Boolean.is_boolean(column_metadata['type']):
-            result = Boolean(count, column_metadata)
-            return result.make_column()
+    def __getitem__(self, indexes):
+        indexes = np.asarray(indexes, dtype=np.int64)
+        result = np.empty(len(indexes), dtype=object)
+        block_indexes = indexes // GENERATION_BLOCK_SIZE
+        # Sorting groups the rows of each block in one pass
+        order = np.argsort(block_indexes, kind='stable')
+        sorted_blocks = block_indexes[order]
+        bounds = np.flatnonzero(np.diff(sorted_blocks)) + 1
+        for rows in np.split(order, bounds):
+            if len(rows) == 0:
+                continue
+            block_index = int(block_indexes[rows[0]])
+            result[rows] = self._get_block(block_index)[indexes[rows] - block_index * GENERATION_BLOCK_SIZE]
+        return FKHandler.to_key_array(result)
 
-        if PhoneNumber.is_phone_number(column_metadata['column']):
-            result = PhoneNumber(count, column_metadata)
-            return result.make_column()
 
-        if Year.is_year(column_metadata['column']):
-            result = Year(count, column_metadata)
-            return result.make_column()
+    def _get_block(self, block_index):
+        keys = self.blocks.get(block_index)
+        if keys is None:
+            values = self.generator._generate_column_block(self.table_name, self.column_plan, block_index, self.count)
+            keys = FKHandler.to_key_array(values)
+            self.blocks[block_index] = keys
+        return keys
 
-        if Int.is_int(column_metadata['type']):
-            result = Int(count, column_metadata)
-            return result.make_column()
 
-        if Decimal.is_decimal(column_metadata['type']):
-            result = Decimal(count, column_metadata)
-            return result.make_column()
+def _name_key(name):
+    # Stable across processes and runs, unlike hash()
+    return int.from_bytes(hashlib.sha256(name.encode('utf-8')).digest()[:8], 'little')
 
-        if Code.is_code(column_metadata['column']):
-            result = Code(count, column_metadata)
-            return result.make_column()
 
-        if Varchar.is_varchar(column_metadata['type']):
-            result = Varchar(count, column_metadata)
-            return result.make_column()
+def _init_worker():
+    # No-op for forked workers; spawned workers load the lists once here
+    preload_word_lists()
 
-        if Etc.is_etc(column_metadata['column']):
-            result = Etc(count, column_metadata)
-            return result.make_column()
 
-        self.unsupported_columns.append(column_metadata['column'])
+def _make_table_in_worker(csv, sink, seed, plan, table_name, file_name, count, chunk_size, row_range, write_header,
+                          parent_keys):
+    dg = DataGenerator(csv, sink, seed, plan)
+    dg.fk_handler.generated_data.update(parent_keys)
+    try:
+        return dg._make_data_for_table(table_name, file_name, count, chunk_size, row_range, write_header)
+    finally:
+        # Workers outlive their tasks; nothing they opened is left behind
+        sink.close()
@@ -1,99 +1,215 @@
-from typing import List, Dict, Set, Optional
-import pandas as pd
-import os
+import heapq
+from typing import List, Dict, Optional, Set, Sequence, Tuple
+import numpy as np
 
 
 class FKHandler:
-    def __init__(self, tables: List, output_dir: str):
+    def __init__(self, tables: List):
         self.tables = tables
-        self.output_dir = output_dir
         self.table_dict = {table.table_name: table for table in tables}
-        self.generated_data = {}  # Cache of generated table data
+        # Key index: generated values of referenced columns by (table, column).
+        # Sequential PKs are kept as range(1, count + 1), other keys as int64
+        # arrays for integer keys and str arrays otherwise
+        self.generated_data = {}
+        self._dependencies = None
+        self._referenced_columns = None
+        self._self_referencing_tables = None
 
     def get_table_generation_order(self) -> List[str]:
-        # Build dependency graph
-        dependencies = {}  # table_name -> set of tables it depends on
+        return self._sort_tables()[0]
 
-        for table in self.tables:
-            table_name = table.table_name
-            dependencies[table_name] = set()
+    def get_table_generation_levels(self) -> List[List[str]]:
+        # Tables in the same level only depend on tables of earlier levels,
+        # so every table within a level can be generated concurrently
+        order, levels = self._sort_tables()
 
-            for column in table.columns:
-                constraint = column.get('constraint', '')
-                if constraint.startswith('fk.'):
-                    parts = constraint.split('.')
-                    if len(parts) >= 2:
-                        referenced_table = parts[1]
-                        if referenced_table != table_name:  # Not self-reference
-                            dependencies[table_name].add(referenced_table)
+        result = [[] for _ in range(max(levels.values(), default=-1) + 1)]
+        for table_name in order:
+            result[levels[table_name]].append(table_name)
 
-        in_degree = {table: len(dependencies[table]) for table in dependencies}
+        return result
 
-        queue = [table for table, degree in in_degree.items() if degree == 0]
+    def _sort_tables(self) -> Tuple[List[str], Dict[str, int]]:
+        # Kahn's algorithm over adjacency lists: every table and FK edge is
+        # visited once. Tables are numbered in name order and ready tables
+        # kept in a heap, so the order is the lexicographically smallest
+        # one, as before. A table's level is one past the deepest table it
+        # depends on.
+        dependencies = self._get_dependencies()
+        table_names = sorted(dependencies)
+        table_ids = {table_name: table_id for table_id, table_name in enumerate(table_names)}
+        dependents = [[] for _ in table_names]
+        in_degree = [0] * len(table_names)
+
+        for table_id, table_name in enumerate(table_names):
+            referenced_tables = dependencies[table_name]
+            in_degree[table_id] = len(referenced_tables)
+            for referenced_table in referenced_tables:
+                referenced_id = table_ids.get(referenced_table)
+                if referenced_id is not None:
+                    dependents[referenced_id].append(table_id)
+
+        # Already sorted, so already a heap
+        queue = [table_id for table_id, degree in enumerate(in_degree) if degree == 0]
+        levels = [0] * len(table_names)
         result = []
 
         while queue:
-            queue.sort()
-            current_table = queue.pop(0)
-            result.append(current_table)
-
-            for table in dependencies:
-                if current_table in dependencies[table]:
-                    in_degree[table] -= 1
-                    if in_degree[table] == 0:
-                        queue.append(table)
-
-        if len(result) != len(dependencies):
-            missing = set(dependencies.keys()) - set(result)
+            current_id = heapq.heappop(queue)
+            result.append(current_id)
+            next_level = levels[current_id] + 1
+
+            for table_id in dependents[current_id]:
+                if levels[table_id] < next_level:
+                    levels[table_id] = next_level
+                in_degree[table_id] -= 1
+                if in_degree[table_id] == 0:
+                    heapq.heappush(queue, table_id)
+
+        if len(result) != len(table_names):
+            missing = set(table_names) - {table_names[table_id] for table_id in result}
             raise Exception(
                 f"Circular dependency detected among tables: {missing}. "
                 "Cannot generate data with circular foreign key references."
             )
 
-        return result
+        return (
+            [table_names[table_id] for table_id in result],
+            {table_names[table_id]: levels[table_id] for table_id in result}
+        )
 
-    def get_fk_values(self, referenced_table: str, referenced_column: str, count: int) -> List[str]:
-        import random
+    def _get_dependencies(self) -> Dict[str, Set[str]]:
+        # Tables do not change once loaded, so the graph is built once
+        if self._dependencies is not None:
+            return self._dependencies
 
-        if referenced_table not in self.generated_data:
-            csv_path = self._find_table_csv(referenced_table)
-            if not csv_path:
-                raise Exception(
-                    f"Cannot find generated data for referenced table '{referenced_table}'. "
-                    f"Ensure tables are generated in dependency order."
-                )
+        dependencies = {}  # table_name -> set of tables it depends on
+        referenced_columns = {}  # table_name -> its columns that FKs point to
+        self_referencing_tables = set()
 
-            df = pd.read_csv(csv_path, dtype=str)
-            self.generated_data[referenced_table] = df
+        for table in self.tables:
+            table_name = table.table_name
+            dependencies[table_name] = set()
 
-        df = self.generated_data[referenced_table]
-        if referenced_column not in df.columns:
+            for column in table.columns:
+                constraint = column.get('constraint', '')
+                if constraint.startswith('fk.'):
+                    parts = constraint.split('.')
+                    if len(parts) >= 2:
+                        referenced_table = parts[1]
+                        if referenced_table != table_name:  # Not self-reference
+                            dependencies[table_name].add(referenced_table)
+                        else:
+                            self_referencing_tables.add(table_name)
+                    if len(parts) >= 3:
+                        columns = referenced_columns.setdefault(parts[1], [])
+                        if parts[2] not in columns:
+                            columns.append(parts[2])
+
+        self._dependencies = dependencies
+        self._referenced_columns = referenced_columns
+        self._self_referencing_tables = self_referencing_tables
+        return dependencies
+
+    def get_referenced_tables(self, table_name: str) -> List[str]:
+        return sorted(self._get_dependencies().get(table_name, set()))
+
+    def get_self_referencing_tables(self) -> Set[str]:
+        # Tables with FKs to their own columns (e.g. EMP.manager_ref -> EMP.id)
+        self._get_dependencies()
+        return set(self._self_referencing_tables)
+
+    def get_referenced_columns(self, table_name: str) -> List[str]:
+        # Columns of table_name that other tables point to through FKs
+        self._get_dependencies()
+        return list(self._referenced_columns.get(table_name, []))
+
+    @staticmethod
+    def to_key_array(values: Sequence) -> np.ndarray:
+        # Keys are stored as compact typed arrays. Text that spells plain
+        # integers (like generated PKs) is stored as int64; anything else,
+        # e.g. zero-padded codes, keeps its exact text. Empty keys are kept
+        # so key i is the one of parent row i; FK values sampling them are
+        # NULL, as no row can reference them.
+        array = np.asarray(values)
+        if array.dtype.kind in 'iu':
+            return array.astype(np.int64)
+
+        array = array.astype(str)
+        if array.dtype.kind == 'U' and array.size > 0:
+            try:
+                integers = array.astype(np.int64)
+            except (ValueError, OverflowError):
+                return array
+            if (integers.astype(str) == array).all():
+                return integers
+
+        return array
+
+    def register_key_values(self, table_name: str, column_name: str, chunks: List[Sequence]) -> None:
+        # Keys are registered once the parent table is generated, one array
+        # per chunk in row order, so child tables (and child workers) sample
+        # from memory without reading the parent's output
+        arrays = [self.to_key_array(chunk) for chunk in chunks]
+        if len({array.dtype.kind for array in arrays}) > 1:
+            arrays = [array.astype(str) for array in arrays]
+
+        self.generated_data[(table_name, column_name)] = (
+            np.concatenate(arrays) if arrays else np.array([], dtype=np.int64)
+        )
+
+    def is_range_key(self, table_name: str, column_name: str) -> bool:
+        # PK columns are generated as the contiguous sequence 1..count, in
+        # chunked and sharded runs alike
+        table = self.table_dict.get(table_name)
+        if table is None:
+            return False
+
+        return any(
+            column['column'] == column_name and column.get('constraint', '') == 'pk'
+            for column in table.columns
+        )
+
+    def register_key_range(self, table_name: str, column_name: str, count: int) -> None:
+        self.generated_data[(table_name, column_name)] = range(1, count + 1)
+
+    def get_key_values(self, table_names: List[str]) -> Dict:
+        return {
+            key: values for key, values in self.generated_data.items()
+            if key[0] in table_names
+        }
+
+    def get_fk_values(self, referenced_table: str, referenced_column: str, count: int,
+                      rng: np.random.Generator = None, part: slice = None) -> np.ndarray:
+        # part: the draws to look up, all of them by default. All count rows
+        # are drawn either way, so a part holds the same values as the whole.
+        cache_key = (referenced_table, referenced_column)
+        if cache_key not in self.generated_data:
             raise Exception(
-                f"Referenced column '{referenced_column}' not found in table '{referenced_table}'"
+                f"Cannot find generated data for referenced table '{referenced_table}'. "
+                f"Ensure tables are generated in dependency order."
             )
 
-        available_values = df[referenced_column].dropna().tolist()
+        available_values = self.generated_data[cache_key]
 
-        if not available_values:
+        if len(available_values) == 0:
             raise Exception(
                 f"No values available in {referenced_table}.{referenced_column} for FK reference"
             )
 
-        return [str(random.choice(available_values)) for _ in range(count)]
-
-    def _find_table_csv(self, table_name: str) -> Optional[str]:
-        # Try exact match first
-        csv_path = os.path.join(self.output_dir, f"{table_name}.csv")
-        if os.path.exists(csv_path):
-            return csv_path
+        if rng is None:
+            rng = np.random.default_rng()
+        # Parent rows are drawn the same way for every key, so columns of a
+        # composite key drawing from the same stream pick the same rows
+        rows = rng.integers(0, len(available_values), size=count)
+        if part is not None:
+            rows = rows[part]
+        # Range-backed keys are computed directly, without materializing the parent
+        if isinstance(available_values, range):
+            return available_values.start + rows
 
-        # Try with numeric suffix (table1.csv, table2.csv, etc.)
-        for i in range(1, 100):
-            csv_path = os.path.join(self.output_dir, f"{table_name}{i}.csv")
-            if os.path.exists(csv_path):
-                return csv_path
-
-        return None
+        # One indexed draw for the whole column
+        return available_values[rows]
 
     def is_fk_column(self, column_metadata: Dict) -> bool:
         constraint = column_metadata.get('constraint', '')
@@ -106,4 +222,9 @@ class FKHandler:
 
         referenced_table = parts[1]
         referenced_column = parts[2]
-        return referenced_table, referenced_column
\ No newline at end of file
+        return referenced_table, referenced_column
+
+    def parse_fk_key(self, constraint: str) -> Optional[str]:
+        # Columns of a composite FK name their key: fk.TABLE.column.KEY
+        parts = constraint.split('.')
+        return parts[3] if len(parts) >= 4 and parts[3] else None
\ No newline at end of file
@@ -0,0 +1,145 @@
+import weakref
+
+from pg_data_generator.cases.Optional import Optional
+from pg_data_generator.cases.Name import Name
+from pg_data_generator.cases.Address import Address
+from pg_data_generator.cases.Int import Int
+from pg_data_generator.cases.Decimal import Decimal
+from pg_data_generator.cases.Year import Year
+from pg_data_generator.cases.PhoneNumber import PhoneNumber
+from pg_data_generator.cases.DateTime import DateTime
+from pg_data_generator.cases.Code import Code
+from pg_data_generator.cases.Email import Email
+from pg_data_generator.cases.Varchar import Varchar
+from pg_data_generator.cases.Boolean import Boolean
+from pg_data_generator.cases.Etc import Etc
+
+# Checked in order, the first match generates the column
+CASE_RULES = [
+    (Optional, lambda column: Optional.has_optional_choice(column['format'])),
+    (Name, lambda column: Name.is_name(column['column'])),
+    (Email, lambda column: Email.is_email(column['column'])),
+    (Address, lambda column: Address.is_address(column['column'])),
+    (DateTime, lambda column: DateTime.is_date_or_datetime(column['type'])),
+    (Boolean, lambda column: Boolean.is_boolean(column['type'])),
+    (PhoneNumber, lambda column: PhoneNumber.is_phone_number(column['column'])),
+    (Year, lambda column: Year.is_year(column['column'])),
+    (Int, lambda column: Int.is_int(column['type'])),
+    (Decimal, lambda column: Decimal.is_decimal(column['type'])),
+    (Code, lambda column: Code.is_code(column['column'])),
+    (Varchar, lambda column: Varchar.is_varchar(column['type'])),
+    (Etc, lambda column: Etc.is_etc(column['column'])),
+]
+
+
+class ColumnPlan():
+    """How one column is generated: its kind, and for cases the class and parsed parameters."""
+    __slots__ = ('column_metadata', 'kind', 'case_class', 'params', 'referenced_table', 'referenced_column',
+                 'fk_key', 'stream_name')
+
+    PK = 'pk'
+    FK = 'fk'
+    CASE = 'case'
+    UNSUPPORTED = 'unsupported'
+
+    def __init__(self, column_metadata, kind, case_class=None, params=None,
+                 referenced_table=None, referenced_column=None, fk_key=None):
+        self.column_metadata = column_metadata
+        self.kind = kind
+        self.case_class = case_class
+        self.params = params
+        self.referenced_table = referenced_table
+        self.referenced_column = referenced_column
+        # Name shared by the columns of a composite FK
+        self.fk_key = fk_key
+        # Names the column's random streams (see DataGenerator.get_stream_seed).
+        # Columns of a composite FK share one, so they sample the same parent rows.
+        if case_class:
+            self.stream_name = case_class.get_stream_name(column_metadata)
+        elif fk_key:
+            self.stream_name = f'fk.{referenced_table}.{fk_key}'
+        else:
+            self.stream_name = column_metadata['column']
+
+
+    @property
+    def column_name(self):
+        return self.column_metadata['column']
+
+
+class GenerationPlan():
+    """
+    Column plans of every table, resolved once per schema.
+
+    Plans are cached by schema object, so data generators of the same
+    schema share one, for as long as the schema is alive. Pool workers are
+    handed the plan along with the schema rather than planning again.
+    """
+    _cache = weakref.WeakKeyDictionary()
+
+    def __init__(self, tables, fk_handler):
+        self.columns = dict()
+        self.unsupported_columns = list()
+
+        for table in tables:
+            column_plans = list()
+            fk_key_tables = dict()
+            for column_metadata in table.columns:
+                try:
+                    column_plan = self._plan_column(column_metadata, fk_handler)
+                except Exception as e:
+                    raise Exception(
+                        f"Error planning column '{column_metadata['column']}' of table '{table.table_name}' "
+                        f"(type: {column_metadata.get('type', 'unknown')}): {str(e)}"
+                    ) from e
+
+                if column_plan.fk_key:
+                    self._check_fk_key(table.table_name, column_plan, fk_key_tables)
+                if column_plan.kind == ColumnPlan.UNSUPPORTED and column_plan.column_name not in self.unsupported_columns:
+                    self.unsupported_columns.append(column_plan.column_name)
+                column_plans.append(column_plan)
+
+            self.columns[table.table_name] = column_plans
+
+
+    @classmethod
+    def for_schema(cls, csv, fk_handler):
+        plan = cls._cache.get(csv)
+        if plan is None:
+            plan = cls(csv.tables, fk_handler)
+            cls._cache[csv] = plan
+        return plan
+
+
+    def get_columns(self, table_name):
+        return self.columns[table_name]
+
+
+    @staticmethod
+    def _check_fk_key(table_name, column_plan, fk_key_tables):
+        # A composite key points to one parent row, so one table
+        referenced_table = fk_key_tables.setdefault(column_plan.fk_key, column_plan.referenced_table)
+        if referenced_table != column_plan.referenced_table:
+            raise ValueError(
+                f"Composite foreign key '{column_plan.fk_key}' of table '{table_name}' references both "
+                f"'{referenced_table}' and '{column_plan.referenced_table}'"
+            )
+
+
+    @staticmethod
+    def _plan_column(column_metadata, fk_handler):
+        constraint = column_metadata.get('constraint', '')
+        if constraint == 'pk':
+            return ColumnPlan(column_metadata, ColumnPlan.PK)
+
+        if fk_handler.is_fk_column(column_metadata):
+            referenced_table, referenced_column = fk_handler.parse_fk_constraint(constraint)
+            return ColumnPlan(column_metadata, ColumnPlan.FK,
+                              referenced_table=referenced_table, referenced_column=referenced_column,
+                              fk_key=fk_handler.parse_fk_key(constraint))
+
+        for case_class, matches in CASE_RULES:
+            if matches(column_metadata):
+                return ColumnPlan(column_metadata, ColumnPlan.CASE, case_class, case_class.prepare(column_metadata))
+
+        return ColumnPlan(column_metadata, ColumnPlan.UNSUPPORTED)
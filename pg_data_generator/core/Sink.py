@@ -0,0 +1,404 @@
+import csv
+import io
+import os
+import re
+import shutil
+import uuid
+from abc import abstractmethod
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # only needed for ParquetSink
+    pa = None
+    pq = None
+
+from pg_data_generator.utils.compressed_io import get_compression_extension, open_output
+from pg_data_generator.utils.dml_converter import (
+    _to_snake_case,
+    describe_output_format,
+    get_output_extension,
+    open_output_file,
+    write_copy_header,
+    write_copy_trailer,
+    write_rows
+)
+from pg_data_generator.utils.pgcopy import BINARY_HEADER, BINARY_TRAILER, copy_statement
+
+# PostgresSink connections by sink and process: sinks are pickled into
+# workers, connections are not, and a forked worker never touches its parent's
+_connections = dict()
+
+
+class Sink():
+    """
+    Destination for the rows DataGenerator produces.
+
+    Each table is handed over chunk by chunk through write_table; the first
+    chunk of a file is written with append=False and close_file is called
+    by the same process after the last one. Once a file is complete (after
+    part files were merged) finish_file is called for it. Sinks are pickled
+    into worker processes, so they should only hold configuration; close
+    releases what a process opened, after each worker task and at the end
+    of a run.
+    """
+    extension = ''
+    # Whether files of an earlier run are overwritten rather than kept
+    # next to numbered new ones
+    overwrites_files = False
+
+    def __init__(self, output_dir):
+        self.output_dir = output_dir
+
+
+    def get_file_path(self, file_name):
+        return os.path.join(self.output_dir, f'{file_name}{self.extension}')
+
+
+    def get_base_file_name(self, table_name):
+        # File name of a table before Csv.prepare_next_file_name makes it unique
+        return table_name
+
+
+    @abstractmethod
+    def write_table(self, table_builder, table_name, file_name, append=False, header=None):
+        pass
+
+
+    def merge_part_files(self, file_name, part_file_names):
+        # Part files are written without a header, so they are appended to
+        # the first part byte for byte (compressed parts too: gzip members
+        # and zstd/lz4 frames decompress as one stream when concatenated)
+        with open(self.get_file_path(file_name), mode='ab') as f:
+            for part_file_name in part_file_names:
+                part_path = self.get_file_path(part_file_name)
+                with open(part_path, mode='rb') as part:
+                    shutil.copyfileobj(part, f)
+                os.remove(part_path)
+
+
+    def close_file(self, file_name):
+        pass
+
+
+    def finish_file(self, file_name):
+        pass
+
+
+    def close(self):
+        pass
+
+
+class CsvSink(Sink):
+    """Writes each table as a CSV file, compressed with gzip, zstd or lz4 when compression is set."""
+    extension = '.csv'
+
+    def __init__(self, output_dir, compression=None, compression_level=None):
+        super().__init__(output_dir)
+        self.compression = compression
+        self.compression_level = compression_level
+        self.extension = f'.csv{get_compression_extension(compression)}'
+
+
+    def write_table(self, table_builder, table_name, file_name, append=False, header=None):
+        # Chunks after the first are appended without repeating the header
+        if header is None:
+            header = not append
+
+        with open_output(self.get_file_path(file_name), 'a' if append else 'w', self.compression,
+                         self.compression_level, newline='') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            if header:
+                writer.writerow(table_builder.column_names)
+            writer.writerows(table_builder.rows())
+
+
+class DmlSink(Sink):
+    """Writes generated rows straight to INSERT statements or COPY data, without data CSVs."""
+    # Like csv_folder_to_dml, so a re-run never leaves both copies to load
+    overwrites_files = True
+
+    def __init__(self, output_dir, batch_size=100, schema_map=None, output_format='insert', compression=None,
+                 compression_level=None):
+        super().__init__(output_dir)
+        self.batch_size = batch_size
+        self.schema_map = schema_map or {}
+        self.output_format = output_format
+        self.compression = compression
+        self.compression_level = compression_level
+        self.extension = get_output_extension(output_format) + get_compression_extension(compression)
+
+
+    def get_base_file_name(self, table_name):
+        # Same naming as csv_folder_to_dml; tables whose names snake-case
+        # alike get numbered files rather than overwriting each other
+        return _to_snake_case(table_name)
+
+
+    def write_table(self, table_builder, table_name, file_name, append=False, header=None):
+        if header is None:
+            header = not append
+
+        # A COPY block spans all chunks of a file: the header goes with the
+        # first chunk and finish_file closes it
+        with open_output_file(self.get_file_path(file_name), self.output_format, 'a' if append else 'w',
+                              compression=self.compression, compression_level=self.compression_level) as f:
+            if header:
+                if self.output_format != 'copy_binary':
+                    f.write(f"-- {describe_output_format(self.output_format)} for {table_name}\n\n")
+                write_copy_header(f, table_name, table_builder.column_names, self.output_format)
+
+            write_rows(
+                f,
+                table_name,
+                table_builder.column_names,
+                table_builder.rows(),
+                self.output_format,
+                self.batch_size,
+                self.schema_map.get(table_name, {})
+            )
+
+
+    def finish_file(self, file_name):
+        with open_output_file(self.get_file_path(file_name), self.output_format, 'a',
+                              compression=self.compression, compression_level=self.compression_level) as f:
+            write_copy_trailer(f, self.output_format)
+
+
+class PostgresSink(Sink):
+    """
+    Loads generated rows into PostgreSQL with COPY FROM STDIN instead of writing files.
+
+    Every chunk is sent as one COPY and committed right away, so tables of a
+    later FK level always see the rows of their parents. A process loads
+    its chunks one after another over a single connection; with jobs > 1
+    each worker opens its own and closes it when its task is done.
+    psycopg2 is only imported when no connect function is given; connect
+    must be picklable for parallel runs.
+    """
+
+    def __init__(self, dsn=None, connect=None, output_format='copy_text', schema_map=None):
+        if output_format not in ['copy_text', 'copy_csv', 'copy_binary']:
+            raise ValueError(f"PostgresSink loads with COPY, got output format '{output_format}'")
+        if dsn is None and connect is None:
+            raise ValueError('PostgresSink needs a dsn or a connect function')
+
+        super().__init__(None)
+        self.dsn = dsn
+        self.connect = connect
+        self.output_format = output_format
+        self.schema_map = schema_map or {}
+        self._connection_key = uuid.uuid4().hex
+
+
+    def get_connection(self):
+        # Opened on the first chunk a process loads and kept until close
+        key = (self._connection_key, os.getpid())
+        conn = _connections.get(key)
+        if conn is None:
+            conn = self._connect()
+            _connections[key] = conn
+        return conn
+
+
+    def close(self):
+        conn = _connections.pop((self._connection_key, os.getpid()), None)
+        if conn is not None:
+            conn.close()
+
+
+    def write_table(self, table_builder, table_name, file_name, append=False, header=None):
+        column_names = table_builder.column_names
+        data = self._get_copy_data(table_builder, table_name)
+        sql = copy_statement(table_name, column_names, self.output_format).rstrip(';\n')
+
+        conn = self.get_connection()
+        try:
+            cursor = conn.cursor()
+            try:
+                cursor.copy_expert(sql, data)
+            finally:
+                cursor.close()
+            conn.commit()
+        except Exception:
+            self._rollback(conn)
+            raise
+
+
+    def _rollback(self, conn):
+        # A connection that cannot be rolled back is dropped; the next chunk
+        # opens a new one
+        try:
+            conn.rollback()
+        except Exception:
+            _connections.pop((self._connection_key, os.getpid()), None)
+            try:
+                conn.close()
+            except Exception:
+                pass
+
+
+    def merge_part_files(self, file_name, part_file_names):
+        # Shards are loaded into the same table, there is nothing to merge
+        pass
+
+
+    def _get_copy_data(self, table_builder, table_name):
+        # One chunk of COPY data is built in memory, so chunk_size bounds it
+        if self.output_format == 'copy_binary':
+            data = io.BytesIO()
+            data.write(BINARY_HEADER)
+        else:
+            data = io.StringIO()
+
+        write_rows(
+            data,
+            table_name,
+            table_builder.column_names,
+            table_builder.rows(),
+            self.output_format,
+            schema_info=self.schema_map.get(table_name, {})
+        )
+
+        if self.output_format == 'copy_binary':
+            data.write(BINARY_TRAILER)
+        data.seek(0)
+        return data
+
+
+    def _connect(self):
+        if self.connect is not None:
+            return self.connect()
+
+        try:
+            import psycopg2
+        except ImportError as e:
+            raise ImportError('PostgresSink needs psycopg2 (pip install psycopg2-binary) or a connect function') from e
+        return psycopg2.connect(self.dsn)
+
+
+class ParquetSink(Sink):
+    """
+    Writes each table as a Parquet file with typed columns.
+
+    Column types come from the schema's type field (see get_arrow_type).
+    Every generation chunk becomes one row group, split further when
+    row_group_size is set, so memory stays bounded by the chunk size.
+    Requires pyarrow.
+    """
+    extension = '.parquet'
+
+    def __init__(self, output_dir, schema_map=None, row_group_size=None, compression='snappy'):
+        if pa is None:
+            raise ImportError('ParquetSink needs pyarrow (pip install pyarrow)')
+        if row_group_size is not None and row_group_size <= 0:
+            raise ValueError(f'row_group_size must be a positive integer, got {row_group_size}')
+
+        super().__init__(output_dir)
+        self.schema_map = schema_map or {}
+        self.row_group_size = row_group_size
+        self.compression = compression
+        # Open writers of the files this process is writing
+        self._writers = dict()
+
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        state['_writers'] = dict()
+        return state
+
+
+    @staticmethod
+    def get_arrow_type(column_type):
+        column_type = column_type.upper()
+        base_type = re.sub(r'\(.*\)', '', column_type).strip()
+        params = [int(param) for param in re.findall(r'\d+', column_type[len(base_type):])]
+
+        if base_type in ['SMALLINT', 'INT2', 'SMALLSERIAL', 'YEAR']:
+            return pa.int16()
+        if base_type in ['INT', 'INTEGER', 'INT4', 'SERIAL']:
+            return pa.int32()
+        if base_type in ['BIGINT', 'INT8', 'BIGSERIAL']:
+            return pa.int64()
+        if base_type in ['DECIMAL', 'NUMERIC']:
+            if not params:
+                return pa.float64()
+            precision, scale = params[0], params[1] if len(params) > 1 else 0
+            return pa.decimal128(precision, scale) if precision <= 38 else pa.decimal256(precision, scale)
+        if base_type in ['REAL', 'FLOAT4']:
+            return pa.float32()
+        if base_type in ['FLOAT', 'FLOAT8', 'DOUBLE', 'DOUBLE PRECISION']:
+            return pa.float64()
+        if base_type == 'DATE':
+            return pa.date32()
+        if base_type in ['DATETIME', 'TIMESTAMP', 'TIMESTAMP WITHOUT TIME ZONE']:
+            return pa.timestamp('us')
+        if base_type in ['BOOLEAN', 'BOOL']:
+            return pa.bool_()
+        return pa.string()
+
+
+    def write_table(self, table_builder, table_name, file_name, append=False, header=None):
+        path = self.get_file_path(file_name)
+        table = self._to_arrow_table(table_builder, table_name)
+
+        writer = self._writers.get(path)
+        if append and writer is None:
+            raise ValueError(f"Cannot append to '{path}': Parquet files are written by one process in one go")
+        if not append:
+            if writer is not None:
+                writer.close()
+            writer = pq.ParquetWriter(path, table.schema, compression=self.compression)
+            self._writers[path] = writer
+
+        writer.write_table(table, row_group_size=self.row_group_size)
+
+
+    def close_file(self, file_name):
+        writer = self._writers.pop(self.get_file_path(file_name), None)
+        if writer is not None:
+            writer.close()
+
+
+    def merge_part_files(self, file_name, part_file_names):
+        # Parquet files end with a footer, so parts are merged row group by
+        # row group into a new file instead of being appended
+        path = self.get_file_path(file_name)
+        merged_path = f'{path}.merging'
+        writer = None
+        try:
+            for source in [file_name] + part_file_names:
+                with open(self.get_file_path(source), mode='rb') as f:
+                    parquet_file = pq.ParquetFile(f)
+                    if writer is None:
+                        writer = pq.ParquetWriter(merged_path, parquet_file.schema_arrow, compression=self.compression)
+                    for row_group in range(parquet_file.num_row_groups):
+                        writer.write_table(parquet_file.read_row_group(row_group))
+        finally:
+            if writer is not None:
+                writer.close()
+
+        os.replace(merged_path, path)
+        for part_file_name in part_file_names:
+            os.remove(self.get_file_path(part_file_name))
+
+
+    def _to_arrow_table(self, table_builder, table_name):
+        schema_info = self.schema_map.get(table_name, {})
+        arrays = list()
+        fields = list()
+        for column_name, values in table_builder.columns.items():
+            arrow_type = self.get_arrow_type(schema_info.get(column_name, 'TEXT'))
+            # Empty cells are NULL, like in the INSERT and COPY output
+            values = [None if value == '' else value for value in values]
+            try:
+                array = pa.array(values)
+                if array.type != arrow_type:
+                    array = array.cast(arrow_type)
+            except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+                raise ValueError(f"Cannot store column '{column_name}' of table '{table_name}' as {arrow_type}: {e}") from e
+
+            arrays.append(array)
+            fields.append(pa.field(column_name, arrow_type))
+
+        return pa.Table.from_arrays(arrays, schema=pa.schema(fields))
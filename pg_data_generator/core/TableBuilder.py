@@ -0,0 +1,37 @@
+class TableBuilder():
+    """
+    In-memory buffer for the columns of one table.
+
+    Columns are collected in schema order and handed to the writer as
+    rows, so each output file is written in a single pass instead of
+    being re-read and re-written once per column.
+    """
+
+    def __init__(self, row_count):
+        self.row_count = row_count
+        self.columns = dict()
+
+
+    @property
+    def column_names(self):
+        return list(self.columns.keys())
+
+
+    def add_column(self, column_name, values):
+        # Cases that cannot produce values (e.g. unsupported columns) return
+        # None; they are written as empty cells like before.
+        if values is None:
+            values = [''] * self.row_count
+        elif hasattr(values, 'tolist'):
+            values = values.tolist()
+
+        if len(values) != self.row_count:
+            raise ValueError(
+                f"Column '{column_name}' has {len(values)} values, expected {self.row_count}"
+            )
+
+        self.columns[column_name] = values
+
+
+    def rows(self):
+        return zip(*self.columns.values())
@@ -7,18 +7,25 @@ from CSV schema definitions. Use this when importing the package from other repo
 
 from pg_data_generator.core.Csv import Csv
 from pg_data_generator.core.DataGenerator import DataGenerator
+from pg_data_generator.core.Sink import CsvSink, DmlSink, ParquetSink, PostgresSink
 from pg_data_generator.utils.ddl_converter import (
     ddl_to_csv,
     ddl_folder_to_csv,
-    ddl_string_to_csv
+    ddl_string_to_csv,
+    parse_ddl_file,
+    parse_ddl_folder,
+    tables_to_schema_rows
 )
 from pg_data_generator.utils.dml_converter import (
     csv_to_dml,
-    csv_folder_to_dml
+    csv_folder_to_dml,
+    describe_output_format,
+    schema_info_from_tables
 )
 
 
-def generate_data(schema_csv_path, row_count=10, output_dir=None):
+def generate_data(schema_csv_path, row_count=10, output_dir=None, chunk_size=None, jobs=1,
+                  shards=1, part_files=False, compression=None, compression_level=None, seed=None):
     """
     Generate synthetic data based on a CSV schema file.
 
@@ -27,6 +34,24 @@ def generate_data(schema_csv_path, row_count=10, output_dir=None):
         row_count (int): Number of rows to generate for each table (default: 10)
         output_dir (str): Directory where output CSV files will be saved.
                          If None, files are saved in the current directory (default: None)
+        chunk_size (int): Number of rows generated and appended per chunk. Peak memory is
+                          bounded by the chunk size instead of row_count. If None, each
+                          table is generated in one go (default: None)
+        jobs (int): Number of worker processes. Tables that do not depend on each other
+                    through FKs are generated concurrently. If None, uses all CPUs (default: 1)
+        shards (int): Number of disjoint row ranges each table is split into. Every range is
+                      generated by its own task, so one huge table can use several workers.
+                      PK, code sequences and unique columns stay globally unique (default: 1)
+        part_files (bool): If True, each shard is kept as '<table>.partNNNNN.csv' instead of
+                           being concatenated into '<table>.csv' (default: False)
+        compression (str): 'gzip', 'zstd' or 'lz4' to compress the CSV files as they are
+                           written ('<table>.csv.gz', ...). zstd and lz4 need the zstandard
+                           and lz4 packages. If None, files are not compressed (default: None)
+        compression_level (int): Codec level. If None, 6 for gzip, 3 for zstd and 0 for
+                                 lz4 (default: None)
+        seed (int): Non-negative seed making the run reproducible: the same schema, seed
+                    and row_count give the same data, whatever the chunk_size, shards or
+                    number of jobs. If None, every run differs (default: None)
 
     Returns:
         list: List of generated table names
@@ -40,12 +65,139 @@ def generate_data(schema_csv_path, row_count=10, output_dir=None):
         >>> print(f"Generated {len(tables)} tables")
     """
     csv = Csv(schema_csv_path, output_dir=output_dir)
-    dg = DataGenerator(csv)
-    dg.make_csv_for_tables(row_count)
+    sink = CsvSink(csv.output_dir, compression=compression, compression_level=compression_level)
+    dg = DataGenerator(csv, sink, seed)
+    dg.make_csv_for_tables(row_count, chunk_size=chunk_size, jobs=jobs, shards=shards, part_files=part_files)
     return csv.table_names
 
 
-def generate_data_from_ddl_folder(ddl_folder_path, output_data_dir, row_count=10, schema_csv_path=None):
+def generate_parquet(schema_csv_path, row_count=10, output_dir=None, chunk_size=None, jobs=1, shards=1,
+                     part_files=False, row_group_size=None, compression='snappy', seed=None):
+    """
+    Generate synthetic data as typed Parquet files instead of CSV files.
+
+    Column types follow the schema's type field (INT -> int32, DECIMAL(p,s) ->
+    decimal128(p,s), DATE -> date32, DATETIME -> timestamp[us], ...). Requires pyarrow.
+
+    Args:
+        schema_csv_path (str): Path to the CSV schema file defining table structures
+        row_count (int): Number of rows to generate for each table (default: 10)
+        output_dir (str): Directory for the .parquet files. If None, uses the current directory (default: None)
+        chunk_size (int): Number of rows per chunk, see generate_data. Each chunk is
+                          written as one row group (default: None)
+        jobs (int): Number of worker processes, see generate_data (default: 1)
+        shards (int): Number of row ranges per table, see generate_data (default: 1)
+        part_files (bool): If True, keeps each shard as '<table>.partNNNNN.parquet' (default: False)
+        row_group_size (int): Maximum rows per row group. If None, one row group per chunk (default: None)
+        compression (str): Parquet codec, e.g. 'snappy', 'zstd', 'gzip' or 'none' (default: 'snappy')
+        seed (int): Seed for reproducible data, see generate_data (default: None)
+
+    Returns:
+        list: List of generated table names
+
+    Example:
+        >>> from pg_data_generator.main import generate_parquet
+        >>> tables = generate_parquet('schema.csv', row_count=1_000_000, output_dir='./parquet',
+        ...                           chunk_size=100_000, compression='zstd')
+    """
+    csv = Csv(schema_csv_path, output_dir=output_dir)
+    sink = ParquetSink(csv.output_dir, schema_map=schema_info_from_tables(csv.tables),
+                       row_group_size=row_group_size, compression=compression)
+    dg = DataGenerator(csv, sink, seed)
+    dg.make_csv_for_tables(row_count, chunk_size=chunk_size, jobs=jobs, shards=shards, part_files=part_files)
+    return csv.table_names
+
+
+def generate_data_to_postgres(schema_csv_path, dsn=None, row_count=10, chunk_size=None, jobs=1, shards=1,
+                              output_format='copy_text', connect=None, seed=None):
+    """
+    Generate synthetic data and load it straight into PostgreSQL with COPY FROM STDIN.
+
+    No files are written. Tables are loaded in FK dependency order; with jobs > 1
+    tables that do not depend on each other are loaded concurrently, each worker
+    over its own connection. The tables must already exist.
+
+    Args:
+        schema_csv_path (str): Path to the CSV schema file defining table structures
+        dsn (str): libpq connection string, used with psycopg2 (default: None)
+        row_count (int): Number of rows to generate for each table (default: 10)
+        chunk_size (int): Number of rows per COPY, see generate_data (default: None)
+        jobs (int): Number of worker processes, see generate_data (default: 1)
+        shards (int): Number of row ranges per table, see generate_data (default: 1)
+        output_format (str): COPY format, 'copy_text', 'copy_csv' or 'copy_binary' (default: 'copy_text')
+        connect (callable): Returns a new DB-API connection with cursor().copy_expert, used
+                            instead of psycopg2 and dsn. Must be picklable if jobs > 1 (default: None)
+        seed (int): Seed for reproducible data, see generate_data (default: None)
+
+    Returns:
+        list: List of loaded table names
+
+    Example:
+        >>> from pg_data_generator.main import generate_data_to_postgres
+        >>> tables = generate_data_to_postgres(
+        ...     'schema.csv',
+        ...     dsn='dbname=test user=postgres',
+        ...     row_count=1_000_000,
+        ...     chunk_size=100_000,
+        ...     jobs=4
+        ... )
+    """
+    import tempfile
+
+    # Nothing is written, but the schema still wants an output directory;
+    # an empty one keeps file naming from scanning the working directory
+    with tempfile.TemporaryDirectory(prefix='pg_data_gen_') as output_dir:
+        csv = Csv(schema_csv_path, output_dir=output_dir)
+        sink = PostgresSink(dsn=dsn, connect=connect, output_format=output_format,
+                            schema_map=schema_info_from_tables(csv.tables))
+        try:
+            dg = DataGenerator(csv, sink, seed)
+            dg.make_csv_for_tables(row_count, chunk_size=chunk_size, jobs=jobs, shards=shards)
+        finally:
+            sink.close()
+    return csv.table_names
+
+
+def generate_rows(schema_csv_path, table_name, start, stop, row_count, seed):
+    """
+    Generate only rows start..stop-1 of one table of a seeded dataset.
+
+    The rows are the ones generate_data(schema_csv_path, row_count=row_count, seed=seed)
+    writes for the table, with any chunk_size, shards and jobs. Time and memory depend
+    on the size of the range, not on row_count: every value is a function of the seed,
+    table, column and row. FK values reference rows of the full parent, which are
+    generated on demand.
+
+    Args:
+        schema_csv_path (str): Path to the CSV schema file defining table structures
+        table_name (str): Table to take the rows from
+        start (int): Index of the first row, counted from 0
+        stop (int): Index after the last row
+        row_count (int): Number of rows of each table in the full dataset
+        seed (int): Seed of the dataset, see generate_data
+
+    Returns:
+        list: One dict per row, mapping column names to the text the CSV file holds
+              for them ('' for NULL)
+
+    Example:
+        >>> from pg_data_generator.main import generate_rows
+        >>> rows = generate_rows('schema.csv', 'MST_MEMBER', 500_000_000, 500_000_010,
+        ...                      row_count=1_000_000_000, seed=42)
+    """
+    csv = Csv(schema_csv_path)
+    table_builder = DataGenerator(csv, seed=seed).generate_rows(table_name, start, stop, row_count)
+    column_names = table_builder.column_names
+    # Values are returned as csv.writer writes them, whatever type made them
+    return [
+        {column_name: '' if value is None else str(value) for column_name, value in zip(column_names, row)}
+        for row in table_builder.rows()
+    ]
+
+
+def generate_data_from_ddl_folder(ddl_folder_path, output_data_dir, row_count=10, schema_csv_path=None,
+                                  chunk_size=None, jobs=1, shards=1, ddl_cache_dir=None,
+                                  compression=None, compression_level=None, seed=None):
     """
     Convert DDL files to CSV schema and generate synthetic data.
 
@@ -61,6 +213,16 @@ def generate_data_from_ddl_folder(ddl_folder_path, output_data_dir, row_count=10
         row_count (int): Number of rows to generate for each table (default: 10)
         schema_csv_path (str): Path to save the generated CSV schema file.
                               If None, saves as 'schema.csv' in output_data_dir (default: None)
+        chunk_size (int): Number of rows generated per chunk, see generate_data (default: None)
+        jobs (int): Number of worker processes, see generate_data; DDL files are
+                    parsed in parallel too (default: 1)
+        shards (int): Number of row ranges per table, see generate_data (default: 1)
+        ddl_cache_dir (str): Directory caching parsed DDL files by content, so unchanged
+                             files are not parsed again. If None, nothing is cached
+                             (default: None)
+        compression (str): Codec of the data CSV files, see generate_data (default: None)
+        compression_level (int): Codec level, see generate_data (default: None)
+        seed (int): Seed for reproducible data, see generate_data (default: None)
 
     Returns:
         tuple: (list of generated table names, path to schema CSV file)
@@ -86,17 +248,20 @@ def generate_data_from_ddl_folder(ddl_folder_path, output_data_dir, row_count=10
 
     # Convert DDL folder to CSV schema
     print(f"Converting DDL files from: {ddl_folder_path}")
-    ddl_folder_to_csv(ddl_folder_path, schema_csv_path)
+    ddl_folder_to_csv(ddl_folder_path, schema_csv_path, jobs=jobs, cache_dir=ddl_cache_dir)
 
     # Generate data from CSV schema
     print(f"\nGenerating {row_count} rows per table...")
-    tables = generate_data(schema_csv_path, row_count=row_count, output_dir=output_data_dir)
+    tables = generate_data(schema_csv_path, row_count=row_count, output_dir=output_data_dir,
+                           chunk_size=chunk_size, jobs=jobs, shards=shards, compression=compression,
+                           compression_level=compression_level, seed=seed)
 
     return tables, schema_csv_path
 
 
 def generate_data_with_dml(schema_csv_path, row_count=10, output_dir=None,
-                           dml_output_dir=None, batch_size=100):
+                           dml_output_dir=None, batch_size=100, chunk_size=None, jobs=1, shards=1,
+                           output_format='insert', compression=None, compression_level=None, seed=None):
     """
     Generate synthetic data and convert it to SQL INSERT statements.
 
@@ -110,6 +275,16 @@ def generate_data_with_dml(schema_csv_path, row_count=10, output_dir=None,
         output_dir (str): Directory for CSV output files (default: current directory)
         dml_output_dir (str): Directory for SQL DML files. If None, uses output_dir/sql (default: None)
         batch_size (int): Number of rows per INSERT statement (default: 100)
+        chunk_size (int): Number of rows generated per chunk, see generate_data (default: None)
+        jobs (int): Number of worker processes, see generate_data; CSV files are
+                    converted to DML in parallel too (default: 1)
+        shards (int): Number of row ranges per table, see generate_data (default: 1)
+        output_format (str): 'insert' for INSERT statements, 'copy_text' or 'copy_csv' for
+                             COPY ... FROM stdin scripts, 'copy_binary' for binary COPY
+                             data files (.copy) (default: 'insert')
+        compression (str): Codec of both the CSV and the DML files, see generate_data (default: None)
+        compression_level (int): Codec level, see generate_data (default: None)
+        seed (int): Seed for reproducible data, see generate_data (default: None)
 
     Returns:
         dict: Dictionary with keys 'csv_files' (list of CSV paths) and 'dml_files' (list of SQL paths)
@@ -128,7 +303,9 @@ def generate_data_with_dml(schema_csv_path, row_count=10, output_dir=None,
 
     # Generate CSV data
     print(f"Generating {row_count} rows per table...")
-    tables = generate_data(schema_csv_path, row_count=row_count, output_dir=output_dir)
+    tables = generate_data(schema_csv_path, row_count=row_count, output_dir=output_dir,
+                           chunk_size=chunk_size, jobs=jobs, shards=shards, compression=compression,
+                           compression_level=compression_level, seed=seed)
 
     # Determine DML output directory
     if dml_output_dir is None:
@@ -142,7 +319,11 @@ def generate_data_with_dml(schema_csv_path, row_count=10, output_dir=None,
         csv_folder_path=csv_dir,
         output_folder_path=dml_output_dir,
         schema_csv_path=schema_csv_path,
-        batch_size=batch_size
+        batch_size=batch_size,
+        output_format=output_format,
+        jobs=jobs,
+        compression=compression,
+        compression_level=compression_level
     )
 
     return {
@@ -152,7 +333,9 @@ def generate_data_with_dml(schema_csv_path, row_count=10, output_dir=None,
 
 
 def generate_dml_from_ddl_folder(ddl_folder_path, output_dml_dir, row_count=10,
-                                  temp_data_dir=None, batch_size=100, keep_temp_files=False):
+                                  temp_data_dir=None, batch_size=100, keep_temp_files=False, jobs=1,
+                                  streaming=False, output_format='insert', ddl_cache_dir=None,
+                                  compression=None, compression_level=None, seed=None, chunk_size=None):
     """
     Convert DDL files (CREATE TABLE) directly to DML files (INSERT statements).
 
@@ -163,6 +346,10 @@ def generate_dml_from_ddl_folder(ddl_folder_path, output_dml_dir, row_count=10,
     4. Converts CSV data to SQL INSERT statements
     5. Optionally cleans up temporary files
 
+    With streaming=True the parsed DDL goes straight into the generator and
+    generated rows are written straight to INSERT statements, so no schema or
+    data CSV is written at all.
+
     Args:
         ddl_folder_path (str): Path to folder containing .sql DDL files
         output_dml_dir (str): Directory where SQL INSERT files will be saved
@@ -170,6 +357,22 @@ def generate_dml_from_ddl_folder(ddl_folder_path, output_dml_dir, row_count=10,
         temp_data_dir (str): Directory for temporary CSV files. If None, uses a temp dir (default: None)
         batch_size (int): Number of rows per INSERT statement (default: 100)
         keep_temp_files (bool): If True, keeps temporary CSV files. If False, deletes them (default: False)
+        jobs (int): Number of worker processes, see generate_data; DDL and CSV files
+                    are converted in parallel too (default: 1)
+        streaming (bool): If True, skips all intermediate files. temp_data_dir and
+                          keep_temp_files are ignored (default: False)
+        output_format (str): 'insert' for INSERT statements, 'copy_text' or 'copy_csv' for
+                             COPY ... FROM stdin scripts, 'copy_binary' for binary COPY
+                             data files (.copy) (default: 'insert')
+        ddl_cache_dir (str): Directory caching parsed DDL files, see
+                             generate_data_from_ddl_folder (default: None)
+        compression (str): Codec of the DML files (and of the temporary CSV files), see
+                           generate_data (default: None)
+        compression_level (int): Codec level, see generate_data (default: None)
+        seed (int): Seed for reproducible data, see generate_data (default: None)
+        chunk_size (int): Number of rows generated per chunk, see generate_data. With
+                          streaming=True only chunk_size rows of a table are held in
+                          memory at a time (default: None)
 
     Returns:
         dict: Dictionary with:
@@ -197,6 +400,13 @@ def generate_dml_from_ddl_folder(ddl_folder_path, output_dml_dir, row_count=10,
     if not os.path.exists(output_dml_dir):
         os.makedirs(output_dml_dir)
 
+    if streaming:
+        return _generate_dml_from_ddl_tables(
+            parse_ddl_folder(ddl_folder_path, jobs=jobs, cache_dir=ddl_cache_dir),
+            output_dml_dir, row_count, batch_size, jobs, output_format, compression, compression_level, seed,
+            chunk_size
+        )
+
     # Determine temporary data directory
     use_temp_dir = temp_data_dir is None
     if use_temp_dir:
@@ -212,7 +422,13 @@ def generate_dml_from_ddl_folder(ddl_folder_path, output_dml_dir, row_count=10,
         tables, schema_csv_path = generate_data_from_ddl_folder(
             ddl_folder_path=ddl_folder_path,
             output_data_dir=temp_data_dir,
-            row_count=row_count
+            row_count=row_count,
+            chunk_size=chunk_size,
+            jobs=jobs,
+            ddl_cache_dir=ddl_cache_dir,
+            compression=compression,
+            compression_level=compression_level,
+            seed=seed
         )
 
         # Step 2: Convert CSV data to DML
@@ -221,7 +437,11 @@ def generate_dml_from_ddl_folder(ddl_folder_path, output_dml_dir, row_count=10,
             csv_folder_path=temp_data_dir,
             output_folder_path=output_dml_dir,
             schema_csv_path=schema_csv_path,
-            batch_size=batch_size
+            batch_size=batch_size,
+            output_format=output_format,
+            jobs=jobs,
+            compression=compression,
+            compression_level=compression_level
         )
 
         # Step 3: Cleanup or keep files
@@ -252,7 +472,9 @@ def generate_dml_from_ddl_folder(ddl_folder_path, output_dml_dir, row_count=10,
         raise e
 
 
-def ddl_to_dml(ddl_file_path, output_dml_dir, row_count=10, batch_size=100, keep_temp_files=False):
+def ddl_to_dml(ddl_file_path, output_dml_dir, row_count=10, batch_size=100, keep_temp_files=False, jobs=1,
+               streaming=False, output_format='insert', compression=None, compression_level=None, seed=None,
+               chunk_size=None):
     """
     Convert a single DDL file directly to DML INSERT statements.
 
@@ -267,6 +489,17 @@ def ddl_to_dml(ddl_file_path, output_dml_dir, row_count=10, batch_size=100, keep
         row_count (int): Number of rows to generate for each table (default: 10)
         batch_size (int): Number of rows per INSERT statement (default: 100)
         keep_temp_files (bool): If True, keeps temporary CSV files (default: False)
+        jobs (int): Number of worker processes, see generate_data (default: 1)
+        streaming (bool): If True, parses the file in place and writes INSERT statements
+                          without any intermediate files (default: False)
+        output_format (str): 'insert' for INSERT statements, 'copy_text' or 'copy_csv' for
+                             COPY ... FROM stdin scripts, 'copy_binary' for binary COPY
+                             data files (.copy) (default: 'insert')
+        compression (str): Codec of the DML files, see generate_data (default: None)
+        compression_level (int): Codec level, see generate_data (default: None)
+        seed (int): Seed for reproducible data, see generate_data (default: None)
+        chunk_size (int): Number of rows generated per chunk, see
+                          generate_dml_from_ddl_folder (default: None)
 
     Returns:
         dict: Dictionary with:
@@ -288,6 +521,15 @@ def ddl_to_dml(ddl_file_path, output_dml_dir, row_count=10, batch_size=100, keep
     import tempfile
     import shutil
 
+    if streaming:
+        if not os.path.exists(output_dml_dir):
+            os.makedirs(output_dml_dir)
+
+        return _generate_dml_from_ddl_tables(
+            parse_ddl_file(ddl_file_path), output_dml_dir, row_count, batch_size, jobs, output_format,
+            compression, compression_level, seed, chunk_size
+        )
+
     # Create a temporary folder with just this DDL file
     temp_ddl_dir = tempfile.mkdtemp(prefix='pg_ddl_')
     try:
@@ -302,7 +544,13 @@ def ddl_to_dml(ddl_file_path, output_dml_dir, row_count=10, batch_size=100, keep
             output_dml_dir=output_dml_dir,
             row_count=row_count,
             batch_size=batch_size,
-            keep_temp_files=keep_temp_files
+            keep_temp_files=keep_temp_files,
+            jobs=jobs,
+            output_format=output_format,
+            compression=compression,
+            compression_level=compression_level,
+            seed=seed,
+            chunk_size=chunk_size
         )
 
         return result
@@ -313,12 +561,35 @@ def ddl_to_dml(ddl_file_path, output_dml_dir, row_count=10, batch_size=100, keep
             shutil.rmtree(temp_ddl_dir)
 
 
+def _generate_dml_from_ddl_tables(ddl_tables, output_dml_dir, row_count, batch_size, jobs, output_format='insert',
+                                  compression=None, compression_level=None, seed=None, chunk_size=None):
+    # The schema is built from the parsed tables in memory and rows are
+    # formatted as they are generated; nothing else touches disk
+    csv = Csv(None, output_dir=output_dml_dir, schema_rows=tables_to_schema_rows(ddl_tables))
+    sink = DmlSink(output_dml_dir, batch_size=batch_size, schema_map=schema_info_from_tables(csv.tables),
+                   output_format=output_format, compression=compression, compression_level=compression_level)
+
+    print(f"Generating {row_count} rows per table as {describe_output_format(output_format)}...")
+    dg = DataGenerator(csv, sink, seed)
+    dg.make_csv_for_tables(row_count, chunk_size=chunk_size, jobs=jobs)
+
+    dml_files = [sink.get_file_path(file_name) for file_name in dg.file_names.values()]
+    print(f"\n✓ Successfully generated {len(dml_files)} DML file(s) for {len(csv.table_names)} table(s)")
+    return {
+        'dml_files': dml_files,
+        'tables': csv.table_names
+    }
+
+
 # Public API exports
 __all__ = [
     # Core data generation functions
     'generate_data',
     'generate_data_from_ddl_folder',
     'generate_data_with_dml',
+    'generate_parquet',
+    'generate_data_to_postgres',
+    'generate_rows',
 
     # DDL to DML conversion (CREATE to INSERT)
     'generate_dml_from_ddl_folder',
@@ -0,0 +1,63 @@
+class Column(object):
+    """
+    Metadata of one schema column.
+
+    Fields are kept in slots rather than a per-column dict, which keeps
+    schemas with hundreds of thousands of columns small. Columns are read
+    like the dicts they replace: column['type'], column.get('format', '').
+    Header items beyond the standard ones are kept in extra.
+    """
+    __slots__ = ('column', 'type', 'constraint', 'length', 'format', 'extra')
+
+    FIELDS = ('column', 'type', 'constraint', 'length', 'format')
+
+
+    def __init__(self, column, type, constraint='', length='', format='', extra=None):
+        self.column = column
+        self.type = type
+        self.constraint = constraint
+        self.length = length
+        self.format = format
+        self.extra = extra
+
+
+    def __getitem__(self, key):
+        if key in Column.FIELDS:
+            return getattr(self, key)
+        if self.extra and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+
+    def get(self, key, default=None):
+        if key in Column.FIELDS:
+            return getattr(self, key)
+        if self.extra:
+            return self.extra.get(key, default)
+        return default
+
+
+    def __contains__(self, key):
+        return key in Column.FIELDS or bool(self.extra and key in self.extra)
+
+
+    def keys(self):
+        return list(Column.FIELDS) + list(self.extra or {})
+
+
+    def items(self):
+        return [(key, self[key]) for key in self.keys()]
+
+
+    def to_dict(self):
+        return dict(self.items())
+
+
+    def __eq__(self, other):
+        if isinstance(other, (Column, dict)):
+            return self.to_dict() == dict(other.items())
+        return NotImplemented
+
+
+    def __repr__(self):
+        return repr(self.to_dict())
@@ -1,6 +1,8 @@
-from copy import deepcopy
-
 class Table(object):
+    # Columns and foreign keys are handed out as they are, without copies:
+    # a table is read for every column of every chunk
+    __slots__ = ('_table_name', '_columns', '_foreign_keys')
+
     def __init__(self, data):
         self._table_name = data['table_name']
         self._columns = data['columns']
@@ -9,7 +11,7 @@ class Table(object):
 
     @property
     def table_name(self):
-        return deepcopy(self._table_name)
+        return self._table_name
 
 
     @table_name.setter
@@ -19,7 +21,7 @@ class Table(object):
 
     @property
     def columns(self):
-        return deepcopy(self._columns)
+        return self._columns
 
 
     def append_column(self, value):
@@ -28,7 +30,7 @@ class Table(object):
 
     @property
     def foreign_keys(self):
-        return deepcopy(self._foreign_keys)
+        return self._foreign_keys
 
 
     def append_foreign_keys(self, value):
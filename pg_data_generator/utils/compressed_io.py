@@ -0,0 +1,134 @@
+import gzip
+import io
+import multiprocessing
+from typing import Optional
+
+try:
+    import zstandard
+except ImportError:  # only needed for compression='zstd'
+    zstandard = None
+
+try:
+    import lz4.frame as lz4_frame
+except ImportError:  # only needed for compression='lz4'
+    lz4_frame = None
+
+# Codecs output files can be compressed with, and the suffix added to
+# their names (table.csv.gz, table.sql.zst, ...)
+COMPRESSIONS = {
+    'gzip': '.gz',
+    'zstd': '.zst',
+    'lz4': '.lz4',
+}
+
+# Level used when none is given: each codec's usual speed/ratio balance
+DEFAULT_LEVELS = {
+    'gzip': 6,
+    'zstd': 3,
+    'lz4': 0,
+}
+
+# Leading bytes of a gzip member, a zstd frame and an lz4 frame
+_MAGIC_NUMBERS = [
+    (b'\x1f\x8b', 'gzip'),
+    (b'\x28\xb5\x2f\xfd', 'zstd'),
+    (b'\x04\x22\x4d\x18', 'lz4'),
+]
+
+_PACKAGES = {
+    'zstd': 'zstandard',
+    'lz4': 'lz4',
+}
+
+
+def check_compression(compression: Optional[str]) -> None:
+    if compression is not None and compression not in COMPRESSIONS:
+        raise ValueError(f"Unknown compression '{compression}', expected None or one of {list(COMPRESSIONS)}")
+    if (compression == 'zstd' and zstandard is None) or (compression == 'lz4' and lz4_frame is None):
+        raise ImportError(f"compression='{compression}' needs {_PACKAGES[compression]} "
+                          f"(pip install {_PACKAGES[compression]})")
+
+
+def get_compression_extension(compression: Optional[str]) -> str:
+    check_compression(compression)
+    return COMPRESSIONS[compression] if compression else ''
+
+
+def strip_compression_extension(file_name: str) -> str:
+    for extension in COMPRESSIONS.values():
+        if file_name.endswith(extension):
+            return file_name[:-len(extension)]
+    return file_name
+
+
+def detect_compression(path: str) -> Optional[str]:
+    """Codec a file is compressed with, read from its first bytes; None for plain files."""
+    with open(path, 'rb') as f:
+        head = f.read(4)
+    for magic, compression in _MAGIC_NUMBERS:
+        if head.startswith(magic):
+            return compression
+    return None
+
+
+def open_output(path: str, mode: str = 'w', compression: Optional[str] = None, level: Optional[int] = None,
+                encoding: Optional[str] = 'utf-8', newline: Optional[str] = None, buffering: int = -1):
+    """
+    Open a file for writing ('w', 'a', 'wb' or 'ab'), compressed on the fly.
+
+    Every open in append mode adds a new gzip member or zstd/lz4 frame;
+    concatenated members and frames decompress as one stream, so chunks
+    and part files can be appended to compressed files byte for byte.
+    zstd compresses on all CPUs, except in worker processes, which run
+    one per CPU already.
+    """
+    check_compression(compression)
+    binary = 'b' in mode
+    if compression is None:
+        if binary:
+            return open(path, mode, buffering=buffering)
+        return open(path, mode, encoding=encoding, newline=newline, buffering=buffering)
+
+    mode = mode.replace('b', '')
+    if level is None:
+        level = DEFAULT_LEVELS[compression]
+
+    if compression == 'gzip':
+        stream = gzip.open(path, mode + 'b', compresslevel=level)
+    elif compression == 'zstd':
+        threads = 0 if multiprocessing.parent_process() is not None else -1
+        compressor = zstandard.ZstdCompressor(level=level, threads=threads)
+        stream = compressor.stream_writer(open(path, mode + 'b'), closefd=True)
+    else:
+        stream = lz4_frame.open(path, mode + 'b', compression_level=level)
+
+    # Small writes are gathered before they reach the compressor
+    stream = io.BufferedWriter(stream, buffering if buffering > 0 else io.DEFAULT_BUFFER_SIZE)
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
+
+
+def open_input(path: str, mode: str = 'r', encoding: Optional[str] = 'utf-8', newline: Optional[str] = None,
+               buffering: int = -1):
+    """Open a plain, gzip, zstd or lz4 file for reading ('r' or 'rb'); the codec is detected from its content."""
+    compression = detect_compression(path)
+    binary = 'b' in mode
+    if compression is None:
+        if binary:
+            return open(path, 'rb', buffering=buffering)
+        return open(path, 'r', encoding=encoding, newline=newline, buffering=buffering)
+
+    check_compression(compression)
+    if compression == 'gzip':
+        stream = gzip.open(path, 'rb')
+    elif compression == 'zstd':
+        decompressor = zstandard.ZstdDecompressor()
+        stream = decompressor.stream_reader(open(path, 'rb'), read_across_frames=True, closefd=True)
+    else:
+        stream = lz4_frame.open(path, 'rb')
+
+    stream = io.BufferedReader(stream, buffering if buffering > 0 else io.DEFAULT_BUFFER_SIZE)
+    if binary:
+        return stream
+    return io.TextIOWrapper(stream, encoding=encoding, newline=newline)
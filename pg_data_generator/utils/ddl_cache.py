@@ -0,0 +1,102 @@
+import hashlib
+import json
+import os
+import tempfile
+from typing import Dict, List, Optional
+
+# Parsed tables of DDL files can be stored on disk by content hash so
+# unchanged files are not parsed again (e.g. across CI runs that keep the
+# directory). The cache is opt-in: callers pass the directory to use.
+DDL_CACHE_SIZE = 256 * 2 ** 20
+
+_HASH_BLOCK_SIZE = 1 << 20
+
+
+def hash_ddl_file(file_path: str, parser_version: str) -> str:
+    # The parser version is part of the key: a parser change invalidates
+    # every entry parsed by the previous one
+    digest = hashlib.sha256(parser_version.encode('utf-8'))
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class DdlCache():
+    """
+    Size-bounded on-disk cache of parsed DDL files.
+
+    Entries are JSON files named by key. Reading an entry refreshes its
+    modification time, and writing one evicts the least recently used
+    entries until the cache fits in max_bytes. Entries are written to a
+    temporary file and renamed, so processes can share the directory.
+    """
+
+    def __init__(self, cache_dir: str, max_bytes: int = DDL_CACHE_SIZE):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+
+    def get(self, key: str) -> Optional[List[Dict]]:
+        path = self._path(key)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                tables = json.load(f)
+            os.utime(path)
+        except (OSError, ValueError):
+            # Missing, evicted meanwhile or unreadable: parse again
+            return None
+
+        return [self._restore_tuples(table) for table in tables]
+
+
+    def put(self, key: str, tables: List[Dict]) -> None:
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, temp_path = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(tables, f)
+            os.replace(temp_path, self._path(key))
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        self.evict()
+
+
+    def evict(self) -> None:
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith('.json'):
+                try:
+                    stat = entry.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+
+
+    @staticmethod
+    def _restore_tuples(table: Dict) -> Dict:
+        # JSON has no tuples; FK references are (table, column) tuples
+        for col in table['columns']:
+            if col.get('foreign_key'):
+                col['foreign_key'] = tuple(col['foreign_key'])
+        table['foreign_keys'] = {
+            fk_col: tuple(reference) for fk_col, reference in table['foreign_keys'].items()
+        }
+        return table
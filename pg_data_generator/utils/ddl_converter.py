@@ -1,13 +1,57 @@
-import re
 import csv
 import os
-from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterable, Optional, Tuple
+
+from pg_data_generator.utils.compressed_io import strip_compression_extension
+from pg_data_generator.utils.ddl_cache import DDL_CACHE_SIZE, DdlCache, hash_ddl_file
+from pg_data_generator.utils.sql_tokenizer import (
+    OTHER, PUNCT, QUOTED, WORD, SqlTokenizer, read_sql_chunks
+)
+
+# Part of the DDL cache key; bump it whenever parsed output changes
+PARSER_VERSION = '2'
+
+MULTI_WORD_TYPES = [
+    ('CHARACTER', 'VARYING'),
+    ('CHAR', 'VARYING'),
+    ('NATIONAL', 'CHARACTER', 'VARYING'),
+    ('NATIONAL', 'CHAR', 'VARYING'),
+    ('BIT', 'VARYING'),
+    ('DOUBLE', 'PRECISION'),
+    ('TIMESTAMP', 'WITH', 'TIME', 'ZONE'),
+    ('TIMESTAMP', 'WITHOUT', 'TIME', 'ZONE'),
+    ('TIME', 'WITH', 'TIME', 'ZONE'),
+    ('TIME', 'WITHOUT', 'TIME', 'ZONE'),
+]
+MULTI_WORD_TYPE_PREFIXES = {
+    words[:length] for words in MULTI_WORD_TYPES for length in range(2, len(words) + 1)
+}
+
+
+def ddl_folder_to_csv(folder_path: str, output_csv_path: str, jobs: Optional[int] = 1,
+                      cache_dir: Optional[str] = None) -> None:
+    all_tables = parse_ddl_folder(folder_path, jobs=jobs, cache_dir=cache_dir)
 
+    write_csv_schema(all_tables, output_csv_path)
+    print(f"Successfully created: {output_csv_path}")
+
+
+def parse_ddl_folder(folder_path: str, jobs: Optional[int] = 1, cache_dir: Optional[str] = None,
+                     cache_size: int = DDL_CACHE_SIZE) -> List[Dict]:
+    """
+    Parse every .sql file of a folder (.sql.gz, .sql.zst and .sql.lz4
+    too), in file name order.
 
-def ddl_folder_to_csv(folder_path: str, output_csv_path: str) -> None:
+    Files are parsed by up to jobs worker processes, all CPUs if jobs is
+    None. Given a cache_dir, parsed tables are cached there by file
+    content, so unchanged files are not parsed again; the cache keeps to
+    cache_size bytes by evicting the least recently used files. Without
+    one (the default) nothing is cached.
+    """
     sql_files = []
-    for file in os.listdir(folder_path):
-        if file.endswith('.sql'):
+    for file in sorted(os.listdir(folder_path)):
+        if strip_compression_extension(file).endswith('.sql'):
             sql_files.append(os.path.join(folder_path, file))
 
     if not sql_files:
@@ -17,217 +61,390 @@ def ddl_folder_to_csv(folder_path: str, output_csv_path: str) -> None:
     for sql_file in sql_files:
         print(f"  - {os.path.basename(sql_file)}")
 
+    jobs = jobs or os.cpu_count() or 1
+    arguments = [(sql_file, cache_dir, cache_size) for sql_file in sql_files]
+    if jobs > 1 and len(sql_files) > 1:
+        with ProcessPoolExecutor(max_workers=min(jobs, len(sql_files))) as executor:
+            results = list(executor.map(_parse_ddl_file_cached, *zip(*arguments)))
+    else:
+        results = [_parse_ddl_file_cached(*argument) for argument in arguments]
+
     all_tables = []
-    for sql_file in sql_files:
-        tables = parse_ddl_file(sql_file)
+    for tables, _ in results:
         all_tables.extend(tables)
 
-    print(f"\nParsed {len(all_tables)} table(s)")
+    cached_count = sum(1 for _, cached in results if cached)
+    print(f"\nParsed {len(all_tables)} table(s)" +
+          (f" ({cached_count} file(s) from cache)" if cached_count else ""))
+    return all_tables
 
-    write_csv_schema(all_tables, output_csv_path)
-    print(f"Successfully created: {output_csv_path}")
 
+def _parse_ddl_file_cached(ddl_file_path: str, cache_dir: Optional[str],
+                           cache_size: int = DDL_CACHE_SIZE) -> Tuple[List[Dict], bool]:
+    if cache_dir is None:
+        return parse_ddl_file(ddl_file_path), False
 
-def parse_ddl_file(ddl_file_path: str) -> List[Dict]:
-    with open(ddl_file_path, 'r', encoding='utf-8') as f:
-        ddl_content = f.read()
+    cache = DdlCache(cache_dir, cache_size)
+    key = hash_ddl_file(ddl_file_path, PARSER_VERSION)
+    tables = cache.get(key)
+    if tables is not None:
+        return tables, True
 
-    return parse_ddl_string(ddl_content)
+    tables = parse_ddl_file(ddl_file_path)
+    cache.put(key, tables)
+    return tables, False
+
+
+def parse_ddl_file(ddl_file_path: str) -> List[Dict]:
+    return parse_ddl_chunks(read_sql_chunks(ddl_file_path))
 
 
 def parse_ddl_string(ddl_content: str) -> List[Dict]:
+    return parse_ddl_chunks([ddl_content])
+
+
+def parse_ddl_chunks(chunks: Iterable[str]) -> List[Dict]:
+    """
+    Parse CREATE TABLE statements, and the key constraints added to them by
+    ALTER TABLE (as pg_dump writes them), from SQL text given in chunks.
+
+    Other statements, and the data of COPY blocks, are scanned past
+    without being tokenized. Tables are named without their schema.
+    """
     tables = []
+    tables_by_name = {}
+    alterations = []
+
+    for tokens in SqlTokenizer(chunks).statements(first_words=('CREATE', 'ALTER')):
+        if _is_word(tokens[0], 'CREATE'):
+            table_info = _parse_create_table(tokens)
+            if table_info:
+                tables.append(table_info)
+                tables_by_name[table_info['table_name']] = table_info
+        else:
+            alteration = _parse_alter_table(tokens)
+            if alteration:
+                alterations.append(alteration)
 
-    ddl_content = re.sub(r'--[^\n]*', '', ddl_content)
-    ddl_content = re.sub(r'/\*.*?\*/', '', ddl_content, flags=re.DOTALL)
-
-    create_table_pattern = re.compile(
-        r'CREATE\s+TABLE\s+(?:IF\s+NOT\s+EXISTS\s+)?([^\s(]+)\s*\((.*?)\);',
-        re.IGNORECASE | re.DOTALL
-    )
-
-    for match in create_table_pattern.finditer(ddl_content):
-        table_name = match.group(1).strip().strip('"').strip('`').strip('[]')
-        columns_def = match.group(2).strip()
-
-        table_info = {
-            'table_name': table_name,
-            'columns': [],
-            'foreign_keys': {}
-        }
-
-        column_defs = _split_column_definitions(columns_def)
-
-        primary_keys = []
-        foreign_keys = {}
-
-        for col_def in column_defs:
-            col_def = col_def.strip()
-
-            pk_match = re.match(r'PRIMARY\s+KEY\s*\(([^)]+)\)', col_def, re.IGNORECASE)
-            if pk_match:
-                pk_cols = [c.strip().strip('"').strip('`').strip('[]') for c in pk_match.group(1).split(',')]
-                primary_keys.extend(pk_cols)
-                continue
-
-            fk_match = re.match(
-                r'FOREIGN\s+KEY\s*\(([^)]+)\)\s+REFERENCES\s+([^\s(]+)\s*\(([^)]+)\)',
-                col_def,
-                re.IGNORECASE
-            )
-            if fk_match:
-                fk_col = fk_match.group(1).strip().strip('"').strip('`').strip('[]')
-                ref_table = fk_match.group(2).strip().strip('"').strip('`').strip('[]')
-                ref_col = fk_match.group(3).strip().strip('"').strip('`').strip('[]')
-                foreign_keys[fk_col] = (ref_table, ref_col)
-                continue
-
-            unique_match = re.match(r'UNIQUE\s*\(([^)]+)\)', col_def, re.IGNORECASE)
-            if unique_match:
-                # Skip UNIQUE constraints - we don't enforce uniqueness during generation
-                continue
-
-            check_match = re.match(r'CHECK\s*\(', col_def, re.IGNORECASE)
-            if check_match:
-                # Skip CHECK constraints
-                continue
-
-            if re.match(r'CONSTRAINT\s+', col_def, re.IGNORECASE):
-                constraint_match = re.match(
-                    r'CONSTRAINT\s+\S+\s+(.*)',
-                    col_def,
-                    re.IGNORECASE
-                )
-                if constraint_match:
-                    constraint_content = constraint_match.group(1)
-
-                    pk_match = re.match(r'PRIMARY\s+KEY\s*\(([^)]+)\)', constraint_content, re.IGNORECASE)
-                    if pk_match:
-                        pk_cols = [c.strip().strip('"').strip('`').strip('[]') for c in pk_match.group(1).split(',')]
-                        primary_keys.extend(pk_cols)
-                        continue
-
-                    unique_match = re.match(r'UNIQUE\s*\(([^)]+)\)', constraint_content, re.IGNORECASE)
-                    if unique_match:
-                        # Skip UNIQUE constraints
-                        continue
-
-                    check_match = re.match(r'CHECK\s*\(', constraint_content, re.IGNORECASE)
-                    if check_match:
-                        # Skip CHECK constraints
-                        continue
-
-                    fk_match = re.match(
-                        r'FOREIGN\s+KEY\s*\(([^)]+)\)\s+REFERENCES\s+([^\s(]+)\s*\(([^)]+)\)',
-                        constraint_content,
-                        re.IGNORECASE
-                    )
-                    if fk_match:
-                        fk_col = fk_match.group(1).strip().strip('"').strip('`').strip('[]')
-                        ref_table = fk_match.group(2).strip().strip('"').strip('`').strip('[]')
-                        ref_col = fk_match.group(3).strip().strip('"').strip('`').strip('[]')
-                        foreign_keys[fk_col] = (ref_table, ref_col)
-                        continue
-
-                # If it's a CONSTRAINT but not one we recognize, skip it
-                continue
-
-            column_info = _parse_column_definition(col_def)
-            if column_info:
-                if column_info.get('is_primary_key'):
-                    primary_keys.append(column_info['name'])
-
-                if column_info.get('foreign_key'):
-                    fk_table, fk_col = column_info['foreign_key']
-                    foreign_keys[column_info['name']] = (fk_table, fk_col)
-
-                table_info['columns'].append(column_info)
-
-        for col in table_info['columns']:
-            if col['name'] in primary_keys:
-                col['is_primary_key'] = True
-
-        for col in table_info['columns']:
-            if col['name'] in foreign_keys:
-                ref_table, ref_col = foreign_keys[col['name']]
-                col['foreign_key'] = (ref_table, ref_col)
-
-        table_info['foreign_keys'] = foreign_keys
-        tables.append(table_info)
+    # pg_dump adds keys after all tables are created
+    for table_name, columns, constraints in alterations:
+        table_info = tables_by_name.get(table_name)
+        if table_info is None:
+            continue
+        table_info['columns'].extend(columns)
+        table_info['constraints'].extend(constraints)
+
+    for table_info in tables:
+        _apply_constraints(table_info, tables_by_name)
 
     return tables
 
 
-def _split_column_definitions(columns_def: str) -> List[str]:
-    parts = []
-    current = []
-    paren_depth = 0
-
-    for char in columns_def:
-        if char == '(':
-            paren_depth += 1
-            current.append(char)
-        elif char == ')':
-            paren_depth -= 1
-            current.append(char)
-        elif char == ',' and paren_depth == 0:
-            parts.append(''.join(current))
-            current = []
-        else:
-            current.append(char)
+def _is_word(token: Tuple[str, str], *words: str) -> bool:
+    return token[0] == WORD and token[1].upper() in words
+
+
+def _words_at(tokens: List[Tuple[str, str]], index: int, *words: str) -> bool:
+    # Whether the tokens from index on are the given keywords
+    if index + len(words) > len(tokens):
+        return False
+    return all(_is_word(tokens[index + offset], word) for offset, word in enumerate(words))
+
+
+def _parse_identifier(tokens: List[Tuple[str, str]], index: int) -> Tuple[Optional[str], int]:
+    if index < len(tokens) and tokens[index][0] in (WORD, QUOTED):
+        return tokens[index][1], index + 1
+    return None, index
+
+
+def _parse_qualified_name(tokens: List[Tuple[str, str]], index: int) -> Tuple[Optional[str], int]:
+    # schema.table (or database.schema.table) is named by its last part
+    name, index = _parse_identifier(tokens, index)
+    while name is not None and index + 1 < len(tokens) and tokens[index] == (PUNCT, '.'):
+        next_name, next_index = _parse_identifier(tokens, index + 1)
+        if next_name is None:
+            break
+        name, index = next_name, next_index
+    return name, index
+
 
-    if current:
-        parts.append(''.join(current))
+def _find_closing_paren(tokens: List[Tuple[str, str]], index: int) -> int:
+    # Index of the ')' closing the '(' at index
+    depth = 0
+    for position in range(index, len(tokens)):
+        if tokens[position] == (PUNCT, '('):
+            depth += 1
+        elif tokens[position] == (PUNCT, ')'):
+            depth -= 1
+            if depth == 0:
+                return position
+    raise ValueError('Unbalanced parentheses in DDL')
 
-    return parts
 
+def _split_top_level(tokens: List[Tuple[str, str]]) -> List[List[Tuple[str, str]]]:
+    parts = [[]]
+    depth = 0
 
-def _parse_column_definition(col_def: str) -> Optional[Dict]:
-    col_pattern = re.match(
-        r'^\s*([^\s]+)\s+([^\s(]+(?:\([^)]+\))?)(.*)',
-        col_def,
-        re.IGNORECASE
-    )
+    for token in tokens:
+        if token == (PUNCT, '('):
+            depth += 1
+        elif token == (PUNCT, ')'):
+            depth -= 1
+        elif token == (PUNCT, ',') and depth == 0:
+            parts.append([])
+            continue
+        parts[-1].append(token)
 
-    if not col_pattern:
+    return [part for part in parts if part]
+
+
+def _parse_name_list(tokens: List[Tuple[str, str]], index: int) -> Tuple[List[str], int]:
+    # Names of a parenthesized list, e.g. the columns of a key
+    if index >= len(tokens) or tokens[index] != (PUNCT, '('):
+        return [], index
+
+    end = _find_closing_paren(tokens, index)
+    names = [token[1] for token in tokens[index + 1:end] if token[0] in (WORD, QUOTED)]
+    return names, end + 1
+
+
+def _parse_create_table(tokens: List[Tuple[str, str]]) -> Optional[Dict]:
+    index = 1
+    while index < len(tokens) and _is_word(tokens[index], 'GLOBAL', 'LOCAL', 'TEMP', 'TEMPORARY', 'UNLOGGED'):
+        index += 1
+    if not _words_at(tokens, index, 'TABLE'):
+        return None
+    index += 1
+    if _words_at(tokens, index, 'IF', 'NOT', 'EXISTS'):
+        index += 3
+
+    table_name, index = _parse_qualified_name(tokens, index)
+    # CREATE TABLE ... AS / OF / PARTITION OF have no column list to read
+    if table_name is None or index >= len(tokens) or tokens[index] != (PUNCT, '('):
         return None
 
-    col_name = col_pattern.group(1).strip().strip('"').strip('`').strip('[]')
-    col_type = col_pattern.group(2).strip().upper()
-    col_constraints = col_pattern.group(3).strip()
+    end = _find_closing_paren(tokens, index)
+    table_info = {
+        'table_name': table_name,
+        'columns': [],
+        'foreign_keys': {},
+        'constraints': []
+    }
+
+    for element in _split_top_level(tokens[index + 1:end]):
+        constraint = _parse_table_constraint(element)
+        if constraint is not None:
+            table_info['constraints'].extend(constraint)
+            continue
+
+        if _is_word(element[0], 'LIKE', 'EXCLUDE'):
+            continue
+
+        column_info = _parse_column_definition(element)
+        if column_info:
+            table_info['columns'].append(column_info)
 
-    type_match = re.match(r'([^\(]+)(?:\((\d+)(?:,\s*(\d+))?\))?', col_type)
-    if not type_match:
+    return table_info
+
+
+def _parse_alter_table(tokens: List[Tuple[str, str]]) -> Optional[Tuple[str, List[Dict], List[Tuple]]]:
+    if not _words_at(tokens, 1, 'TABLE'):
         return None
 
-    base_type = type_match.group(1).strip()
-    length = type_match.group(2)
-    precision = type_match.group(3)  # For DECIMAL(15,2)
+    index = 2
+    if _words_at(tokens, index, 'IF', 'EXISTS'):
+        index += 2
+    if _words_at(tokens, index, 'ONLY'):
+        index += 1
+
+    table_name, index = _parse_qualified_name(tokens, index)
+    if table_name is None:
+        return None
+    if index < len(tokens) and tokens[index] == (OTHER, '*'):
+        index += 1
+
+    columns = []
+    constraints = []
+    for action in _split_top_level(tokens[index:]):
+        if not _is_word(action[0], 'ADD'):
+            continue
+
+        constraint = _parse_table_constraint(action[1:])
+        if constraint is not None:
+            constraints.extend(constraint)
+            continue
+
+        position = 1
+        if _words_at(action, position, 'COLUMN'):
+            position += 1
+        if _words_at(action, position, 'IF', 'NOT', 'EXISTS'):
+            position += 3
+        column_info = _parse_column_definition(action[position:])
+        if column_info:
+            columns.append(column_info)
+
+    return table_name, columns, constraints
+
+
+def _parse_table_constraint(tokens: List[Tuple[str, str]]) -> Optional[List[Tuple]]:
+    """
+    Key constraints of a table constraint, e.g. [('pk', ['id'])] or
+    [('fk', ['a', 'b'], 'other_table', ['x', 'y'])], or None when the
+    tokens are not a table constraint.
+    """
+    index = 0
+    if _words_at(tokens, index, 'CONSTRAINT'):
+        index += 2
+
+    if _words_at(tokens, index, 'PRIMARY', 'KEY'):
+        columns, _ = _parse_name_list(tokens, index + 2)
+        return [('pk', columns)]
+
+    if _words_at(tokens, index, 'FOREIGN', 'KEY'):
+        columns, index = _parse_name_list(tokens, index + 2)
+        if not _words_at(tokens, index, 'REFERENCES'):
+            return []
+        ref_table, index = _parse_qualified_name(tokens, index + 1)
+        ref_columns, _ = _parse_name_list(tokens, index)
+        return [('fk', columns, ref_table, ref_columns)]
+
+    # UNIQUE, CHECK and EXCLUDE constraints are not enforced during generation
+    if index > 0 or (tokens and _is_word(tokens[0], 'UNIQUE', 'CHECK', 'EXCLUDE')):
+        return []
+
+    return None
+
+
+def _apply_constraints(table_info: Dict, tables_by_name: Dict[str, Dict]) -> None:
+    primary_keys = []
+    foreign_keys = {}
+
+    for col in table_info['columns']:
+        if col.get('is_primary_key'):
+            primary_keys.append(col['name'])
+
+        if col.get('foreign_key'):
+            foreign_keys[col['name']] = col['foreign_key']
+
+    for constraint in table_info.pop('constraints'):
+        if constraint[0] == 'pk':
+            primary_keys.extend(constraint[1])
+        else:
+            _, columns, ref_table, ref_columns = constraint
+            pairs = list(zip(columns, ref_columns or _primary_keys_of(tables_by_name.get(ref_table))))
+            # Columns of a composite key share its name, so they are
+            # generated from one parent row rather than independently
+            key = '+'.join(fk_col for fk_col, _ in pairs) if len(pairs) > 1 else None
+            for fk_col, ref_col in pairs:
+                foreign_keys[fk_col] = (ref_table, ref_col, key) if key else (ref_table, ref_col)
+
+    # Inline REFERENCES without a column list point to the primary key
+    for fk_col, (ref_table, ref_col, *_) in list(foreign_keys.items()):
+        if ref_col is None:
+            ref_keys = _primary_keys_of(tables_by_name.get(ref_table))
+            if len(ref_keys) == 1:
+                foreign_keys[fk_col] = (ref_table, ref_keys[0])
+            else:
+                del foreign_keys[fk_col]
+
+    for col in table_info['columns']:
+        if col['name'] in primary_keys:
+            col['is_primary_key'] = True
+
+        col['foreign_key'] = foreign_keys.get(col['name'])
+
+    table_info['foreign_keys'] = foreign_keys
+
+
+def _primary_keys_of(table_info: Optional[Dict]) -> List[str]:
+    if table_info is None:
+        return []
+
+    primary_keys = [col['name'] for col in table_info['columns'] if col.get('is_primary_key')]
+    for constraint in table_info.get('constraints', []):
+        if constraint[0] == 'pk':
+            primary_keys.extend(constraint[1])
+    return primary_keys
+
+
+def _parse_type(tokens: List[Tuple[str, str]], index: int) -> Tuple[Optional[Dict], int]:
+    type_name, index = _parse_identifier(tokens, index)
+    if type_name is None:
+        return None, index
+
+    words = [type_name.upper()]
+    while index + 1 < len(tokens) and tokens[index] == (PUNCT, '.') and tokens[index + 1][0] in (WORD, QUOTED):
+        words[-1] += '.' + tokens[index + 1][1].upper()
+        index += 2
+
+    modifiers = []
+    while index < len(tokens):
+        token = tokens[index]
+        if token[0] == WORD and tuple(words + [token[1].upper()]) in MULTI_WORD_TYPE_PREFIXES:
+            words.append(token[1].upper())
+            index += 1
+        elif token == (PUNCT, '(') and not modifiers:
+            end = _find_closing_paren(tokens, index)
+            modifiers = [token[1] for token in tokens[index + 1:end]]
+            index = end + 1
+        else:
+            break
+
+    base_type = ' '.join(words)
+    length = modifiers[0] if modifiers and modifiers[0].isdigit() else None
+    precision = None
+    if length and len(modifiers) >= 3 and modifiers[1] == ',' and modifiers[2].isdigit():
+        precision = modifiers[2]  # For DECIMAL(15,2)
 
     if precision:
         full_type = f"{base_type}({length},{precision})"
-    elif length and base_type not in ['INT', 'BIGINT', 'SMALLINT', 'DATE', 'DATETIME', 'TIMESTAMP']:
+    elif length and words[0] not in ['INT', 'BIGINT', 'SMALLINT', 'DATE', 'DATETIME', 'TIMESTAMP']:
         full_type = f"{base_type}({length})"
     else:
         full_type = base_type
 
-    is_primary_key = bool(re.search(r'PRIMARY\s+KEY', col_constraints, re.IGNORECASE))
+    while index + 1 < len(tokens) and tokens[index] == (PUNCT, '['):
+        end = index + 1
+        while end < len(tokens) and tokens[end] != (PUNCT, ']'):
+            end += 1
+        full_type += '[]'
+        index = end + 1
 
+    return {'type': full_type, 'length': length if length else ''}, index
+
+
+def _parse_column_definition(tokens: List[Tuple[str, str]]) -> Optional[Dict]:
+    col_name, index = _parse_identifier(tokens, 0)
+    if col_name is None:
+        return None
+
+    type_info, index = _parse_type(tokens, index)
+    if type_info is None:
+        return None
+
+    is_primary_key = False
     foreign_key = None
-    fk_match = re.search(
-        r'REFERENCES\s+([^\s(]+)\s*\(([^)]+)\)',
-        col_constraints,
-        re.IGNORECASE
-    )
-    if fk_match:
-        ref_table = fk_match.group(1).strip().strip('"').strip('`').strip('[]')
-        ref_col = fk_match.group(2).strip().strip('"').strip('`').strip('[]')
-        foreign_key = (ref_table, ref_col)
+
+    # Column constraints; parenthesized parts (DEFAULT and CHECK
+    # expressions) are skipped whole
+    while index < len(tokens):
+        if tokens[index] == (PUNCT, '('):
+            index = _find_closing_paren(tokens, index) + 1
+        elif _words_at(tokens, index, 'PRIMARY', 'KEY'):
+            is_primary_key = True
+            index += 2
+        elif _words_at(tokens, index, 'REFERENCES'):
+            ref_table, index = _parse_qualified_name(tokens, index + 1)
+            ref_columns, index = _parse_name_list(tokens, index)
+            if ref_table is not None:
+                foreign_key = (ref_table, ref_columns[0] if ref_columns else None)
+        else:
+            index += 1
 
     return {
         'name': col_name,
-        'type': full_type,
-        'length': length if length else '',
+        'type': type_info['type'],
+        'length': type_info['length'],
         'is_primary_key': is_primary_key,
         'foreign_key': foreign_key
     }
@@ -250,32 +467,37 @@ def write_csv_schema(tables: List[Dict], output_csv_path: str) -> None:
     with open(output_csv_path, 'w', newline='', encoding='utf-8') as csvfile:
         # Use QUOTE_MINIMAL to avoid quoting DECIMAL types with commas
         writer = csv.writer(csvfile, quoting=csv.QUOTE_MINIMAL)
-
-        writer.writerow(['table_name', 'column', 'type', 'constraint', 'length', 'format'])
-
-        for table in tables:
-            for col in table['columns']:
-                table_name = table['table_name']
-                col_name = col['name']
-                col_type = col['type']
-                length = col.get('length', '')
-                constraint = ''
-                format_val = ''
-
-                if col.get('is_primary_key'):
-                    constraint = 'pk'
-                elif col.get('foreign_key'):
-                    ref_table, ref_col = col['foreign_key']
-                    constraint = f'fk.{ref_table}.{ref_col}'
-
-                writer.writerow([
-                    table_name,
-                    col_name,
-                    col_type,
-                    constraint,
-                    length,
-                    format_val
-                ])
+        writer.writerows(tables_to_schema_rows(tables))
+
+
+def tables_to_schema_rows(tables: List[Dict]) -> List[List[str]]:
+    rows = [['table_name', 'column', 'type', 'constraint', 'length', 'format']]
+
+    for table in tables:
+        for col in table['columns']:
+            table_name = table['table_name']
+            col_name = col['name']
+            col_type = col['type']
+            length = col.get('length', '')
+            constraint = ''
+            format_val = ''
+
+            if col.get('is_primary_key'):
+                constraint = 'pk'
+            elif col.get('foreign_key'):
+                # fk.TABLE.column, or fk.TABLE.column.KEY for a composite key
+                constraint = 'fk.' + '.'.join(col['foreign_key'])
+
+            rows.append([
+                table_name,
+                col_name,
+                col_type,
+                constraint,
+                length,
+                format_val
+            ])
+
+    return rows
 
 
 def ddl_string_to_csv(ddl_string: str, output_csv_path: str) -> None:
@@ -1,7 +1,34 @@
 import csv
+import io
 import os
 import re
-from typing import List, Dict, Optional
+import shutil
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain, islice
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from pg_data_generator.utils.compressed_io import (
+    detect_compression,
+    get_compression_extension,
+    open_input,
+    open_output,
+    strip_compression_extension
+)
+from pg_data_generator.utils.pgcopy import (
+    BINARY_HEADER,
+    BINARY_TRAILER,
+    copy_statement,
+    write_copy_binary_rows,
+    write_copy_csv_rows,
+    write_copy_text_rows
+)
+
+# 'insert' writes batched INSERT statements, the copy formats write
+# COPY ... FROM stdin scripts (text, CSV) or a binary COPY data file
+OUTPUT_FORMATS = ['insert', 'copy_text', 'copy_csv', 'copy_binary']
+
+# Buffer size of the files read and written while converting
+IO_BUFFER_SIZE = 1 << 20
 
 
 def _to_snake_case(name: str) -> str:
@@ -14,39 +41,181 @@ def _to_snake_case(name: str) -> str:
 
 
 def csv_to_dml(csv_file_path: str, table_name: str, output_sql_path: str,
-               batch_size: int = 100, schema_info: Optional[Dict] = None) -> None:
-    with open(csv_file_path, 'r', encoding='utf-8') as csvfile:
-        reader = csv.DictReader(csvfile)
-        rows = list(reader)
-
-        if not rows:
+               batch_size: int = 100, schema_info: Optional[Dict] = None,
+               output_format: str = 'insert', compression: Optional[str] = None,
+               compression_level: Optional[int] = None) -> None:
+    check_output_format(output_format)
+
+    # Rows are streamed from the reader batch by batch, so memory does not
+    # grow with the file; the row count is only known at the end and goes
+    # into a trailer comment. Compressed CSV files are read as they are.
+    with open_input(csv_file_path, 'r', encoding='utf-8', newline='', buffering=IO_BUFFER_SIZE) as csvfile:
+        reader = csv.reader(csvfile)
+        column_names = next(reader, [])
+        first_row = next(reader, None)
+
+        if first_row is None:
             print(f"Warning: No data found in {csv_file_path}")
             return
 
-        column_names = list(rows[0].keys())
+        with open_output_file(output_sql_path, output_format, buffering=IO_BUFFER_SIZE,
+                              compression=compression, compression_level=compression_level) as sqlfile:
+            # Binary COPY data has no room for comments
+            if output_format != 'copy_binary':
+                sqlfile.write(f"-- {describe_output_format(output_format)} for {table_name}\n")
+                sqlfile.write(f"-- Generated from: {os.path.basename(csv_file_path)}\n\n")
+
+            write_copy_header(sqlfile, table_name, column_names, output_format)
+            row_count = write_rows(sqlfile, table_name, column_names, chain([first_row], reader),
+                                   output_format, batch_size, schema_info)
+            write_copy_trailer(sqlfile, output_format)
+
+            if output_format != 'copy_binary':
+                sqlfile.write(f"-- Total rows: {row_count}\n")
+
+    print(f"Generated {describe_output_format(output_format)}: {output_sql_path}")
+
+
+def check_output_format(output_format: str) -> None:
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(f"Unknown output format '{output_format}', expected one of {OUTPUT_FORMATS}")
+
+
+def describe_output_format(output_format: str) -> str:
+    return 'INSERT statements' if output_format == 'insert' else 'COPY data'
+
+
+def get_output_extension(output_format: str) -> str:
+    check_output_format(output_format)
+    return '.copy' if output_format == 'copy_binary' else '.sql'
+
+
+def open_output_file(path: str, output_format: str, mode: str = 'w', buffering: int = -1,
+                     compression: Optional[str] = None, compression_level: Optional[int] = None):
+    if output_format == 'copy_binary':
+        mode += 'b'
+    return open_output(path, mode, compression, compression_level, buffering=buffering)
+
+
+def write_copy_header(outfile, table_name: str, column_names: List[str], output_format: str) -> None:
+    if output_format == 'copy_binary':
+        outfile.write(BINARY_HEADER)
+    elif output_format != 'insert':
+        outfile.write(copy_statement(table_name, column_names, output_format))
 
-        with open(output_sql_path, 'w', encoding='utf-8') as sqlfile:
-            sqlfile.write(f"-- INSERT statements for {table_name}\n")
-            sqlfile.write(f"-- Generated from: {os.path.basename(csv_file_path)}\n")
-            sqlfile.write(f"-- Total rows: {len(rows)}\n\n")
 
-            for i in range(0, len(rows), batch_size):
-                batch = rows[i:i + batch_size]
-                insert_sql = _generate_insert_statement(
-                    table_name,
-                    column_names,
-                    batch,
-                    schema_info
-                )
-                sqlfile.write(insert_sql)
-                sqlfile.write("\n\n")
+def write_copy_trailer(outfile, output_format: str) -> None:
+    if output_format == 'copy_binary':
+        outfile.write(BINARY_TRAILER)
+    elif output_format != 'insert':
+        outfile.write("\\.\n\n")
 
-    print(f"Generated INSERT statements: {output_sql_path}")
+
+def write_rows(outfile, table_name: str, column_names: List[str], rows: Iterable[Sequence],
+               output_format: str = 'insert', batch_size: int = 100,
+               schema_info: Optional[Dict] = None) -> int:
+    """Write rows in the given output format, without COPY header/trailer; returns the row count."""
+    if output_format == 'copy_text':
+        return write_copy_text_rows(outfile, rows)
+    if output_format == 'copy_csv':
+        return write_copy_csv_rows(outfile, rows)
+    if output_format == 'copy_binary':
+        return write_copy_binary_rows(outfile, table_name, column_names, rows, schema_info)
+    return write_insert_statements(outfile, table_name, column_names, rows, batch_size, schema_info)
+
+
+def write_insert_statements(sqlfile, table_name: str, column_names: List[str], rows: Iterable[Sequence],
+                            batch_size: int = 100, schema_info: Optional[Dict] = None) -> int:
+    """Write rows (value sequences in column order) as batched INSERTs; returns the row count."""
+    rows = iter(rows)
+    row_count = 0
+    # Formatters are picked once per column, and every batch is assembled
+    # in the same buffer before being written out
+    formatters = get_sql_formatters(column_names, schema_info)
+    statement_start = f"INSERT INTO {table_name} ({', '.join(column_names)})\nVALUES\n"
+    buffer = io.StringIO()
+
+    while True:
+        batch = list(islice(rows, batch_size))
+        if not batch:
+            break
+
+        buffer.seek(0)
+        buffer.truncate()
+        buffer.write(statement_start)
+        _write_value_rows(buffer, formatters, batch)
+        buffer.write("\n;\n\n")
+        sqlfile.write(buffer.getvalue())
+        row_count += len(batch)
+
+    return row_count
+
+
+def get_sql_formatters(column_names: List[str], schema_info: Optional[Dict] = None) -> List[Callable]:
+    """One function per column turning a value into its SQL literal."""
+    schema_info = schema_info or {}
+    return [_get_sql_formatter(schema_info.get(column_name)) for column_name in column_names]
+
+
+def _get_sql_formatter(col_type: Optional[str]) -> Callable:
+    col_type = col_type.upper() if col_type else ''
+    if any(t in col_type for t in ['INT', 'BIGINT', 'SMALLINT', 'DECIMAL', 'NUMERIC', 'FLOAT', 'REAL', 'DOUBLE']):
+        return _format_sql_number
+    # Dates, times and text are all quoted
+    return _format_sql_text
+
+
+def _format_sql_number(value) -> str:
+    if value == '' or value is None:
+        return 'NULL'
+    # Rows generated in memory may carry numbers instead of text
+    return str(value)
+
+
+def _format_sql_text(value) -> str:
+    if value == '' or value is None:
+        return 'NULL'
+    return "'" + str(value).replace("'", "''") + "'"
+
+
+def _write_value_rows(buffer, formatters: List[Callable], rows: List[Sequence]) -> None:
+    separator = "    ("
+    for row in rows:
+        values = [formatter(value) for formatter, value in zip(formatters, row)]
+        # Fields missing from short CSV rows are NULL, so every row has a
+        # value per column; extra fields are dropped
+        if len(values) < len(formatters):
+            values.extend(['NULL'] * (len(formatters) - len(values)))
+
+        buffer.write(separator)
+        buffer.write(', '.join(values))
+        buffer.write(")")
+        separator = ",\n    ("
 
 
 def csv_folder_to_dml(csv_folder_path: str, output_folder_path: str,
                       schema_csv_path: Optional[str] = None,
-                      batch_size: int = 100) -> List[str]:
+                      batch_size: int = 100, output_format: str = 'insert', jobs: Optional[int] = 1,
+                      split_size: Optional[int] = None, part_files: bool = False,
+                      compression: Optional[str] = None, compression_level: Optional[int] = None) -> List[str]:
+    """
+    Convert every data CSV of a folder, one task per file over up to jobs
+    worker processes (all CPUs if jobs is None).
+
+    CSV files larger than split_size bytes are also split into row-aligned
+    byte ranges converted in parallel; their rows must not hold quoted line
+    breaks. Every range is a separate run of batches, so no INSERT spans two
+    ranges. The ranges of a file are concatenated into one output file, or
+    with part_files=True written as ordered, self-contained part files
+    (table.part00001.sql, ...).
+
+    Compressed data CSVs (table.csv.gz, .csv.zst, .csv.lz4) are read as
+    they are, but never split. With compression, every output file is
+    compressed too and named with the codec's suffix (table.sql.gz).
+    """
+    check_output_format(output_format)
+    jobs = jobs or os.cpu_count() or 1
+    compression_extension = get_compression_extension(compression)
     if not os.path.exists(output_folder_path):
         os.makedirs(output_folder_path)
 
@@ -55,8 +224,9 @@ def csv_folder_to_dml(csv_folder_path: str, output_folder_path: str,
         schema_map = _load_schema_info(schema_csv_path)
 
     csv_files = []
-    for file in os.listdir(csv_folder_path):
-        if file.endswith('.csv') and file.lower() != 'schema.csv':
+    for file in sorted(os.listdir(csv_folder_path)):
+        csv_name = strip_compression_extension(file)
+        if csv_name.endswith('.csv') and csv_name.lower() != 'schema.csv':
             csv_files.append(file)
 
     if not csv_files:
@@ -64,34 +234,199 @@ def csv_folder_to_dml(csv_folder_path: str, output_folder_path: str,
         return []
 
     print(f"Found {len(csv_files)} CSV file(s) to convert:")
-    generated_files = []
+    extension = get_output_extension(output_format)
+    executor = ProcessPoolExecutor(max_workers=jobs) if jobs > 1 else None
+    conversions = []
+
+    try:
+        for csv_file in csv_files:
+            table_name = os.path.splitext(strip_compression_extension(csv_file))[0]
+
+            # Strip the shard suffix of part files (table.part00001) and the
+            # sequence suffix added when a file name was taken (table1)
+            table_name = re.sub(r'\.part\d+$', '', table_name)
+            table_name = re.sub(r'\d+$', '', table_name)
+
+            csv_path = os.path.join(csv_folder_path, csv_file)
+            # Convert table name to snake_case for SQL filename
+            snake_case_name = _to_snake_case(os.path.splitext(strip_compression_extension(csv_file))[0])
+            sql_path = os.path.join(output_folder_path, f"{snake_case_name}{extension}{compression_extension}")
+
+            table_schema = schema_map.get(table_name, {})
+            ranges = []
+            if split_size and detect_compression(csv_path) is None:
+                ranges = split_csv_ranges(csv_path, split_size)
+
+            if len(ranges) < 2:
+                print(f"  - Converting {csv_file} -> {os.path.basename(sql_path)}")
+                arguments = (csv_path, table_name, sql_path, batch_size, table_schema, output_format,
+                             compression, compression_level)
+                conversions.append(([sql_path], None, [_submit(executor, csv_to_dml, *arguments)]))
+                continue
+
+            print(f"  - Converting {csv_file} -> {os.path.basename(sql_path)} in {len(ranges)} parts")
+            column_names = _read_csv_header(csv_path)
+            if part_files:
+                out_paths = [
+                    os.path.join(output_folder_path,
+                                 f"{snake_case_name}.part{index:05d}{extension}{compression_extension}")
+                    for index in range(1, len(ranges) + 1)
+                ]
+            else:
+                out_paths = [f"{sql_path}.part{index:05d}.tmp" for index in range(1, len(ranges) + 1)]
+
+            futures = [
+                _submit(executor, _convert_csv_range, csv_path, start, end, column_names, table_name,
+                        out_path, batch_size, table_schema, output_format, part_files, compression,
+                        compression_level)
+                for (start, end), out_path in zip(ranges, out_paths)
+            ]
+            if part_files:
+                conversions.append((out_paths, None, futures))
+            else:
+                merge = (csv_path, table_name, column_names, sql_path, out_paths, compression, compression_level)
+                conversions.append(([sql_path], merge, futures))
+
+        generated_files = []
+        for paths, merge, futures in conversions:
+            row_counts = [future.result() for future in futures]
+            if merge:
+                _merge_dml_parts(*merge, row_count=sum(row_counts), output_format=output_format)
+            generated_files.extend(paths)
+    finally:
+        if executor:
+            executor.shutdown()
 
-    for csv_file in csv_files:
-        table_name = os.path.splitext(csv_file)[0]
+    print(f"\nSuccessfully generated {len(generated_files)} DML file(s)")
+    return generated_files
 
-        table_name = re.sub(r'\d+$', '', table_name)
 
-        csv_path = os.path.join(csv_folder_path, csv_file)
-        # Convert table name to snake_case for SQL filename
-        snake_case_name = _to_snake_case(os.path.splitext(csv_file)[0])
-        sql_file = f"{snake_case_name}.sql"
-        sql_path = os.path.join(output_folder_path, sql_file)
+class _Done():
+    # Result holder for tasks run in the calling process
+    def __init__(self, value):
+        self.value = value
 
-        print(f"  - Converting {csv_file} -> {sql_file}")
+    def result(self):
+        return self.value
 
-        table_schema = schema_map.get(table_name, {})
 
-        csv_to_dml(csv_path, table_name, sql_path, batch_size, table_schema)
-        generated_files.append(sql_path)
+def _submit(executor, function, *args):
+    if executor is None:
+        return _Done(function(*args))
+    return executor.submit(function, *args)
 
-    print(f"\nSuccessfully generated {len(generated_files)} DML file(s)")
-    return generated_files
+
+def _read_csv_header(csv_path: str) -> List[str]:
+    with open_input(csv_path, 'r', encoding='utf-8', newline='') as csvfile:
+        return next(csv.reader(csvfile), [])
+
+
+def split_csv_ranges(csv_path: str, split_size: int) -> List[tuple]:
+    """
+    Split the rows of a CSV file (after its header) into (start, end) byte
+    ranges of about split_size bytes, each starting at a line start. The
+    file must not be compressed.
+    """
+    file_size = os.path.getsize(csv_path)
+    with open(csv_path, 'rb') as f:
+        f.readline()
+        offsets = [f.tell()]
+
+        while offsets[-1] + split_size < file_size:
+            f.seek(offsets[-1] + split_size)
+            f.readline()
+            if f.tell() >= file_size:
+                break
+            offsets.append(f.tell())
+
+    if offsets[0] >= file_size:
+        return []
+
+    return list(zip(offsets, offsets[1:] + [file_size]))
+
+
+def _read_csv_range(csv_path: str, start: int, end: int) -> Iterable[List[str]]:
+    with open(csv_path, 'rb', buffering=IO_BUFFER_SIZE) as f:
+        f.seek(start)
+        position = start
+
+        def lines():
+            nonlocal position
+            while position < end:
+                line = f.readline()
+                if not line:
+                    return
+                position += len(line)
+                yield line.decode('utf-8')
+
+        yield from csv.reader(lines())
+
+
+def _convert_csv_range(csv_path: str, start: int, end: int, column_names: List[str], table_name: str,
+                       out_path: str, batch_size: int, schema_info: Optional[Dict], output_format: str,
+                       standalone: bool, compression: Optional[str] = None,
+                       compression_level: Optional[int] = None) -> int:
+    # Standalone parts are complete scripts; other parts only hold rows,
+    # to be put between one header and trailer by _merge_dml_parts
+    with open_output_file(out_path, output_format, buffering=IO_BUFFER_SIZE, compression=compression,
+                          compression_level=compression_level) as outfile:
+        if standalone and output_format != 'copy_binary':
+            outfile.write(f"-- {describe_output_format(output_format)} for {table_name}\n")
+            outfile.write(f"-- Generated from: {os.path.basename(csv_path)}, bytes {start}-{end}\n\n")
+        if standalone:
+            write_copy_header(outfile, table_name, column_names, output_format)
+
+        row_count = write_rows(outfile, table_name, column_names, _read_csv_range(csv_path, start, end),
+                               output_format, batch_size, schema_info)
+
+        if standalone:
+            write_copy_trailer(outfile, output_format)
+            if output_format != 'copy_binary':
+                outfile.write(f"-- Total rows: {row_count}\n")
+
+    return row_count
+
+
+def _merge_dml_parts(csv_path: str, table_name: str, column_names: List[str], sql_path: str,
+                     part_paths: List[str], compression: Optional[str], compression_level: Optional[int],
+                     row_count: int, output_format: str) -> None:
+    # Parts are compressed by the workers that wrote them; compressed
+    # members concatenate like plain text, so they are appended as bytes
+    # between a header and a trailer written (and compressed) here
+    with open_output_file(sql_path, output_format, compression=compression,
+                          compression_level=compression_level) as sqlfile:
+        if output_format != 'copy_binary':
+            sqlfile.write(f"-- {describe_output_format(output_format)} for {table_name}\n")
+            sqlfile.write(f"-- Generated from: {os.path.basename(csv_path)}\n\n")
+        write_copy_header(sqlfile, table_name, column_names, output_format)
+
+    with open(sql_path, 'ab') as sqlfile:
+        for part_path in part_paths:
+            with open(part_path, 'rb') as part_file:
+                shutil.copyfileobj(part_file, sqlfile, IO_BUFFER_SIZE)
+            os.remove(part_path)
+
+    with open_output_file(sql_path, output_format, 'a', compression=compression,
+                          compression_level=compression_level) as sqlfile:
+        write_copy_trailer(sqlfile, output_format)
+        if output_format != 'copy_binary':
+            sqlfile.write(f"-- Total rows: {row_count}\n")
+
+    print(f"Generated {describe_output_format(output_format)}: {sql_path}")
+
+
+def schema_info_from_tables(tables: List) -> Dict[str, Dict[str, str]]:
+    # Same mapping as _load_schema_info, built from already loaded Table objects
+    return {
+        table.table_name: {column['column']: column['type'].upper() for column in table.columns}
+        for table in tables
+    }
 
 
 def _load_schema_info(schema_csv_path: str) -> Dict[str, Dict[str, str]]:
     schema_map = {}
 
-    with open(schema_csv_path, 'r', encoding='utf-8') as csvfile:
+    with open_input(schema_csv_path, 'r', encoding='utf-8', newline='') as csvfile:
         reader = csv.DictReader(csvfile)
         for row in reader:
             table_name = row['table_name']
@@ -107,44 +442,13 @@ def _load_schema_info(schema_csv_path: str) -> Dict[str, Dict[str, str]]:
 
 
 def _generate_insert_statement(table_name: str, column_names: List[str],
-                               rows: List[Dict], schema_info: Optional[Dict] = None) -> str:
-    columns_str = ', '.join(column_names)
-    sql_parts = [f"INSERT INTO {table_name} ({columns_str})"]
-    sql_parts.append("VALUES")
-
-    value_rows = []
-    for row in rows:
-        values = []
-        for col_name in column_names:
-            value = row.get(col_name, '')
-            formatted_value = _format_sql_value(value, col_name, schema_info)
-            values.append(formatted_value)
-
-        values_str = ', '.join(values)
-        value_rows.append(f"    ({values_str})")
-
-    sql_parts.append(',\n'.join(value_rows))
-    sql_parts.append(";")
-
-    return '\n'.join(sql_parts)
+                               rows: List[Sequence], schema_info: Optional[Dict] = None) -> str:
+    buffer = io.StringIO()
+    buffer.write(f"INSERT INTO {table_name} ({', '.join(column_names)})\nVALUES\n")
+    _write_value_rows(buffer, get_sql_formatters(column_names, schema_info), rows)
+    buffer.write("\n;")
+    return buffer.getvalue()
 
 
 def _format_sql_value(value: str, column_name: str, schema_info: Optional[Dict] = None) -> str:
-    if value == '' or value is None:
-        return 'NULL'
-
-    col_type = None
-    if schema_info and column_name in schema_info:
-        col_type = schema_info[column_name].upper()
-
-    if col_type:
-        if any(t in col_type for t in ['INT', 'BIGINT', 'SMALLINT', 'DECIMAL', 'NUMERIC', 'FLOAT', 'REAL', 'DOUBLE']):
-            return str(value)
-
-    if col_type:
-        if any(t in col_type for t in ['DATE', 'TIME', 'TIMESTAMP']):
-            escaped_value = value.replace("'", "''")
-            return f"'{escaped_value}'"
-
-    escaped_value = value.replace("'", "''")
-    return f"'{escaped_value}'"
+    return _get_sql_formatter((schema_info or {}).get(column_name))(value)
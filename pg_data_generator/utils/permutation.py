@@ -0,0 +1,64 @@
+import hashlib
+
+import numpy as np
+
+ROUNDS = 6
+MIX_1 = 0x9E3779B97F4A7C15
+MIX_2 = 0xBF58476D1CE4E5B9
+
+
+class Permutation():
+    """
+    Keyed bijection of [0, size), used to hand out unique values without retries.
+
+    A balanced Feistel network permutes the smallest even-bit domain that
+    holds size; indexes that land outside [0, size) are walked along their
+    cycle until they come back in (cycle-walking). Since the domain is less
+    than 4 * size, that takes fewer than 4 steps on average. The same key
+    always gives the same permutation.
+    """
+
+    def __init__(self, size, key):
+        if size <= 0:
+            raise ValueError(f'Permutation size must be a positive integer, got {size}')
+
+        self.size = size
+        bits = max(2, (size - 1).bit_length())
+        self.half_bits = (bits + bits % 2) // 2
+        self.half_mask = (1 << self.half_bits) - 1
+
+        digest = hashlib.blake2b(repr(key).encode('utf-8'), digest_size=8 * ROUNDS).digest()
+        self.round_keys = [int.from_bytes(digest[i * 8:(i + 1) * 8], 'little') for i in range(ROUNDS)]
+
+
+    def permute(self, indexes):
+        """Map indexes of [0, size) to distinct indexes of [0, size); returns a list."""
+        values = self._encrypt(np.asarray(indexes, dtype=np.uint64))
+        outside = values >= self.size
+        while outside.any():
+            values[outside] = self._encrypt(values[outside])
+            outside = values >= self.size
+
+        return values.tolist()
+
+
+    def _encrypt(self, values):
+        shift = np.uint64(self.half_bits)
+        mask = np.uint64(self.half_mask)
+        left = values >> shift
+        right = values & mask
+
+        for round_key in self.round_keys:
+            left, right = right, left ^ (self._mix(right, np.uint64(round_key)) & mask)
+
+        return (left << shift) | right
+
+
+    @staticmethod
+    def _mix(values, round_key):
+        # uint64 products wrap modulo 2**64
+        values = (values ^ round_key) * np.uint64(MIX_1)
+        values ^= values >> np.uint64(32)
+        values = values * np.uint64(MIX_2)
+        values ^= values >> np.uint64(29)
+        return values
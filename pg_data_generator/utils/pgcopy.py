@@ -0,0 +1,183 @@
+import csv
+import re
+import struct
+from datetime import date, datetime, timedelta
+from decimal import Decimal
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+# Binary COPY file layout, see the "Binary Format" section of the COPY docs
+BINARY_HEADER = b'PGCOPY\n\xff\r\n\x00' + struct.pack('!ii', 0, 0)
+BINARY_TRAILER = struct.pack('!h', -1)
+
+POSTGRES_EPOCH_DATE = date(2000, 1, 1)
+POSTGRES_EPOCH = datetime(2000, 1, 1)
+
+_NULL_FIELD = struct.pack('!i', -1)
+_INT2 = struct.Struct('!ih')
+_INT4 = struct.Struct('!ii')
+_INT8 = struct.Struct('!iq')
+_FLOAT4 = struct.Struct('!if')
+_FLOAT8 = struct.Struct('!id')
+_BOOL_TRUE = struct.pack('!i?', 1, True)
+_BOOL_FALSE = struct.pack('!i?', 1, False)
+
+_TEXT_ESCAPES = str.maketrans({'\\': '\\\\', '\t': '\\t', '\n': '\\n', '\r': '\\r'})
+
+
+def copy_statement(table_name: str, column_names: List[str], output_format: str) -> str:
+    """COPY ... FROM stdin statement for 'copy_text', 'copy_csv' or 'copy_binary' data."""
+    options = {
+        'copy_text': '',
+        'copy_csv': ' WITH (FORMAT csv)',
+        'copy_binary': ' WITH (FORMAT binary)'
+    }[output_format]
+    columns_str = ', '.join(column_names)
+    return f"COPY {table_name} ({columns_str}) FROM stdin{options};\n"
+
+
+def write_copy_text_rows(copyfile, rows: Iterable[Sequence]) -> int:
+    # Empty values are NULL, like in the INSERT output
+    row_count = 0
+    for row in rows:
+        copyfile.write('\t'.join(
+            '\\N' if value is None or value == '' else str(value).translate(_TEXT_ESCAPES)
+            for value in row
+        ))
+        copyfile.write('\n')
+        row_count += 1
+
+    return row_count
+
+
+def write_copy_csv_rows(copyfile, rows: Iterable[Sequence]) -> int:
+    # An unquoted empty field is NULL in COPY's CSV format
+    writer = csv.writer(copyfile, lineterminator='\n')
+    row_count = 0
+    for row in rows:
+        writer.writerow(row)
+        row_count += 1
+
+    return row_count
+
+
+def write_copy_binary_rows(copyfile, table_name: str, column_names: List[str], rows: Iterable[Sequence],
+                           schema_info: Optional[Dict] = None) -> int:
+    """Write rows as binary COPY tuples; copyfile must be opened in binary mode."""
+    encoders = get_binary_encoders(table_name, column_names, schema_info)
+    field_count = struct.pack('!h', len(column_names))
+    row_count = 0
+
+    for row in rows:
+        fields = [field_count]
+        for encode, value in zip(encoders, row):
+            if value is None or value == '':
+                fields.append(_NULL_FIELD)
+            else:
+                fields.append(encode(value))
+        copyfile.write(b''.join(fields))
+        row_count += 1
+
+    return row_count
+
+
+def get_binary_encoders(table_name: str, column_names: List[str],
+                        schema_info: Optional[Dict] = None) -> List[Callable]:
+    # Binary fields are typed, so unlike the text formats every column
+    # needs a known type
+    schema_info = schema_info or {}
+    encoders = []
+    for column_name in column_names:
+        if column_name not in schema_info:
+            raise ValueError(
+                f"Binary COPY needs the type of column '{column_name}' in table '{table_name}'"
+            )
+        encoders.append(_get_binary_encoder(column_name, schema_info[column_name]))
+
+    return encoders
+
+
+def _get_binary_encoder(column_name: str, column_type: str) -> Callable:
+    base_type = re.sub(r'\(.*\)', '', column_type).strip().upper()
+
+    if base_type in ['SMALLINT', 'INT2', 'SMALLSERIAL']:
+        return lambda value: _INT2.pack(2, int(value))
+    if base_type in ['INT', 'INTEGER', 'INT4', 'SERIAL']:
+        return lambda value: _INT4.pack(4, int(value))
+    if base_type in ['BIGINT', 'INT8', 'BIGSERIAL']:
+        return lambda value: _INT8.pack(8, int(value))
+    if base_type in ['REAL', 'FLOAT4']:
+        return lambda value: _FLOAT4.pack(4, float(value))
+    if base_type in ['FLOAT', 'FLOAT8', 'DOUBLE', 'DOUBLE PRECISION']:
+        return lambda value: _FLOAT8.pack(8, float(value))
+    if base_type in ['DECIMAL', 'NUMERIC']:
+        return _encode_numeric
+    if base_type == 'DATE':
+        return _encode_date
+    if base_type in ['DATETIME', 'TIMESTAMP', 'TIMESTAMP WITHOUT TIME ZONE']:
+        return _encode_timestamp
+    if base_type in ['BOOLEAN', 'BOOL']:
+        return _encode_boolean
+    if base_type in ['CHAR', 'CHARACTER', 'VARCHAR', 'CHARACTER VARYING', 'TEXT', 'BPCHAR']:
+        return _encode_text
+
+    raise ValueError(f"Binary COPY does not support type '{column_type}' of column '{column_name}'")
+
+
+def _encode_text(value) -> bytes:
+    data = str(value).encode('utf-8')
+    return struct.pack('!i', len(data)) + data
+
+
+def _encode_boolean(value) -> bytes:
+    text = str(value).strip().lower()
+    if text in ['true', 't', '1', 'yes', 'y']:
+        return _BOOL_TRUE
+    if text in ['false', 'f', '0', 'no', 'n']:
+        return _BOOL_FALSE
+    raise ValueError(f"Invalid boolean value: {value}")
+
+
+def _encode_date(value) -> bytes:
+    days = (date.fromisoformat(str(value)[:10]) - POSTGRES_EPOCH_DATE).days
+    return _INT4.pack(4, days)
+
+
+def _encode_timestamp(value) -> bytes:
+    microseconds = (datetime.fromisoformat(str(value)) - POSTGRES_EPOCH) // timedelta(microseconds=1)
+    return _INT8.pack(8, microseconds)
+
+
+def _encode_numeric(value) -> bytes:
+    # numeric is sent as base-10000 digits with a weight (position of the
+    # first digit relative to the decimal point) and a display scale
+    number = Decimal(str(value))
+    if not number.is_finite():
+        raise ValueError(f"Invalid numeric value: {value}")
+
+    sign, digits, exponent = number.as_tuple()
+    text = ''.join(map(str, digits))
+    if exponent > 0:
+        text += '0' * exponent
+        exponent = 0
+    scale = -exponent
+
+    text = text.rjust(scale, '0')
+    integer_part = text[:len(text) - scale] if scale else text
+    fraction_part = text[len(text) - scale:] if scale else ''
+
+    integer_part = integer_part.rjust(-(-len(integer_part) // 4) * 4, '0')
+    fraction_part = fraction_part.ljust(-(-len(fraction_part) // 4) * 4, '0')
+    groups = [int(integer_part[i:i + 4]) for i in range(0, len(integer_part), 4)]
+    weight = len(groups) - 1
+    groups += [int(fraction_part[i:i + 4]) for i in range(0, len(fraction_part), 4)]
+
+    while groups and groups[0] == 0:
+        groups.pop(0)
+        weight -= 1
+    while groups and groups[-1] == 0:
+        groups.pop()
+    if not groups:
+        weight, sign = 0, 0
+
+    data = struct.pack(f'!hhhh{len(groups)}H', len(groups), weight, 0x4000 if sign else 0, scale, *groups)
+    return struct.pack('!i', len(data)) + data
@@ -0,0 +1,240 @@
+import re
+from typing import Iterable, Iterator, List, Optional, Tuple
+
+from pg_data_generator.utils.compressed_io import open_input
+
+# Text is read and tokenized in chunks of this many characters, so memory
+# stays flat however large the file is
+CHUNK_SIZE = 1 << 20
+
+WORD = 'word'
+QUOTED = 'quoted'
+STRING = 'string'
+NUMBER = 'number'
+PUNCT = 'punct'
+OTHER = 'other'
+
+Token = Tuple[str, str]
+
+_IDENTIFIER = r'(?:[A-Za-z_]|[^\x00-\x7f])(?:[A-Za-z_0-9$]|[^\x00-\x7f])*'
+
+TOKEN_PATTERN = re.compile(r'''
+      (?P<space>\s+)
+    | (?P<line_comment>--[^\n]*)
+    | (?P<block_comment>/\*)
+    | (?P<meta>\\[^\n]*)
+    | (?P<escape_string>[Ee]'(?:[^'\\]|\\.|'')*')
+    | (?P<string>[BbXxNn]?'(?:[^']|'')*')
+    | (?P<dollar_string>\$(?P<tag>(?:''' + _IDENTIFIER + r''')?)\$.*?\$(?P=tag)\$)
+    | (?P<double_quoted>"(?:[^"]|"")*")
+    | (?P<back_quoted>`[^`]*`)
+    | (?P<bracket_quoted>\[[A-Za-z_][^\]\n]*\])
+    | (?P<unterminated>[EeBbXxNn]?'|"|`|\$(?:''' + _IDENTIFIER + r''')?\$|\[[A-Za-z_][^\]\n]*\Z)
+    | (?P<word>''' + _IDENTIFIER + r''')
+    | (?P<number>\d+(?:\.\d*)?(?:[eE][+-]?\d+)?|\.\d+)
+    | (?P<punct>::|[(),;.\[\]])
+    | (?P<other>.)
+''', re.VERBOSE | re.DOTALL)
+
+# Text of statements that are not kept: anything up to a character that
+# may start a comment, a quoted token or the end of the statement
+SKIP_PATTERN = re.compile(r'''(?:[^;'"`\[$/\\\-Ee]|[Ee](?!')|-(?!-)|/(?!\*))+''')
+
+COMMENT_DELIMITER_PATTERN = re.compile(r'/\*|\*/')
+
+# pg_dump data of COPY ... FROM stdin ends with a line holding only \.
+COPY_END_PATTERN = re.compile(r'\n\\\.[ \t]*\r?(?:\n|$)')
+
+_SKIPPED_KINDS = ('space', 'line_comment', 'meta')
+_TOKEN_KINDS = {
+    'escape_string': STRING,
+    'string': STRING,
+    'dollar_string': STRING,
+    'double_quoted': QUOTED,
+    'back_quoted': QUOTED,
+    'bracket_quoted': QUOTED,
+    'word': WORD,
+    'number': NUMBER,
+    'punct': PUNCT,
+    'other': OTHER,
+}
+
+
+def read_sql_chunks(file_path: str, chunk_size: int = CHUNK_SIZE) -> Iterator[str]:
+    # Compressed files (e.g. schema.sql.gz) are decompressed on the fly
+    with open_input(file_path, 'r', encoding='utf-8') as f:
+        while True:
+            chunk = f.read(chunk_size)
+            if not chunk:
+                return
+            yield chunk
+
+
+def unquote_identifier(text: str) -> str:
+    if text[0] == '"':
+        return text[1:-1].replace('""', '"')
+    return text[1:-1]
+
+
+class SqlTokenizer():
+    """
+    Single-pass tokenizer over SQL text given in chunks.
+
+    Comments (nested block comments too), whitespace and psql meta-commands
+    are dropped. String constants (standard, E'' and dollar-quoted) and
+    quoted identifiers are single tokens, so a ';' or parenthesis inside
+    them never ends a statement. Data blocks of pg_dump's COPY ... FROM
+    stdin are skipped without tokenizing them.
+    """
+
+    def __init__(self, chunks: Iterable[str]):
+        self._chunks = iter(chunks)
+        self._buffer = ''
+        self._pos = 0
+        self._eof = False
+
+
+    def statements(self, first_words: Optional[Iterable[str]] = None) -> Iterator[List[Token]]:
+        """
+        Yield the tokens of each statement, without its ';'.
+
+        With first_words, only statements starting with one of these
+        (upper case) keywords are yielded; the text of any other statement
+        is scanned past without building tokens.
+        """
+        first_words = set(first_words) if first_words is not None else None
+        tokens = []
+        keep = True
+        skipping = False
+
+        while True:
+            token = self._next_token(skipping)
+            if token is None:
+                if tokens and keep:
+                    yield tokens
+                return
+
+            if token == (PUNCT, ';'):
+                if tokens and keep:
+                    yield tokens
+                if tokens and self._is_copy_from_stdin(tokens):
+                    self._skip_copy_data()
+                tokens = []
+                skipping = False
+                continue
+
+            if skipping:
+                continue
+
+            if not tokens:
+                first_word = token[1].upper() if token[0] == WORD else None
+                keep = first_words is None or first_word in first_words
+                # COPY statements are always read, to find their data
+                if not keep and first_word != 'COPY':
+                    skipping = True
+                    continue
+
+            tokens.append(token)
+
+
+    @staticmethod
+    def _is_copy_from_stdin(tokens: List[Token]) -> bool:
+        if tokens[0][0] != WORD or tokens[0][1].upper() != 'COPY':
+            return False
+        for index in range(len(tokens) - 1):
+            if tokens[index][0] == WORD and tokens[index][1].upper() == 'FROM' and \
+                    tokens[index + 1][0] == WORD and tokens[index + 1][1].upper() == 'STDIN':
+                return True
+        return False
+
+
+    def _fill(self) -> bool:
+        # Read the next chunk after the unread text. False once there is
+        # nothing more to read.
+        if self._eof:
+            return False
+
+        chunk = next(self._chunks, None)
+        if chunk is None:
+            self._eof = True
+        else:
+            self._buffer = self._buffer[self._pos:] + chunk
+            self._pos = 0
+        return True
+
+
+    def _next_token(self, skipping: bool = False) -> Optional[Token]:
+        while True:
+            buffer, pos = self._buffer, self._pos
+            if pos >= len(buffer):
+                if not self._fill():
+                    return None
+                continue
+
+            if skipping:
+                match = SKIP_PATTERN.match(buffer, pos)
+                if match:
+                    end = match.end()
+                    if end == len(buffer) and not self._eof:
+                        # The last character may start a comment or string
+                        # continued in the next chunk
+                        end -= 1
+                    if end > pos:
+                        self._pos = end
+                        continue
+                    self._fill()
+                    continue
+
+            match = TOKEN_PATTERN.match(buffer, pos)
+            kind = match.lastgroup
+
+            if kind == 'unterminated' or (match.end() >= len(buffer) - 1 and kind != 'space'):
+                # The token may go on in the next chunk (a quoted token
+                # when the next character is a doubled quote)
+                if self._fill():
+                    continue
+                if kind == 'unterminated':
+                    raise ValueError(f"Unterminated quoted text in SQL: {buffer[pos:pos + 40]!r}")
+
+            if kind == 'block_comment':
+                end = self._find_comment_end(pos)
+                if end is None:
+                    if self._fill():
+                        continue
+                    raise ValueError(f"Unterminated comment in SQL: {buffer[pos:pos + 40]!r}")
+                self._pos = end
+                continue
+
+            self._pos = match.end()
+            if kind in _SKIPPED_KINDS:
+                continue
+
+            value = match.group()
+            token_kind = _TOKEN_KINDS[kind]
+            if token_kind == QUOTED:
+                value = unquote_identifier(value)
+            return token_kind, value
+
+
+    def _find_comment_end(self, start: int) -> Optional[int]:
+        # Block comments nest in PostgreSQL
+        depth = 0
+        for match in COMMENT_DELIMITER_PATTERN.finditer(self._buffer, start):
+            depth += 1 if match.group() == '/*' else -1
+            if depth == 0:
+                return match.end()
+        return None
+
+
+    def _skip_copy_data(self) -> None:
+        while True:
+            match = COPY_END_PATTERN.search(self._buffer, self._pos)
+            if match and (match.end() < len(self._buffer) or self._eof):
+                self._pos = match.end()
+                return
+
+            # Keep the tail that may hold the start of the end marker
+            self._pos = max(self._pos, match.start() if match else len(self._buffer) - 4)
+            if not self._fill():
+                self._pos = len(self._buffer)
+                return
@@ -0,0 +1,44 @@
+import json
+import os
+
+import numpy as np
+
+USERNAME_FILE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'cases', 'username.json')
+
+# Process-wide cache of the bundled word lists. Lists are loaded on first
+# use and kept as fixed-width string arrays, which hold no per-item Python
+# objects: workers forked after preload_word_lists() share the pages
+# without copying them.
+_loaders = dict()
+_word_lists = dict()
+
+
+def _load_usernames():
+    with open(USERNAME_FILE, 'r') as file:
+        return json.load(file)['usernames']
+
+
+def register_word_list(name, words):
+    """Register a word list (a sequence, or a function returning one) under name."""
+    _loaders[name] = words if callable(words) else (lambda: words)
+    _word_lists.pop(name, None)
+
+
+def get_word_list(name):
+    words = _word_lists.get(name)
+    if words is None:
+        if name not in _loaders:
+            raise KeyError(f"Unknown word list '{name}'")
+
+        words = np.array(list(_loaders[name]()), dtype=str)
+        _word_lists[name] = words
+
+    return words
+
+
+def preload_word_lists():
+    for name in _loaders:
+        get_word_list(name)
+
+
+register_word_list('usernames', _load_usernames)
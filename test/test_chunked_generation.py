@@ -0,0 +1,75 @@
+from pg_data_generator.main import generate_data
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
+import pandas as pd
+import os
+import shutil
+import tempfile
+
+DDL = """
+CREATE TABLE MST_PARENT (
+    id INT PRIMARY KEY,
+    parent_code VARCHAR(6),
+    trade_start DATE,
+    trade_end DATE
+);
+
+CREATE TABLE MST_CHILD (
+    id INT PRIMARY KEY,
+    parent_id INT REFERENCES MST_PARENT(id),
+    amount INT
+);
+"""
+
+
+def _generate(row_count, chunk_size):
+    output_dir = tempfile.mkdtemp(prefix='pg_chunk_test_')
+    schema_path = os.path.join(output_dir, 'schema.csv')
+    ddl_string_to_csv(DDL, schema_path)
+
+    try:
+        generate_data(schema_path, row_count=row_count, output_dir=output_dir, chunk_size=chunk_size)
+
+        df_parent = pd.read_csv(os.path.join(output_dir, 'MST_PARENT.csv'), dtype=str)
+        df_child = pd.read_csv(os.path.join(output_dir, 'MST_CHILD.csv'), dtype=str)
+        return df_parent, df_child
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_chunked_generation_is_consistent_across_chunks():
+    print("=" * 60)
+    print("CHUNKED GENERATION TEST")
+    print("=" * 60)
+
+    df_parent, df_child = _generate(row_count=23, chunk_size=5)
+
+    # One header, all rows appended
+    assert len(df_parent) == 23
+    assert len(df_child) == 23
+
+    # PK and code sequences continue across chunk boundaries
+    assert df_parent['id'].tolist() == [str(i) for i in range(1, 24)]
+    assert df_child['id'].tolist() == [str(i) for i in range(1, 24)]
+    assert df_parent['parent_code'].tolist() == [str(i).zfill(6) for i in range(1, 24)]
+
+    # FK values reference rows generated in any chunk of the parent
+    assert set(df_child['parent_id']).issubset(set(df_parent['id']))
+
+    # Date pairs stay row-aligned
+    assert (df_parent['trade_start'] < df_parent['trade_end']).all()
+
+    print("✅ Chunked generation is consistent")
+
+
+def test_invalid_chunk_size():
+    try:
+        _generate(row_count=5, chunk_size=0)
+    except ValueError as e:
+        print(f"✅ Rejected invalid chunk size: {e}")
+    else:
+        raise AssertionError('chunk_size=0 should be rejected')
+
+
+if __name__ == '__main__':
+    test_chunked_generation_is_consistent_across_chunks()
+    test_invalid_chunk_size()
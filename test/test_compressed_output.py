@@ -0,0 +1,141 @@
+from pg_data_generator.main import generate_data
+from pg_data_generator.utils.compressed_io import (
+    COMPRESSIONS, detect_compression, lz4_frame, open_input, open_output, zstandard
+)
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv, parse_ddl_file
+from pg_data_generator.utils.dml_converter import csv_folder_to_dml
+import csv
+import gzip
+import os
+import shutil
+import tempfile
+
+DDL = """
+CREATE TABLE MST_MEMBER (
+    id INT PRIMARY KEY,
+    name VARCHAR(20),
+    email VARCHAR(50)
+);
+
+CREATE TABLE TRN_VISIT (
+    id INT PRIMARY KEY,
+    member_ref INT REFERENCES MST_MEMBER(id),
+    visited_at DATETIME
+);
+"""
+
+# zstd and lz4 are optional dependencies
+AVAILABLE_COMPRESSIONS = ['gzip'] + (['zstd'] if zstandard else []) + (['lz4'] if lz4_frame else [])
+
+
+def _read_rows(path):
+    with open_input(path, 'r', newline='') as f:
+        return list(csv.reader(f))
+
+
+def _read_bytes(path):
+    with open_input(path, 'rb') as f:
+        return f.read()
+
+
+def test_appended_streams_read_as_one():
+    work_dir = tempfile.mkdtemp(prefix='pg_compression_test_')
+    try:
+        for compression in AVAILABLE_COMPRESSIONS:
+            path = os.path.join(work_dir, f'data.csv{COMPRESSIONS[compression]}')
+            with open_output(path, 'w', compression, newline='') as f:
+                f.write('id,name\n1,a\n')
+            with open_output(path, 'a', compression, level=1, newline='') as f:
+                f.write('2,b\n')
+            with open_output(path, 'ab', compression) as f:
+                f.write('3,ü\n'.encode('utf-8'))
+
+            assert detect_compression(path) == compression
+            assert _read_rows(path) == [['id', 'name'], ['1', 'a'], ['2', 'b'], ['3', 'ü']]
+
+        plain_path = os.path.join(work_dir, 'plain.csv')
+        with open_output(plain_path, 'w', newline='') as f:
+            f.write('id\n1\n')
+        assert detect_compression(plain_path) is None
+        assert _read_rows(plain_path) == [['id'], ['1']]
+
+        try:
+            open_output(plain_path, 'w', 'bz2')
+            assert False, 'unknown codec was accepted'
+        except ValueError:
+            pass
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_generated_files_are_compressed():
+    print("=" * 60)
+    print("COMPRESSED OUTPUT TEST")
+    print("=" * 60)
+
+    work_dir = tempfile.mkdtemp(prefix='pg_compression_test_')
+    try:
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        ddl_string_to_csv(DDL, schema_path)
+
+        for compression in AVAILABLE_COMPRESSIONS:
+            extension = COMPRESSIONS[compression]
+            data_dir = os.path.join(work_dir, f'data_{compression}')
+            generate_data(schema_path, row_count=300, output_dir=data_dir, chunk_size=40, jobs=2, shards=3,
+                          compression=compression)
+
+            assert sorted(os.listdir(data_dir)) == [f'MST_MEMBER.csv{extension}', f'TRN_VISIT.csv{extension}']
+            members = _read_rows(os.path.join(data_dir, f'MST_MEMBER.csv{extension}'))
+            visits = _read_rows(os.path.join(data_dir, f'TRN_VISIT.csv{extension}'))
+            assert members[0] == ['id', 'name', 'email']
+            assert [row[0] for row in members[1:]] == [str(i) for i in range(1, 301)]
+            assert {row[1] for row in visits[1:]}.issubset({row[0] for row in members[1:]})
+
+            # Compressed CSVs are read as they are, and split parts of plain
+            # CSVs are concatenated as compressed streams
+            for output_format in ['insert', 'copy_text', 'copy_binary']:
+                dml_dir = os.path.join(work_dir, f'dml_{compression}_{output_format}')
+                dml_files = csv_folder_to_dml(data_dir, dml_dir, schema_path, batch_size=50,
+                                              output_format=output_format, jobs=2, compression=compression)
+                suffix = ('.copy' if output_format == 'copy_binary' else '.sql') + extension
+                assert [os.path.basename(path) for path in dml_files] == [
+                    f'mst_member{suffix}', f'trn_visit{suffix}'
+                ]
+                for path in dml_files:
+                    assert detect_compression(path) == compression
+
+            sql = _read_bytes(os.path.join(work_dir, f'dml_{compression}_insert', f'mst_member.sql{extension}'))
+            assert sql.count(b'INSERT INTO MST_MEMBER') == 6
+            assert sql.endswith(b'-- Total rows: 300\n')
+
+        plain_dir = os.path.join(work_dir, 'plain')
+        generate_data(schema_path, row_count=2000, output_dir=plain_dir)
+        serial = csv_folder_to_dml(plain_dir, os.path.join(work_dir, 'serial'), schema_path,
+                                   output_format='copy_text')
+        split = csv_folder_to_dml(plain_dir, os.path.join(work_dir, 'split'), schema_path,
+                                  output_format='copy_text', jobs=2, split_size=5000, compression='gzip')
+        for serial_path, split_path in zip(serial, split):
+            assert _read_bytes(split_path) == _read_bytes(serial_path)
+
+        print("✅ Outputs are compressed and read back transparently")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_compressed_ddl_is_parsed():
+    work_dir = tempfile.mkdtemp(prefix='pg_compression_test_')
+    try:
+        ddl_path = os.path.join(work_dir, 'schema.sql.gz')
+        with gzip.open(ddl_path, 'wt', encoding='utf-8') as f:
+            f.write(DDL)
+
+        tables = parse_ddl_file(ddl_path)
+        assert [table['table_name'] for table in tables] == ['MST_MEMBER', 'TRN_VISIT']
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    test_appended_streams_read_as_one()
+    test_generated_files_are_compressed()
+    test_compressed_ddl_is_parsed()
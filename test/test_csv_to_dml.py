@@ -0,0 +1,173 @@
+from pg_data_generator.utils.dml_converter import (
+    csv_folder_to_dml, csv_to_dml, get_sql_formatters, split_csv_ranges, write_insert_statements
+)
+import io
+import os
+import shutil
+import tempfile
+import tracemalloc
+
+
+def _write_csv(path, row_count):
+    with open(path, 'w') as f:
+        f.write('id,name\n')
+        for i in range(1, row_count + 1):
+            f.write(f"{i},\"name {i}, O'Brien\"\n")
+
+
+def _peak_memory(csv_path, sql_path):
+    tracemalloc.start()
+    csv_to_dml(csv_path, 'MST_MEMBER', sql_path, batch_size=500, schema_info={'id': 'INT', 'name': 'VARCHAR(30)'})
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak
+
+
+def test_rows_are_streamed():
+    print("=" * 60)
+    print("CSV TO DML STREAMING TEST")
+    print("=" * 60)
+
+    work_dir = tempfile.mkdtemp(prefix='pg_csv_to_dml_test_')
+    try:
+        small_csv = os.path.join(work_dir, 'small.csv')
+        large_csv = os.path.join(work_dir, 'large.csv')
+        _write_csv(small_csv, 2000)
+        _write_csv(large_csv, 40000)
+
+        small_peak = _peak_memory(small_csv, os.path.join(work_dir, 'small.sql'))
+        large_peak = _peak_memory(large_csv, os.path.join(work_dir, 'large.sql'))
+        print(f"Peak memory: {small_peak / 2 ** 20:.1f} MiB for 2k rows, {large_peak / 2 ** 20:.1f} MiB for 40k rows")
+        # 20x the rows, about the same memory
+        assert large_peak < small_peak * 2
+
+        with open(os.path.join(work_dir, 'large.sql')) as f:
+            sql = f.read()
+        assert sql.startswith('-- INSERT statements for MST_MEMBER\n-- Generated from: large.csv\n')
+        assert sql.count('INSERT INTO MST_MEMBER (id, name)') == 80
+        assert "(40000, 'name 40000, O''Brien')\n;" in sql
+        assert sql.endswith('-- Total rows: 40000\n')
+
+        print("✅ Rows are converted in constant memory")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_empty_csv_writes_nothing():
+    work_dir = tempfile.mkdtemp(prefix='pg_csv_to_dml_test_')
+    try:
+        csv_path = os.path.join(work_dir, 'empty.csv')
+        with open(csv_path, 'w') as f:
+            f.write('id,name\n')
+
+        sql_path = os.path.join(work_dir, 'empty.sql')
+        csv_to_dml(csv_path, 'MST_MEMBER', sql_path)
+        assert not os.path.exists(sql_path)
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_formatters_are_compiled_per_column():
+    formatters = get_sql_formatters(['id', 'price', 'memo', 'unknown'],
+                                    {'id': 'bigint', 'price': 'DECIMAL(10,2)', 'memo': 'TEXT'})
+    assert [formatter(1) for formatter in formatters] == ['1', '1', "'1'", "'1'"]
+    assert [formatter('') for formatter in formatters] == ['NULL'] * 4
+    assert formatters[2]("O'Brien") == "'O''Brien'"
+
+    sqlfile = io.StringIO()
+    assert write_insert_statements(sqlfile, 'T', ['id', 'memo'], [(1, 'a'), (2, None), (3, "c'")], 2,
+                                   {'id': 'INT'}) == 3
+    assert sqlfile.getvalue() == (
+        "INSERT INTO T (id, memo)\nVALUES\n    (1, 'a'),\n    (2, NULL)\n;\n\n"
+        "INSERT INTO T (id, memo)\nVALUES\n    (3, 'c''')\n;\n\n"
+    )
+
+
+def test_short_rows_are_padded_with_null():
+    work_dir = tempfile.mkdtemp(prefix='pg_csv_to_dml_test_')
+    try:
+        csv_path = os.path.join(work_dir, 'short.csv')
+        sql_path = os.path.join(work_dir, 'short.sql')
+        with open(csv_path, 'w') as f:
+            f.write('id,name,memo\n1,a,x\n2,b\n3\n')
+
+        csv_to_dml(csv_path, 'T', sql_path, schema_info={'id': 'INT'})
+        with open(sql_path) as f:
+            sql = f.read()
+        # Missing trailing fields are NULL, as with the former DictReader
+        assert "    (1, 'a', 'x'),\n    (2, 'b', NULL),\n    (3, NULL, NULL)\n;" in sql
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_large_files_are_split_across_workers():
+    work_dir = tempfile.mkdtemp(prefix='pg_csv_to_dml_test_')
+    try:
+        csv_dir = os.path.join(work_dir, 'csv')
+        os.makedirs(csv_dir)
+        _write_csv(os.path.join(csv_dir, 'MST_MEMBER.csv'), 1000)
+        _write_csv(os.path.join(csv_dir, 'MST_SMALL.csv'), 3)
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        with open(schema_path, 'w') as f:
+            f.write('table_name,column,type,constraint,length,format\n')
+            for table_name in ['MST_MEMBER', 'MST_SMALL']:
+                f.write(f'{table_name},id,INT,pk,,\n{table_name},name,VARCHAR(30),,30,\n')
+
+        ranges = split_csv_ranges(os.path.join(csv_dir, 'MST_MEMBER.csv'), 5000)
+        assert len(ranges) > 3
+        assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+
+        for output_format in ['insert', 'copy_text', 'copy_binary']:
+            serial_dir = os.path.join(work_dir, f'serial_{output_format}')
+            split_dir = os.path.join(work_dir, f'split_{output_format}')
+            serial = csv_folder_to_dml(csv_dir, serial_dir, schema_path, batch_size=50, output_format=output_format)
+            split = csv_folder_to_dml(csv_dir, split_dir, schema_path, batch_size=50, output_format=output_format,
+                                      jobs=2, split_size=5000)
+            assert [os.path.basename(path) for path in split] == [os.path.basename(path) for path in serial]
+            assert sorted(os.listdir(split_dir)) == sorted(os.listdir(serial_dir))
+
+            for serial_path, split_path in zip(serial, split):
+                with open(serial_path, 'rb') as f:
+                    serial_data = f.read()
+                with open(split_path, 'rb') as f:
+                    split_data = f.read()
+                if output_format == 'insert':
+                    # The same rows, in batches that end at range boundaries
+                    assert split_data.count(b'\n    (') == serial_data.count(b'\n    (')
+                    assert split_data.endswith(serial_data[serial_data.rindex(b'-- Total rows'):])
+                else:
+                    assert split_data == serial_data
+
+        part_dir = os.path.join(work_dir, 'parts')
+        parts = csv_folder_to_dml(csv_dir, part_dir, batch_size=50, jobs=2, split_size=5000, part_files=True)
+        member_parts = [path for path in parts if 'mst_member' in path]
+        assert [os.path.basename(path) for path in member_parts] == [
+            f'mst_member.part{i:05d}.sql' for i in range(1, len(ranges) + 1)
+        ]
+
+        ids = []
+        for part in member_parts:
+            with open(part) as f:
+                sql = f.read()
+            assert sql.startswith('-- INSERT statements for MST_MEMBER')
+            for statement in sql.split('INSERT INTO')[1:]:
+                assert statement.count('\n    (') <= 50
+            ids += [int(line.split(',')[0].strip(" (')")) for line in sql.splitlines() if line.startswith('    (')]
+        assert ids == list(range(1, 1001))
+
+        # None uses every CPU, as in generate_data
+        all_cpu_dir = os.path.join(work_dir, 'all_cpus')
+        all_cpus = csv_folder_to_dml(csv_dir, all_cpu_dir, batch_size=50, jobs=None)
+        assert [os.path.basename(path) for path in all_cpus] == ['mst_member.sql', 'mst_small.sql']
+
+        print("✅ Large CSV files are converted in byte ranges")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    test_rows_are_streamed()
+    test_empty_csv_writes_nothing()
+    test_formatters_are_compiled_per_column()
+    test_short_rows_are_padded_with_null()
+    test_large_files_are_split_across_workers()
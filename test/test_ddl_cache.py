@@ -0,0 +1,132 @@
+from pg_data_generator.utils import ddl_converter
+from pg_data_generator.utils.ddl_cache import DdlCache, hash_ddl_file
+from pg_data_generator.utils.ddl_converter import PARSER_VERSION, parse_ddl_folder
+import os
+import shutil
+import tempfile
+
+PARENT_DDL = """
+CREATE TABLE MST_PARENT (
+    id INT PRIMARY KEY,
+    name VARCHAR(20)
+);
+"""
+
+CHILD_DDL = """
+CREATE TABLE MST_CHILD (
+    id INT PRIMARY KEY,
+    parent_id INT REFERENCES MST_PARENT(id)
+);
+"""
+
+
+def _write(folder, file_name, content):
+    with open(os.path.join(folder, file_name), 'w') as f:
+        f.write(content)
+
+
+def test_unchanged_files_are_read_from_cache():
+    print("=" * 60)
+    print("DDL CACHE TEST")
+    print("=" * 60)
+
+    work_dir = tempfile.mkdtemp(prefix='pg_ddl_cache_test_')
+    cache = tempfile.TemporaryDirectory(prefix='pg_ddl_cache_')
+    parse_ddl_file = ddl_converter.parse_ddl_file
+    try:
+        ddl_dir = os.path.join(work_dir, 'ddl')
+        cache_dir = cache.name
+        os.makedirs(ddl_dir)
+        _write(ddl_dir, 'b_child.sql', CHILD_DDL)
+        _write(ddl_dir, 'a_parent.sql', PARENT_DDL)
+
+        parsed = []
+
+        def counting_parse(path):
+            parsed.append(os.path.basename(path))
+            return parse_ddl_file(path)
+
+        ddl_converter.parse_ddl_file = counting_parse
+
+        first = parse_ddl_folder(ddl_dir, cache_dir=cache_dir)
+        assert [table['table_name'] for table in first] == ['MST_PARENT', 'MST_CHILD']
+        assert sorted(parsed) == ['a_parent.sql', 'b_child.sql']
+        assert len(os.listdir(cache_dir)) == 2
+
+        # Nothing changed: everything comes from the cache, FK tuples included
+        parsed.clear()
+        assert parse_ddl_folder(ddl_dir, cache_dir=cache_dir) == first
+        assert parsed == []
+
+        # Only the edited file is parsed again
+        _write(ddl_dir, 'b_child.sql', CHILD_DDL.replace('parent_id INT', 'parent_id BIGINT'))
+        second = parse_ddl_folder(ddl_dir, cache_dir=cache_dir)
+        assert parsed == ['b_child.sql']
+        assert second[1]['columns'][1]['type'] == 'BIGINT'
+        assert second[1]['columns'][1]['foreign_key'] == ('MST_PARENT', 'id')
+
+        # The cache is opt-in: without a directory every file is parsed
+        parsed.clear()
+        assert parse_ddl_folder(ddl_dir) == second
+        assert sorted(parsed) == ['a_parent.sql', 'b_child.sql']
+
+        print("✅ Unchanged DDL files are not parsed again")
+    finally:
+        ddl_converter.parse_ddl_file = parse_ddl_file
+        cache.cleanup()
+        shutil.rmtree(work_dir)
+
+
+def test_cache_evicts_least_recently_used_entries():
+    work_dir = tempfile.mkdtemp(prefix='pg_ddl_cache_test_')
+    try:
+        cache = DdlCache(work_dir, max_bytes=10 ** 6)
+        table = {'table_name': 'T', 'columns': [], 'foreign_keys': {}}
+        for key in ['a', 'b', 'c']:
+            cache.put(key, [table])
+        for key, mtime in [('a', 1), ('b', 2), ('c', 3)]:
+            os.utime(os.path.join(work_dir, f'{key}.json'), (mtime, mtime))
+
+        # Reading 'a' makes it the most recently used
+        assert cache.get('a') == [table]
+        entry_size = os.path.getsize(os.path.join(work_dir, 'a.json'))
+        cache.max_bytes = entry_size * 2
+        cache.evict()
+
+        assert sorted(os.listdir(work_dir)) == ['a.json', 'c.json']
+        assert cache.get('b') is None
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_cache_key_covers_parser_version():
+    work_dir = tempfile.mkdtemp(prefix='pg_ddl_cache_test_')
+    try:
+        path = os.path.join(work_dir, 'schema.sql')
+        _write(work_dir, 'schema.sql', PARENT_DDL)
+        assert hash_ddl_file(path, PARSER_VERSION) == hash_ddl_file(path, PARSER_VERSION)
+        assert hash_ddl_file(path, PARSER_VERSION) != hash_ddl_file(path, PARSER_VERSION + '.next')
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_parallel_parsing_matches_serial():
+    work_dir = tempfile.mkdtemp(prefix='pg_ddl_cache_test_')
+    try:
+        for i in range(4):
+            _write(work_dir, f'{i}.sql', PARENT_DDL.replace('MST_PARENT', f'MST_PARENT{i}'))
+
+        serial = parse_ddl_folder(work_dir, cache_dir=None)
+        assert parse_ddl_folder(work_dir, jobs=2, cache_dir=None) == serial
+        # None uses every CPU, as in generate_data
+        assert parse_ddl_folder(work_dir, jobs=None, cache_dir=None) == serial
+        assert [table['table_name'] for table in serial] == [f'MST_PARENT{i}' for i in range(4)]
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    test_unchanged_files_are_read_from_cache()
+    test_cache_evicts_least_recently_used_entries()
+    test_cache_key_covers_parser_version()
+    test_parallel_parsing_matches_serial()
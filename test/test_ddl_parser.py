@@ -0,0 +1,124 @@
+from pg_data_generator.utils.ddl_converter import parse_ddl_chunks, parse_ddl_string, tables_to_schema_rows
+from pg_data_generator.utils.sql_tokenizer import SqlTokenizer
+
+PG_DUMP = r"""
+--
+-- PostgreSQL database dump
+--
+\restrict abc123
+SET standard_conforming_strings = on;
+SELECT pg_catalog.set_config('search_path', '', false);
+
+CREATE FUNCTION public.touch() RETURNS trigger
+    LANGUAGE plpgsql
+    AS $_$ BEGIN NEW.note := 'CREATE TABLE fake (id int);'; RETURN NEW; END; $_$;
+
+/* a /* nested */ comment; CREATE TABLE hidden (id int); */
+CREATE TABLE public."Customer" (
+    id integer NOT NULL,
+    "Full Name" character varying(100) DEFAULT 'O''Brien, (Jr.); x'::character varying,
+    note text DEFAULT E'it\'s; fine',
+    balance numeric(12,2) CHECK ((balance > (0)::numeric)),
+    tags text[],
+    created_at timestamp(6) without time zone
+);
+
+CREATE TABLE public.orders (
+    id bigint NOT NULL,
+    customer_id integer,
+    amount double precision
+);
+
+COPY public."Customer" (id, "Full Name", note, balance, tags, created_at) FROM stdin;
+1	x;y	CREATE TABLE fake2 (id int);	1.00	{a}	2024-01-01 00:00:00
+\.
+
+ALTER TABLE ONLY public."Customer"
+    ADD CONSTRAINT "Customer_pkey" PRIMARY KEY (id);
+ALTER TABLE ONLY public.orders
+    ADD CONSTRAINT orders_pkey PRIMARY KEY (id);
+ALTER TABLE ONLY public.orders
+    ADD CONSTRAINT orders_customer_id_fkey FOREIGN KEY (customer_id) REFERENCES public."Customer"(id);
+"""
+
+
+def test_pg_dump_is_parsed():
+    print("=" * 60)
+    print("DDL PARSER TEST")
+    print("=" * 60)
+
+    tables = parse_ddl_string(PG_DUMP)
+    assert [table['table_name'] for table in tables] == ['Customer', 'orders']
+
+    customer = {col['name']: col for col in tables[0]['columns']}
+    assert list(customer) == ['id', 'Full Name', 'note', 'balance', 'tags', 'created_at']
+    assert customer['id']['is_primary_key']
+    assert customer['Full Name']['type'] == 'CHARACTER VARYING(100)'
+    assert customer['Full Name']['length'] == '100'
+    assert customer['balance']['type'] == 'NUMERIC(12,2)'
+    assert customer['tags']['type'] == 'TEXT[]'
+    assert customer['created_at']['type'] == 'TIMESTAMP WITHOUT TIME ZONE'
+
+    orders = {col['name']: col for col in tables[1]['columns']}
+    assert orders['id']['is_primary_key']
+    assert orders['amount']['type'] == 'DOUBLE PRECISION'
+    assert orders['customer_id']['foreign_key'] == ('Customer', 'id')
+    assert tables[1]['foreign_keys'] == {'customer_id': ('Customer', 'id')}
+
+    rows = tables_to_schema_rows(tables)
+    assert ['orders', 'customer_id', 'INTEGER', 'fk.Customer.id', '', ''] in rows
+
+    print("✅ pg_dump output parsed")
+
+
+def test_parsing_does_not_depend_on_chunking():
+    expected = parse_ddl_string(PG_DUMP)
+    for chunk_size in [1, 2, 3, 7, 64]:
+        chunks = [PG_DUMP[i:i + chunk_size] for i in range(0, len(PG_DUMP), chunk_size)]
+        assert parse_ddl_chunks(chunks) == expected, chunk_size
+
+    print("✅ Same tables for every chunk size")
+
+
+def test_table_constraints():
+    tables = parse_ddl_string("""
+        CREATE TABLE parent (a INT, b INT, PRIMARY KEY (a, b));
+        CREATE TABLE child (
+            id SERIAL PRIMARY KEY,
+            pa INT, pb INT,
+            solo INT REFERENCES parent,
+            CONSTRAINT child_parent FOREIGN KEY (pa, pb) REFERENCES parent (a, b),
+            CONSTRAINT child_check CHECK (pa <> pb),
+            UNIQUE (pa)
+        );
+        CREATE TABLE leaf (id INT REFERENCES child, c INT);
+    """)
+    parent, child, leaf = tables
+    assert [col['is_primary_key'] for col in parent['columns']] == [True, True]
+    # The columns of a composite key stay one constraint, named by its columns
+    assert child['foreign_keys'] == {'pa': ('parent', 'a', 'pa+pb'), 'pb': ('parent', 'b', 'pa+pb')}
+    assert [row[3] for row in tables_to_schema_rows(tables)[4:6]] == ['fk.parent.a.pa+pb', 'fk.parent.b.pa+pb']
+    # A bare REFERENCES needs a single-column primary key to point to
+    assert [col['name'] for col in child['columns']] == ['id', 'pa', 'pb', 'solo']
+    assert leaf['foreign_keys'] == {'id': ('child', 'id')}
+
+
+def test_statement_filter_skips_other_statements():
+    tokenizer = SqlTokenizer(["INSERT INTO t VALUES ('a;b', $$c;d$$); CREATE TABLE x (id int); -- ;\nSELECT 1"])
+    statements = list(tokenizer.statements(first_words=('CREATE',)))
+    assert statements == [[('word', 'CREATE'), ('word', 'TABLE'), ('word', 'x'), ('punct', '('),
+                           ('word', 'id'), ('word', 'int'), ('punct', ')')]]
+
+    try:
+        list(SqlTokenizer(["CREATE TABLE x (name text DEFAULT 'open"]).statements())
+    except ValueError as e:
+        assert 'Unterminated' in str(e)
+    else:
+        raise AssertionError('Unterminated strings should be rejected')
+
+
+if __name__ == '__main__':
+    test_pg_dump_is_parsed()
+    test_parsing_does_not_depend_on_chunking()
+    test_table_constraints()
+    test_statement_filter_skips_other_statements()
@@ -1,6 +1,34 @@
-from pg_data_generator.main import generate_data_from_ddl_folder
+from pg_data_generator.core.DataGenerator import DataGenerator, GENERATION_BLOCK_SIZE
+from pg_data_generator.main import generate_data, generate_data_from_ddl_folder
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
 import pandas as pd
 import os
+import shutil
+import tempfile
+
+SELF_REFERENCING_SCHEMA = """table_name,column,type,constraint,length,format
+EMP,id,int,pk,,
+EMP,emp_code,varchar(12),,12,
+EMP,manager_ref,int,fk.EMP.id,,
+EMP,mentor_code,varchar(12),fk.EMP.emp_code,12,
+EMP,hired_at,datetime,,,
+"""
+
+COMPOSITE_FK_DDL = """
+CREATE TABLE MST_BRANCH (
+    id INT PRIMARY KEY,
+    region_code VARCHAR(8),
+    branch_code VARCHAR(8),
+    UNIQUE (region_code, branch_code)
+);
+
+CREATE TABLE TRN_SALE (
+    id INT PRIMARY KEY,
+    region_ref VARCHAR(8),
+    branch_ref VARCHAR(8),
+    CONSTRAINT sale_branch FOREIGN KEY (region_ref, branch_ref) REFERENCES MST_BRANCH (region_code, branch_code)
+);
+"""
 
 
 def test_fk_enforcement():
@@ -68,5 +96,84 @@ def test_fk_enforcement():
         traceback.print_exc()
 
 
+def test_self_referencing_fk():
+    work_dir = tempfile.mkdtemp(prefix='pg_fk_test_')
+    try:
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        with open(schema_path, 'w') as f:
+            f.write(SELF_REFERENCING_SCHEMA)
+
+        for jobs in [1, 2]:
+            output_dir = os.path.join(work_dir, f'jobs_{jobs}')
+            generate_data(schema_path, row_count=5000, output_dir=output_dir, chunk_size=700, jobs=jobs, seed=3)
+
+            df_emp = pd.read_csv(os.path.join(output_dir, 'EMP.csv'), dtype=str)
+            assert df_emp['id'].tolist() == [str(i) for i in range(1, 5001)]
+            assert set(df_emp['manager_ref']).issubset(set(df_emp['id']))
+            assert set(df_emp['mentor_code'].dropna()).issubset(set(df_emp['emp_code']))
+
+        print("✅ Self-referencing FKs point to rows of the same table")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_self_referencing_fk_generates_each_block_once():
+    work_dir = tempfile.mkdtemp(prefix='pg_fk_test_')
+    generate_column_block = DataGenerator._generate_column_block
+    generated_blocks = list()
+
+    def counting_generate_column_block(self, table_name, column_plan, block_index, total, *args):
+        generated_blocks.append((column_plan.column_name, block_index))
+        return generate_column_block(self, table_name, column_plan, block_index, total, *args)
+
+    try:
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        with open(schema_path, 'w') as f:
+            f.write(SELF_REFERENCING_SCHEMA)
+
+        # Every chunk of FK values samples rows all over the table; the
+        # blocks those rows are in must not be generated again per chunk
+        block_count = 40
+        DataGenerator._generate_column_block = counting_generate_column_block
+        generate_data(schema_path, row_count=block_count * GENERATION_BLOCK_SIZE,
+                      output_dir=os.path.join(work_dir, 'output'), chunk_size=GENERATION_BLOCK_SIZE, seed=3)
+
+        emp_code_blocks = [block for block in generated_blocks if block[0] == 'emp_code']
+        # Once for the column itself and once for the rows mentor_code samples
+        assert len(emp_code_blocks) == 2 * block_count
+        assert len(set(emp_code_blocks)) == block_count
+
+        print("✅ Self-referencing FKs generate the rows they sample once")
+    finally:
+        DataGenerator._generate_column_block = generate_column_block
+        shutil.rmtree(work_dir)
+
+
+def test_composite_fk_references_one_parent_row():
+    work_dir = tempfile.mkdtemp(prefix='pg_fk_test_')
+    try:
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        ddl_string_to_csv(COMPOSITE_FK_DDL, schema_path)
+
+        for jobs in [1, 2]:
+            output_dir = os.path.join(work_dir, f'jobs_{jobs}')
+            generate_data(schema_path, row_count=3000, output_dir=output_dir, chunk_size=500, jobs=jobs, seed=5)
+
+            df_branch = pd.read_csv(os.path.join(output_dir, 'MST_BRANCH.csv'), dtype=str)
+            df_sale = pd.read_csv(os.path.join(output_dir, 'TRN_SALE.csv'), dtype=str)
+            branch_keys = set(zip(df_branch['region_code'], df_branch['branch_code']))
+            sale_keys = set(zip(df_sale['region_ref'], df_sale['branch_ref']))
+            # Each pair is one parent row's key, not two independent draws
+            assert sale_keys.issubset(branch_keys)
+            assert len(sale_keys) > 1000
+
+        print("✅ Composite FKs reference whole parent keys")
+    finally:
+        shutil.rmtree(work_dir)
+
+
 if __name__ == '__main__':
-    test_fk_enforcement()
\ No newline at end of file
+    test_fk_enforcement()
+    test_self_referencing_fk()
+    test_self_referencing_fk_generates_each_block_once()
+    test_composite_fk_references_one_parent_row()
\ No newline at end of file
@@ -0,0 +1,90 @@
+from pg_data_generator.core.Csv import Csv
+from pg_data_generator.core.DataGenerator import DataGenerator
+from pg_data_generator.core.Plan import ColumnPlan, GenerationPlan
+from pg_data_generator.cases.Decimal import Decimal
+from pg_data_generator.cases.Email import Email
+from pg_data_generator.cases.Optional import Optional
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
+import os
+import shutil
+import tempfile
+
+DDL = """
+CREATE TABLE MST_PARENT (
+    id INT PRIMARY KEY,
+    contact_email VARCHAR(50),
+    price DECIMAL(12,3)
+);
+
+CREATE TABLE MST_CHILD (
+    id INT PRIMARY KEY,
+    parent_id INT REFERENCES MST_PARENT(id),
+    status VARCHAR(1)
+);
+"""
+
+
+def _make_csv(ddl):
+    output_dir = tempfile.mkdtemp(prefix='pg_plan_test_')
+    schema_path = os.path.join(output_dir, 'schema.csv')
+    ddl_string_to_csv(ddl, schema_path)
+    return output_dir, Csv(schema_path, output_dir=output_dir)
+
+
+def test_columns_are_planned_once():
+    print("=" * 60)
+    print("GENERATION PLAN TEST")
+    print("=" * 60)
+
+    output_dir, csv = _make_csv(DDL)
+    try:
+        plan = DataGenerator(csv).get_plan()
+
+        parent = {column_plan.column_name: column_plan for column_plan in plan.get_columns('MST_PARENT')}
+        assert parent['id'].kind == ColumnPlan.PK
+        assert parent['contact_email'].case_class is Email
+        assert parent['price'].case_class is Decimal
+        assert parent['price'].params == {'precision': 12, 'scale': 3}
+
+        child = {column_plan.column_name: column_plan for column_plan in plan.get_columns('MST_CHILD')}
+        assert child['parent_id'].kind == ColumnPlan.FK
+        assert (child['parent_id'].referenced_table, child['parent_id'].referenced_column) == ('MST_PARENT', 'id')
+
+        # Generators of the same schema share the cached plan, which goes
+        # away with the schema
+        assert DataGenerator(csv).get_plan() is plan
+        assert GenerationPlan._cache[csv] is plan
+        cached_count = len(GenerationPlan._cache)
+        del csv
+        assert len(GenerationPlan._cache) == cached_count - 1
+
+        print("✅ Columns are resolved to generators once per schema")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_optional_options_are_parsed_in_the_plan():
+    column = {'column': 'status', 'type': 'varchar(1)', 'constraint': '', 'length': '1', 'format': '[A,B,C]'}
+    assert Optional.prepare(column) == {'options': ['A', 'B', 'C']}
+    assert set(Optional(20, column, params={'options': ['X']}).make_column()) == {'X'}
+
+
+def test_unsupported_columns_are_reported_before_generation():
+    output_dir, csv = _make_csv(DDL.replace('status VARCHAR(1)', 'created_at TIMESTAMP'))
+    try:
+        DataGenerator(csv).make_csv_for_tables(5)
+    except Exception as e:
+        assert 'created_at' in str(e)
+        # Nothing was written before the error
+        assert not [name for name in os.listdir(output_dir) if name != 'schema.csv']
+        print(f"✅ Rejected before generation: {e}")
+    else:
+        raise AssertionError('Unsupported columns should be rejected')
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    test_columns_are_planned_once()
+    test_optional_options_are_parsed_in_the_plan()
+    test_unsupported_columns_are_reported_before_generation()
@@ -0,0 +1,114 @@
+from pg_data_generator.main import generate_data
+from pg_data_generator.core.Csv import Csv
+from pg_data_generator.core.Fk_handler import FKHandler
+from pg_data_generator.metadata.Column import Column
+from pg_data_generator.metadata.Table import Table
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
+import pandas as pd
+import os
+import shutil
+import tempfile
+
+DDL = """
+CREATE TABLE MST_REGION (
+    id INT PRIMARY KEY,
+    region_code VARCHAR(4)
+);
+
+CREATE TABLE MST_STORE (
+    id INT PRIMARY KEY,
+    region_id INT REFERENCES MST_REGION(id),
+    opened_at DATETIME
+);
+
+CREATE TABLE TRN_SALE (
+    id INT PRIMARY KEY,
+    store_id INT REFERENCES MST_STORE(id),
+    region_id INT REFERENCES MST_REGION(id),
+    amount INT
+);
+
+CREATE TABLE MST_CURRENCY (
+    id INT PRIMARY KEY,
+    currency_code VARCHAR(3)
+);
+"""
+
+
+def test_generation_levels():
+    output_dir = tempfile.mkdtemp(prefix='pg_parallel_test_')
+    try:
+        schema_path = os.path.join(output_dir, 'schema.csv')
+        ddl_string_to_csv(DDL, schema_path)
+        csv = Csv(schema_path, output_dir=output_dir)
+
+        levels = FKHandler(csv.tables).get_table_generation_levels()
+        print(f"Generation levels: {levels}")
+
+        assert levels == [['MST_CURRENCY', 'MST_REGION'], ['MST_STORE'], ['TRN_SALE']]
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def _table(table_name, *referenced_tables):
+    columns = [Column('id', 'int', 'pk')]
+    columns += [Column(f'{name.lower()}_id', 'int', f'fk.{name}.id') for name in referenced_tables]
+    return Table({'table_name': table_name, 'columns': columns, 'foreign_keys': []})
+
+
+def test_generation_order_on_large_graphs():
+    tables = [_table('D', 'B', 'C'), _table('C', 'A'), _table('B', 'A'), _table('A'), _table('E', 'A', 'D')]
+    handler = FKHandler(tables)
+    assert handler.get_table_generation_order() == ['A', 'B', 'C', 'D', 'E']
+    assert handler.get_table_generation_levels() == [['A'], ['B', 'C'], ['D'], ['E']]
+    assert handler.get_referenced_columns('A') == ['id']
+
+    # A long chain is sorted in linear time
+    chain = [_table('T00000')] + [_table(f'T{i:05d}', f'T{i - 1:05d}') for i in range(1, 20000)]
+    levels = FKHandler(chain[::-1]).get_table_generation_levels()
+    assert len(levels) == 20000 and levels[-1] == ['T19999']
+
+    try:
+        FKHandler([_table('A', 'B'), _table('B', 'A'), _table('C')]).get_table_generation_order()
+    except Exception as e:
+        assert 'Circular dependency' in str(e) and "'A'" in str(e) and "'C'" not in str(e)
+    else:
+        raise AssertionError('Circular references should be rejected')
+
+
+def test_parallel_generation_keeps_fk_integrity():
+    print("=" * 60)
+    print("PARALLEL GENERATION TEST")
+    print("=" * 60)
+
+    output_dir = tempfile.mkdtemp(prefix='pg_parallel_test_')
+    try:
+        schema_path = os.path.join(output_dir, 'schema.csv')
+        ddl_string_to_csv(DDL, schema_path)
+
+        tables = generate_data(schema_path, row_count=30, output_dir=output_dir, chunk_size=7, jobs=2)
+        assert sorted(tables) == ['MST_CURRENCY', 'MST_REGION', 'MST_STORE', 'TRN_SALE']
+
+        def read(table_name):
+            return pd.read_csv(os.path.join(output_dir, f'{table_name}.csv'), dtype=str)
+
+        df_region = read('MST_REGION')
+        df_store = read('MST_STORE')
+        df_sale = read('TRN_SALE')
+
+        for df in (df_region, df_store, df_sale, read('MST_CURRENCY')):
+            assert df['id'].tolist() == [str(i) for i in range(1, 31)]
+
+        assert set(df_store['region_id']).issubset(set(df_region['id']))
+        assert set(df_sale['store_id']).issubset(set(df_store['id']))
+        assert set(df_sale['region_id']).issubset(set(df_region['id']))
+
+        print("✅ FK integrity holds with jobs=2")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    test_generation_levels()
+    test_generation_order_on_large_graphs()
+    test_parallel_generation_keeps_fk_integrity()
@@ -0,0 +1,87 @@
+from pg_data_generator.main import generate_parquet
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
+import pytest
+import os
+import shutil
+import tempfile
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+
+DDL = """
+CREATE TABLE MST_PARENT (
+    id INT PRIMARY KEY,
+    price DECIMAL(10,2),
+    is_active BOOLEAN,
+    memo VARCHAR(20),
+    trade_start DATE,
+    trade_end DATE,
+    created_at DATETIME
+);
+
+CREATE TABLE MST_CHILD (
+    id BIGINT PRIMARY KEY,
+    parent_id INT REFERENCES MST_PARENT(id),
+    amount SMALLINT
+);
+"""
+
+
+def _generate(**kwargs):
+    output_dir = tempfile.mkdtemp(prefix='pg_parquet_test_')
+    schema_path = os.path.join(output_dir, 'schema.csv')
+    ddl_string_to_csv(DDL, schema_path)
+    return output_dir, generate_parquet(schema_path, output_dir=output_dir, **kwargs)
+
+
+def test_parquet_columns_are_typed():
+    print("=" * 60)
+    print("PARQUET OUTPUT TEST")
+    print("=" * 60)
+
+    output_dir, tables = _generate(row_count=23, chunk_size=10, compression='zstd')
+    try:
+        assert sorted(tables) == ['MST_CHILD', 'MST_PARENT']
+
+        parent_file = pq.ParquetFile(os.path.join(output_dir, 'MST_PARENT.parquet'))
+        parent = parent_file.read()
+        assert parent.schema.field('id').type == pa.int32()
+        assert parent.schema.field('price').type == pa.decimal128(10, 2)
+        assert parent.schema.field('is_active').type == pa.bool_()
+        assert parent.schema.field('memo').type == pa.string()
+        assert parent.schema.field('trade_start').type == pa.date32()
+        assert parent.schema.field('created_at').type == pa.timestamp('us')
+        assert parent_file.metadata.row_group(0).column(0).compression == 'ZSTD'
+
+        # One row group per chunk
+        assert parent_file.num_row_groups == 3
+        assert parent.column('id').to_pylist() == list(range(1, 24))
+        assert all(start < end for start, end in zip(parent.column('trade_start').to_pylist(),
+                                                      parent.column('trade_end').to_pylist()))
+
+        child = pq.read_table(os.path.join(output_dir, 'MST_CHILD.parquet'))
+        assert child.schema.field('id').type == pa.int64()
+        assert child.schema.field('amount').type == pa.int16()
+        assert set(child.column('parent_id').to_pylist()).issubset(set(range(1, 24)))
+
+        print("✅ Parquet files carry the schema types")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_parquet_row_groups_and_shards():
+    output_dir, _ = _generate(row_count=40, chunk_size=10, row_group_size=4, shards=2, jobs=2)
+    try:
+        parent_file = pq.ParquetFile(os.path.join(output_dir, 'MST_PARENT.parquet'))
+        assert parent_file.num_row_groups == 12
+        assert parent_file.read().column('id').to_pylist() == list(range(1, 41))
+        assert not [name for name in os.listdir(output_dir) if '.part' in name]
+
+        print("✅ Sharded Parquet parts are merged in row order")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    test_parquet_columns_are_typed()
+    test_parquet_row_groups_and_shards()
@@ -0,0 +1,218 @@
+from pg_data_generator.main import generate_data_to_postgres
+from pg_data_generator.core.Sink import PostgresSink
+from pg_data_generator.core.TableBuilder import TableBuilder
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
+from functools import partial
+import os
+import shutil
+import tempfile
+import time
+import uuid
+
+DDL = """
+CREATE TABLE MST_PARENT (
+    id INT PRIMARY KEY,
+    price DECIMAL(10,2),
+    trade_start DATE,
+    trade_end DATE
+);
+
+CREATE TABLE MST_OTHER (
+    id INT PRIMARY KEY,
+    amount INT
+);
+
+CREATE TABLE MST_CHILD (
+    id INT PRIMARY KEY,
+    parent_id INT REFERENCES MST_PARENT(id),
+    other_id INT REFERENCES MST_OTHER(id)
+);
+"""
+
+
+class FakeCursor():
+    def __init__(self, connection):
+        self.connection = connection
+
+    def copy_expert(self, sql, file):
+        self.connection.pending.append((sql, file.read()))
+
+    def close(self):
+        pass
+
+
+class FakeConnection():
+    """
+    Stands in for a psycopg2 connection; committed COPYs are recorded as
+    files, and open connections as files in connection_dir.
+    """
+
+    def __init__(self, record_dir, connection_dir=None):
+        self.record_dir = record_dir
+        self.pending = []
+        self.closed = False
+        self.connection_path = None
+        if connection_dir is not None:
+            self.connection_path = os.path.join(connection_dir, f'{os.getpid()}-{uuid.uuid4().hex}')
+            open(self.connection_path, 'w').close()
+
+    def cursor(self):
+        return FakeCursor(self)
+
+    def commit(self):
+        for sql, data in self.pending:
+            with open(os.path.join(self.record_dir, uuid.uuid4().hex), 'w') as f:
+                f.write(f"{time.time_ns()} {os.getpid()}\n{sql}\n{data}")
+        self.pending = []
+
+    def rollback(self):
+        self.pending = []
+
+    def close(self):
+        self.closed = True
+        if self.connection_path is not None:
+            os.remove(self.connection_path)
+
+
+class FailingConnection(FakeConnection):
+    """FakeConnection whose COPYs into MST_BROKEN fail."""
+
+    def __init__(self, record_dir):
+        super().__init__(record_dir)
+        self.rolled_back = False
+
+    def cursor(self):
+        cursor = super().cursor()
+        copy_expert = cursor.copy_expert
+
+        def failing_copy_expert(sql, file):
+            if 'MST_BROKEN' in sql:
+                raise RuntimeError('relation "mst_broken" does not exist')
+            copy_expert(sql, file)
+
+        cursor.copy_expert = failing_copy_expert
+        return cursor
+
+    def rollback(self):
+        self.rolled_back = True
+        super().rollback()
+
+
+def _read_copies(record_dir):
+    copies = []
+    for name in os.listdir(record_dir):
+        with open(os.path.join(record_dir, name)) as f:
+            committed_at, _ = f.readline().split()
+            sql = f.readline().rstrip('\n')
+            rows = [line.split('\t') for line in f.read().splitlines()]
+        copies.append((int(committed_at), sql, rows))
+    return sorted(copies)
+
+
+def _load(jobs, chunk_size=None, shards=1):
+    work_dir = tempfile.mkdtemp(prefix='pg_load_test_')
+    record_dir = os.path.join(work_dir, 'copies')
+    connection_dir = os.path.join(work_dir, 'connections')
+    os.makedirs(record_dir)
+    os.makedirs(connection_dir)
+    schema_path = os.path.join(work_dir, 'schema.csv')
+    ddl_string_to_csv(DDL, schema_path)
+
+    cwd = os.getcwd()
+    os.chdir(work_dir)
+    try:
+        generate_data_to_postgres(schema_path, row_count=25, chunk_size=chunk_size, jobs=jobs, shards=shards,
+                                  connect=partial(FakeConnection, record_dir, connection_dir))
+        # Nothing but the recorded COPYs is written
+        assert sorted(os.listdir(work_dir)) == ['connections', 'copies', 'schema.csv']
+        # Every connection was closed, in workers too
+        assert os.listdir(connection_dir) == []
+        return _read_copies(record_dir)
+    finally:
+        os.chdir(cwd)
+        shutil.rmtree(work_dir)
+
+
+def _check_copies(copies):
+    rows_by_table = {}
+    committed_by_table = {}
+    for committed_at, sql, rows in copies:
+        table_name = sql.split()[1]
+        assert sql.endswith('FROM stdin')
+        rows_by_table.setdefault(table_name, []).extend(rows)
+        committed_by_table.setdefault(table_name, []).append(committed_at)
+
+    assert sorted(rows_by_table) == ['MST_CHILD', 'MST_OTHER', 'MST_PARENT']
+    for rows in rows_by_table.values():
+        assert sorted(int(row[0]) for row in rows) == list(range(1, 26))
+
+    # Children are only loaded once their parents are committed
+    assert max(committed_by_table['MST_PARENT']) < min(committed_by_table['MST_CHILD'])
+    assert max(committed_by_table['MST_OTHER']) < min(committed_by_table['MST_CHILD'])
+
+    parent_ids = {row[0] for row in rows_by_table['MST_PARENT']}
+    assert {row[1] for row in rows_by_table['MST_CHILD']}.issubset(parent_ids)
+
+
+def test_load_sequentially():
+    print("=" * 60)
+    print("POSTGRES SINK TEST")
+    print("=" * 60)
+
+    copies = _load(jobs=1, chunk_size=10)
+    _check_copies(copies)
+    # 25 rows in chunks of 10 per table
+    assert len(copies) == 9
+
+    print("✅ Tables are loaded with one COPY per chunk in FK order")
+
+
+def test_load_in_parallel():
+    copies = _load(jobs=2, shards=2)
+    _check_copies(copies)
+    assert len(copies) == 6
+
+    print("✅ Parallel load keeps FK order across levels")
+
+
+def test_each_process_loads_over_one_connection():
+    work_dir = tempfile.mkdtemp(prefix='pg_load_test_')
+    opened = []
+
+    def connect():
+        connection = FailingConnection(work_dir)
+        opened.append(connection)
+        return connection
+
+    try:
+        table_builder = TableBuilder(2)
+        table_builder.add_column('id', ['1', '2'])
+        sink = PostgresSink(connect=connect)
+        sink.write_table(table_builder, 'MST_PARENT', 'MST_PARENT')
+        sink.write_table(table_builder, 'MST_PARENT', 'MST_PARENT', append=True)
+        assert len(opened) == 1
+
+        # A failed COPY is rolled back and the connection kept
+        try:
+            sink.write_table(table_builder, 'MST_BROKEN', 'MST_BROKEN')
+        except RuntimeError:
+            pass
+        else:
+            assert False, 'the failed COPY was not raised'
+        assert opened[0].rolled_back
+        sink.write_table(table_builder, 'MST_PARENT', 'MST_PARENT', append=True)
+        assert len(opened) == 1
+        assert len(_read_copies(work_dir)) == 3
+
+        sink.close()
+        assert opened[0].closed
+    finally:
+        shutil.rmtree(work_dir)
+
+    print("✅ Chunks are loaded over one connection per process")
+
+
+if __name__ == '__main__':
+    test_load_sequentially()
+    test_load_in_parallel()
+    test_each_process_loads_over_one_connection()
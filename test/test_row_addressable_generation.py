@@ -0,0 +1,131 @@
+from pg_data_generator.core.DataGenerator import DataGenerator
+from pg_data_generator.main import generate_data, generate_rows
+import csv
+import filecmp
+import os
+import shutil
+import tempfile
+
+SCHEMA = """table_name,column,type,constraint,length,format
+MST_MEMBER,id,int,pk,,
+MST_MEMBER,member_id,varchar(12),,12,
+MST_MEMBER,member_name,varchar(50),,50,
+MST_MEMBER,gender,char(1),,1,"[m,f,]"
+MST_MEMBER,point,int,,5,
+MST_MEMBER,balance,"decimal(10,2)",,10,
+MST_MEMBER,memo,varchar(20),,20,
+MST_MEMBER,start_date,date,,,
+MST_MEMBER,end_date,date,,,
+MST_MEMBER,created_at,datetime,,,
+TRN_VISIT,id,int,pk,,
+TRN_VISIT,member_ref,int,fk.MST_MEMBER.id,,
+TRN_VISIT,member_code,varchar(12),fk.MST_MEMBER.member_id,12,
+TRN_VISIT,visited_at,datetime,,,
+"""
+
+ROW_COUNT = 9000
+
+
+def _read_rows(path):
+    with open(path, newline='') as f:
+        return list(csv.reader(f))[1:]
+
+
+def _values(rows):
+    return [list(row.values()) for row in rows]
+
+
+def test_rows_are_generated_from_their_index():
+    print("=" * 60)
+    print("ROW ADDRESSABLE GENERATION TEST")
+    print("=" * 60)
+
+    work_dir = tempfile.mkdtemp(prefix='pg_rows_test_')
+    try:
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        with open(schema_path, 'w') as f:
+            f.write(SCHEMA)
+
+        whole_dir = os.path.join(work_dir, 'whole')
+        chunked_dir = os.path.join(work_dir, 'chunked')
+        generate_data(schema_path, row_count=ROW_COUNT, output_dir=whole_dir, seed=11)
+        generate_data(schema_path, row_count=ROW_COUNT, output_dir=chunked_dir, seed=11, chunk_size=1000,
+                      shards=3, jobs=2)
+
+        # Chunks and shards no longer change any value
+        for file_name in ['MST_MEMBER.csv', 'TRN_VISIT.csv']:
+            assert filecmp.cmp(os.path.join(whole_dir, file_name), os.path.join(chunked_dir, file_name), shallow=False)
+
+        members = _read_rows(os.path.join(whole_dir, 'MST_MEMBER.csv'))
+        visits = _read_rows(os.path.join(whole_dir, 'TRN_VISIT.csv'))
+        for start, stop in [(0, 3), (4090, 4100), (8990, 9000)]:
+            assert _values(generate_rows(schema_path, 'MST_MEMBER', start, stop, ROW_COUNT, 11)) == members[start:stop]
+            assert _values(generate_rows(schema_path, 'TRN_VISIT', start, stop, ROW_COUNT, 11)) == visits[start:stop]
+
+        # Every value is the CSV text, whichever type generated it
+        rows = generate_rows(schema_path, 'TRN_VISIT', 4090, 4100, ROW_COUNT, 11)
+        assert all(isinstance(value, str) for row in rows for value in row.values())
+
+        rows = generate_rows(schema_path, 'TRN_VISIT', 5, 5, ROW_COUNT, 11)
+        assert rows == []
+
+        print("✅ Any row range matches the full dataset")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_rows_of_a_huge_table_reference_existing_parents():
+    work_dir = tempfile.mkdtemp(prefix='pg_rows_test_')
+    try:
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        with open(schema_path, 'w') as f:
+            f.write(SCHEMA)
+
+        # A billion rows per table; only the blocks around the rows are generated
+        row_count = 10 ** 9
+        start = 500_000_000
+        visits = generate_rows(schema_path, 'TRN_VISIT', start, start + 5, row_count, 7)
+        assert [row['id'] for row in visits] == [str(start + i) for i in range(1, 6)]
+
+        for visit in visits:
+            assert 1 <= int(visit['member_ref']) <= row_count
+            # member_id is the sequence 10^11 + row, so the parent row is known
+            parent_row = int(visit['member_code']) - 10 ** 11
+            parent = generate_rows(schema_path, 'MST_MEMBER', parent_row, parent_row + 1, row_count, 7)[0]
+            assert parent['member_id'] == visit['member_code']
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_rows_look_up_only_the_parent_rows_they_reference():
+    work_dir = tempfile.mkdtemp(prefix='pg_rows_test_')
+    generate_column_block = DataGenerator._generate_column_block
+    generated_blocks = list()
+
+    def counting_generate_column_block(self, table_name, column_plan, block_index, total, *args):
+        generated_blocks.append((table_name, column_plan.column_name, block_index))
+        return generate_column_block(self, table_name, column_plan, block_index, total, *args)
+
+    try:
+        schema_path = os.path.join(work_dir, 'schema.csv')
+        with open(schema_path, 'w') as f:
+            f.write(SCHEMA)
+
+        DataGenerator._generate_column_block = counting_generate_column_block
+        start = 500_000_000
+        visits = generate_rows(schema_path, 'TRN_VISIT', start, start + 10, 10 ** 9, 7)
+        assert len(visits) == 10
+
+        # member_code is not a PK, so each of the 10 rows generates at most
+        # one parent block, not one per FK draw of the whole block
+        parent_blocks = [block for block in generated_blocks if block[0] == 'MST_MEMBER']
+        assert 1 <= len(parent_blocks) <= 10
+    finally:
+        DataGenerator._generate_column_block = generate_column_block
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    test_rows_are_generated_from_their_index()
+    test_rows_of_a_huge_table_reference_existing_parents()
+    test_rows_look_up_only_the_parent_rows_they_reference()
@@ -0,0 +1,74 @@
+from pg_data_generator.core.Csv import Csv
+from pg_data_generator.metadata.Column import Column
+import csv
+import os
+import pickle
+import shutil
+import tempfile
+
+
+def _write_schema(path, rows):
+    with open(path, 'w', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(['table_name', 'column', 'type', 'constraint', 'length', 'format', 'comment'])
+        writer.writerows(rows)
+
+
+def test_schema_is_loaded_into_indexed_tables():
+    print("=" * 60)
+    print("SCHEMA LOADING TEST")
+    print("=" * 60)
+
+    output_dir = tempfile.mkdtemp(prefix='pg_schema_test_')
+    try:
+        schema_path = os.path.join(output_dir, 'schema.csv')
+        _write_schema(schema_path, [
+            ['MST_PARENT', 'id', 'int', 'pk', '', '', 'parent key'],
+            ['MST_CHILD', 'id', 'int', 'pk', '', '', ''],
+            ['MST_CHILD', 'parent_id', 'int', 'fk.MST_PARENT.id', '', '', ''],
+            ['MST_PARENT', 'status', 'varchar(1)', '', '1', '[A,B]', ''],
+        ])
+        schema = Csv(schema_path, output_dir=output_dir)
+
+        assert schema.table_names == ['MST_PARENT', 'MST_CHILD']
+        parent = schema.table_dict['MST_PARENT']
+        assert [column['column'] for column in parent.columns] == ['id', 'status']
+
+        status = parent.columns[1]
+        assert isinstance(status, Column)
+        assert status['format'] == '[A,B]' and status.get('length') == '1'
+        assert status.get('missing', '') == '' and 'comment' in status
+        assert parent.columns[0]['comment'] == 'parent key'
+        assert status == {'column': 'status', 'type': 'varchar(1)', 'constraint': '',
+                          'length': '1', 'format': '[A,B]', 'comment': ''}
+        assert pickle.loads(pickle.dumps(status)) == status
+
+        # Columns are shared, not copied on every access
+        assert parent.columns is parent.columns
+        assert schema.table_dict['MST_CHILD'].foreign_keys == [
+            {'column': 'parent_id', 'constraint': 'fk.MST_PARENT.id'}
+        ]
+
+        print("✅ Schema loaded in one pass")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_missing_fk_table_is_rejected():
+    output_dir = tempfile.mkdtemp(prefix='pg_schema_test_')
+    try:
+        schema_path = os.path.join(output_dir, 'schema.csv')
+        _write_schema(schema_path, [['MST_CHILD', 'parent_id', 'int', 'fk.MST_PARENT.id', '', '', '']])
+        try:
+            Csv(schema_path, output_dir=output_dir)
+        except Exception as e:
+            assert 'fk table' in str(e)
+        else:
+            raise AssertionError('A missing FK table should be rejected')
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    test_schema_is_loaded_into_indexed_tables()
+    test_missing_fk_table_is_rejected()
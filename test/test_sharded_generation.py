@@ -0,0 +1,112 @@
+from pg_data_generator.main import generate_data
+from pg_data_generator.core.Csv import Csv
+from pg_data_generator.core.DataGenerator import DataGenerator
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
+import pandas as pd
+import glob
+import os
+import shutil
+import tempfile
+
+DDL = """
+CREATE TABLE MST_MEMBER (
+    id INT PRIMARY KEY,
+    member_id VARCHAR(6),
+    email VARCHAR(50),
+    phone_number VARCHAR(20),
+    post_code VARCHAR(5)
+);
+
+CREATE TABLE TRN_VISIT (
+    id INT PRIMARY KEY,
+    member_ref INT REFERENCES MST_MEMBER(id),
+    visited_at DATETIME
+);
+"""
+
+
+def _make_output_dir():
+    output_dir = tempfile.mkdtemp(prefix='pg_shard_test_')
+    schema_path = os.path.join(output_dir, 'schema.csv')
+    ddl_string_to_csv(DDL, schema_path)
+    return output_dir, schema_path
+
+
+def test_sharded_generation_is_globally_unique():
+    print("=" * 60)
+    print("SHARDED GENERATION TEST")
+    print("=" * 60)
+
+    output_dir, schema_path = _make_output_dir()
+    try:
+        generate_data(schema_path, row_count=25, output_dir=output_dir, chunk_size=4, jobs=2, shards=3)
+
+        df_member = pd.read_csv(os.path.join(output_dir, 'MST_MEMBER.csv'), dtype=str)
+        df_visit = pd.read_csv(os.path.join(output_dir, 'TRN_VISIT.csv'), dtype=str)
+
+        # Shards are concatenated in row order and their part files removed
+        assert not glob.glob(os.path.join(output_dir, '*.part*'))
+        assert df_member['id'].tolist() == [str(i) for i in range(1, 26)]
+        assert df_member['member_id'].tolist() == [str(100000 + i) for i in range(25)]
+
+        for column in ['email', 'phone_number', 'post_code']:
+            assert df_member[column].is_unique, f'{column} is not unique across shards'
+
+        assert set(df_visit['member_ref']).issubset(set(df_member['id']))
+
+        print("✅ Shards produce disjoint keys and unique values")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_sharded_generation_part_files():
+    output_dir, schema_path = _make_output_dir()
+    try:
+        generate_data(schema_path, row_count=25, output_dir=output_dir, shards=3, part_files=True)
+
+        part_paths = sorted(glob.glob(os.path.join(output_dir, 'MST_MEMBER.part*.csv')))
+        assert len(part_paths) == 3
+
+        df_member = pd.concat([pd.read_csv(path, dtype=str) for path in part_paths])
+        assert df_member['id'].tolist() == [str(i) for i in range(1, 26)]
+
+        print(f"✅ Wrote {len(part_paths)} part files")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_pk_keys_are_range_backed():
+    output_dir, schema_path = _make_output_dir()
+    try:
+        dg = DataGenerator(Csv(schema_path, output_dir=output_dir))
+        dg.make_csv_for_tables(25, chunk_size=4, jobs=2, shards=3)
+
+        # The parent PK is referenced by its row count only
+        assert dg.fk_handler.generated_data[('MST_MEMBER', 'id')] == range(1, 26)
+
+        df_visit = pd.read_csv(os.path.join(output_dir, 'TRN_VISIT.csv'), usecols=['member_ref'])
+        assert df_visit['member_ref'].between(1, 25).all()
+
+        print("✅ PK references are drawn from the key range")
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_unique_capacity_is_checked_up_front():
+    output_dir, schema_path = _make_output_dir()
+    try:
+        generate_data(schema_path, row_count=100000, output_dir=output_dir, chunk_size=1000)
+    except Exception as e:
+        assert 'unique values' in str(e)
+        print(f"✅ Rejected: {e}")
+    else:
+        raise AssertionError('post codes beyond the value space should be rejected')
+    finally:
+        shutil.rmtree(output_dir)
+
+
+if __name__ == '__main__':
+    test_sharded_generation_is_globally_unique()
+    test_sharded_generation_part_files()
+    test_pk_keys_are_range_backed()
+    test_unique_capacity_is_checked_up_front()
@@ -0,0 +1,137 @@
+from pg_data_generator.core.Sink import DmlSink
+from pg_data_generator.main import ddl_to_dml
+import filecmp
+import os
+import re
+import shutil
+import tempfile
+
+DDL = """
+CREATE TABLE MST_PARENT (
+    id INT PRIMARY KEY,
+    parent_name VARCHAR(50),
+    trade_start DATE,
+    trade_end DATE
+);
+
+CREATE TABLE MST_CHILD (
+    id INT PRIMARY KEY,
+    parent_id INT REFERENCES MST_PARENT(id),
+    amount INT
+);
+"""
+
+
+def test_streaming_ddl_to_dml_writes_no_intermediate_files():
+    print("=" * 60)
+    print("STREAMING DDL TO DML TEST")
+    print("=" * 60)
+
+    work_dir = tempfile.mkdtemp(prefix='pg_stream_test_')
+    ddl_path = os.path.join(work_dir, 'schema.sql')
+    output_dir = os.path.join(work_dir, 'dml')
+    with open(ddl_path, 'w') as f:
+        f.write(DDL)
+
+    try:
+        result = ddl_to_dml(ddl_path, output_dir, row_count=12, batch_size=5, streaming=True)
+
+        # Only the SQL files are written
+        assert sorted(os.listdir(output_dir)) == ['mst_child.sql', 'mst_parent.sql']
+        assert sorted(result['dml_files']) == sorted(os.path.join(output_dir, f) for f in os.listdir(output_dir))
+        assert sorted(os.listdir(work_dir)) == ['dml', 'schema.sql']
+
+        with open(os.path.join(output_dir, 'mst_parent.sql')) as f:
+            parent_sql = f.read()
+        with open(os.path.join(output_dir, 'mst_child.sql')) as f:
+            child_sql = f.read()
+
+        # 12 rows in batches of 5
+        assert parent_sql.startswith('-- INSERT statements for MST_PARENT')
+        assert parent_sql.count('INSERT INTO') == 3
+
+        # Integer columns stay unquoted, FK values point at generated parents
+        parent_ids = set(re.findall(r"^    \((\d+), ", parent_sql, re.M))
+        child_rows = re.findall(r"\((\d+), (\d+), (-?\d+)\)", child_sql)
+        assert len(parent_ids) == 12
+        assert len(child_rows) == 12
+        assert {parent_id for _, parent_id, _ in child_rows}.issubset(parent_ids)
+
+        print("✅ Streaming DDL to DML writes only SQL files")
+    finally:
+        shutil.rmtree(work_dir)
+
+
+def test_streaming_ddl_to_dml_in_chunks():
+    work_dir = tempfile.mkdtemp(prefix='pg_stream_test_')
+    ddl_path = os.path.join(work_dir, 'schema.sql')
+    with open(ddl_path, 'w') as f:
+        f.write(DDL)
+
+    write_table = DmlSink.write_table
+    chunk_rows = []
+
+    def recording_write_table(self, table_builder, *args, **kwargs):
+        chunk_rows.append(table_builder.row_count)
+        return write_table(self, table_builder, *args, **kwargs)
+
+    try:
+        whole_dir = os.path.join(work_dir, 'whole')
+        ddl_to_dml(ddl_path, whole_dir, row_count=250, batch_size=40, streaming=True, seed=9)
+
+        DmlSink.write_table = recording_write_table
+        chunked_dir = os.path.join(work_dir, 'chunked')
+        ddl_to_dml(ddl_path, chunked_dir, row_count=250, batch_size=40, streaming=True, seed=9, chunk_size=60)
+
+        # Each table is built 60 rows at a time
+        assert chunk_rows == [60, 60, 60, 60, 10] * 2
+
+        # COPY output does not depend on where chunks end
+        for output_format in ['copy_text', 'copy_binary']:
+            paths = [
+                ddl_to_dml(ddl_path, os.path.join(work_dir, f'{output_format}_{chunk_size}'), row_count=250,
+                           streaming=True, output_format=output_format, seed=9, chunk_size=chunk_size)['dml_files']
+                for chunk_size in [None, 60]
+            ]
+            for whole_path, chunked_path in zip(*paths):
+                assert filecmp.cmp(whole_path, chunked_path, shallow=False)
+
+        with open(os.path.join(chunked_dir, 'mst_child.sql')) as f:
+            assert len(re.findall(r"\((\d+), (\d+), (-?\d+)\)", f.read())) == 250
+    finally:
+        DmlSink.write_table = write_table
+        shutil.rmtree(work_dir)
+
+
+def test_tables_named_alike_get_their_own_files():
+    work_dir = tempfile.mkdtemp(prefix='pg_stream_test_')
+    ddl_path = os.path.join(work_dir, 'schema.sql')
+    with open(ddl_path, 'w') as f:
+        f.write('CREATE TABLE "UserRole" (id INT PRIMARY KEY, role_name VARCHAR(20));\n'
+                'CREATE TABLE user_role (id INT PRIMARY KEY, amount INT);\n')
+
+    try:
+        output_dir = os.path.join(work_dir, 'dml')
+        result = ddl_to_dml(ddl_path, output_dir, row_count=5, streaming=True)
+
+        # Both names snake-case to user_role; neither file overwrites the other
+        assert sorted(os.listdir(output_dir)) == ['user_role.sql', 'user_role1.sql']
+        assert sorted(result['dml_files']) == sorted(os.path.join(output_dir, f) for f in os.listdir(output_dir))
+        headers = set()
+        for path in result['dml_files']:
+            with open(path) as f:
+                headers.add(f.readline().strip())
+        assert headers == {'-- INSERT statements for UserRole', '-- INSERT statements for user_role'}
+
+        # A re-run overwrites the files, as csv_folder_to_dml does
+        rerun = ddl_to_dml(ddl_path, output_dir, row_count=5, streaming=True)
+        assert sorted(os.listdir(output_dir)) == ['user_role.sql', 'user_role1.sql']
+        assert sorted(rerun['dml_files']) == sorted(result['dml_files'])
+    finally:
+        shutil.rmtree(work_dir)
+
+
+if __name__ == '__main__':
+    test_streaming_ddl_to_dml_writes_no_intermediate_files()
+    test_streaming_ddl_to_dml_in_chunks()
+    test_tables_named_alike_get_their_own_files()
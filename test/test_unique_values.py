@@ -0,0 +1,93 @@
+from pg_data_generator.cases.PhoneNumber import PhoneNumber
+from pg_data_generator.core.Csv import Csv
+from pg_data_generator.core.DataGenerator import DataGenerator
+from pg_data_generator.utils.ddl_converter import ddl_string_to_csv
+from pg_data_generator.utils.permutation import Permutation
+from concurrent.futures import ThreadPoolExecutor
+import pandas as pd
+import os
+import shutil
+import tempfile
+
+DDL = """
+CREATE TABLE MST_MEMBER (
+    id INT PRIMARY KEY,
+    email VARCHAR(50),
+    phone_number VARCHAR(20),
+    post_code VARCHAR(5)
+);
+"""
+
+
+def _generate(row_count, seed, **kwargs):
+    output_dir = tempfile.mkdtemp(prefix='pg_unique_test_')
+    schema_path = os.path.join(output_dir, 'schema.csv')
+    ddl_string_to_csv(DDL, schema_path)
+
+    try:
+        DataGenerator(Csv(schema_path, output_dir=output_dir), seed=seed).make_csv_for_tables(row_count, **kwargs)
+        return pd.read_csv(os.path.join(output_dir, 'MST_MEMBER.csv'), dtype=str)
+    finally:
+        shutil.rmtree(output_dir)
+
+
+def test_permutation_is_a_bijection():
+    print("=" * 60)
+    print("UNIQUE VALUE ENGINE TEST")
+    print("=" * 60)
+
+    for size in [1, 2, 3, 10, 1000, 99900]:
+        values = Permutation(size, ('key', size)).permute(range(size))
+        assert sorted(values) == list(range(size)), size
+
+    assert Permutation(1000, 'a').permute(range(1000)) == Permutation(1000, 'a').permute(range(1000))
+    assert Permutation(1000, 'a').permute(range(1000)) != Permutation(1000, 'b').permute(range(1000))
+
+    print("✅ Permutations are keyed bijections")
+
+
+def test_unique_values_depend_only_on_seed_and_row():
+    df_single = _generate(40, seed=7)
+    df_sharded = _generate(40, seed=7, chunk_size=6, jobs=2, shards=3)
+    df_other = _generate(40, seed=8)
+
+    for column in ['email', 'phone_number', 'post_code']:
+        assert df_single[column].is_unique
+        assert df_single[column].tolist() == df_sharded[column].tolist()
+        assert df_single[column].tolist() != df_other[column].tolist()
+
+    print("✅ Unique values are reproducible and independent of sharding")
+
+
+def test_generators_in_threads_keep_their_own_keys():
+    # The permutation key belongs to each column, not to shared state:
+    # generating another table in between does not change it
+    column = {'column': 'phone_number', 'type': 'varchar(20)', 'constraint': '', 'length': '20', 'format': ''}
+    case = PhoneNumber(20, column, unique_key=(3, 'MST_MEMBER'))
+    _generate(20, seed=4)
+    assert case.make_column() == PhoneNumber(20, column, unique_key=(3, 'MST_MEMBER')).make_column()
+    assert case.make_column() != PhoneNumber(20, column, unique_key=(4, 'MST_MEMBER')).make_column()
+
+    seeds = [11, 12, 13, 14]
+    serial = [_generate(2000, seed=seed, chunk_size=50) for seed in seeds]
+    with ThreadPoolExecutor(max_workers=len(seeds)) as executor:
+        threaded = list(executor.map(lambda seed: _generate(2000, seed=seed, chunk_size=50), seeds))
+
+    for df_serial, df_threaded in zip(serial, threaded):
+        assert df_serial.equals(df_threaded)
+
+
+def test_whole_value_space_is_usable():
+    df_member = _generate(99900, seed=1, chunk_size=10000)
+
+    # Every post code is handed out exactly once, without retries
+    assert sorted(df_member['post_code'].astype(int)) == list(range(100, 100000))
+
+    print("✅ The full post code space is generated")
+
+
+if __name__ == '__main__':
+    test_permutation_is_a_bijection()
+    test_unique_values_depend_only_on_seed_and_row()
+    test_generators_in_threads_keep_their_own_keys()
+    test_whole_value_space_is_usable()
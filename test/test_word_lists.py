@@ -0,0 +1,64 @@
+from pg_data_generator.cases.Address import Address
+from pg_data_generator.cases.Email import Email
+from pg_data_generator.cases.Name import Name
+from pg_data_generator.utils import word_lists
+from pg_data_generator.utils.word_lists import get_word_list, preload_word_lists, register_word_list
+
+
+def _column(column):
+    return {'column': column, 'type': 'varchar(100)', 'constraint': '', 'length': '100', 'format': ''}
+
+
+def test_word_lists_are_loaded_once():
+    print("=" * 60)
+    print("WORD LIST CACHE TEST")
+    print("=" * 60)
+
+    loads = []
+
+    def load():
+        loads.append(1)
+        return ['alpha', 'beta']
+
+    register_word_list('test_words', load)
+    assert list(get_word_list('test_words')) == ['alpha', 'beta']
+    assert get_word_list('test_words') is get_word_list('test_words')
+    assert len(loads) == 1
+
+    # Every email column of the process shares the usernames
+    preload_word_lists()
+    usernames = get_word_list('usernames')
+    for column in ['email', 'contact_email', 'billing_email']:
+        Email(5, _column(column)).make_column()
+    assert get_word_list('usernames') is usernames
+
+    word_lists._loaders.pop('test_words')
+    word_lists._word_lists.pop('test_words')
+
+    print("✅ Word lists are loaded once per process")
+
+
+def test_word_list_columns():
+    names = Name(50, _column('customer_name')).make_column()
+    assert len(names) == 50
+    for name in names:
+        first_name, last_name = str(name).split(' ')
+        assert first_name in Name.FIRST_NAMES and last_name in Name.LAST_NAMES
+
+    addresses = Address(50, _column('address')).make_column()
+    for address in addresses:
+        street, city, state_zip = str(address).split(', ')
+        assert street.split(' ', 1)[1] in Address.STREET_NAMES
+        assert city in Address.CITIES
+        assert state_zip.split(' ')[0] in Address.STATES
+
+    emails = [str(email) for email in Email(50, _column('email')).make_column()]
+    assert len(set(emails)) == 50
+    assert all(email.endswith('@gmail.com') for email in emails)
+
+    print("✅ Names, addresses and emails are drawn from the word lists")
+
+
+if __name__ == '__main__':
+    test_word_lists_are_loaded_once()
+    test_word_list_columns()